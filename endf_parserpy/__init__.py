@@ -1,4 +1,4 @@
-from .endf_parser_base import EndfParserBase
+from .endf_parser_base import EndfParserBase, SectionDiagnostic
 from .endf_parser_factory import EndfParserFactory
 from .interpreter import (
     EndfParserPy,
@@ -23,6 +23,7 @@ from .utils.user_tools import (
 )
 from .utils.endf6_plumbing import update_directory
 from .utils.math_utils import EndfFloat
+from .utils.matrices import EndfMatrix
 from .errors import EndfParserpyError
 from .tape import (
     parse_tape,
@@ -45,6 +46,7 @@ __version__ = "0.17.0"
 
 __all__ = (
     "EndfParserBase",
+    "SectionDiagnostic",
     "EndfParserFactory",
     "EndfParserPy",
     "EndfParserCpp",
@@ -52,6 +54,7 @@ __all__ = (
     "EndfPath",
     "EndfVariable",
     "EndfFloat",
+    "EndfMatrix",
     "compare_objects",
     "list_parsed_sections",
     "list_unparsed_sections",
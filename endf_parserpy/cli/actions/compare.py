@@ -3,21 +3,25 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/10/06
-# Last modified:   2026/05/18
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import io
 from ..cmd_utils import (
     add_common_cmd_parser_args,
+    add_jobs_arg,
     get_endf_parser,
     open_endf_file,
-    parsed_material_dict,
+    section_spec,
 )
 import sys
-from endf_parserpy import compare_objects
+from endf_parserpy.utils.debugging_utils import _compare_objects
 
 
 COMMAND_NAME = "compare"
@@ -26,12 +30,26 @@ COMMAND_NAME = "compare"
 def add_subparser(subparsers):
     parser_compare = subparsers.add_parser(COMMAND_NAME)
     add_common_cmd_parser_args(parser_compare)
+    add_jobs_arg(parser_compare)
     parser_compare.add_argument(
         "--atol", type=float, default=1e-8, help="absolute tolerance"
     )
     parser_compare.add_argument(
         "--rtol", type=float, default=1e-6, help="relative tolerance"
     )
+    parser_compare.add_argument(
+        "--include",
+        type=section_spec,
+        action="append",
+        default=None,
+        help="MF or MF/MT section to compare, can be given several times "
+        "(default: all sections)",
+    )
+    parser_compare.add_argument(
+        "--quick",
+        action="store_true",
+        help="stop at the first difference",
+    )
     parser_compare.add_argument("files", nargs=2, help="files for comparison")
 
 
@@ -41,7 +59,16 @@ def perform_action(args):
     files = args["files"]
     atol = args["atol"]
     rtol = args["rtol"]
-    retcode = _compare_endf_files(parser, files, atol=atol, rtol=rtol)
+    include = args.get("include")
+    retcode = _compare_endf_files(
+        parser,
+        files,
+        atol=atol,
+        rtol=rtol,
+        include=include,
+        quick=args.get("quick", False),
+        jobs=args.get("jobs", 1),
+    )
     sys.exit(retcode)
 
 
@@ -86,39 +113,195 @@ def _open(file, parser):
         sys.exit(2)
 
 
-def _compare_endf_files(parser, files, atol, rtol):
+def _read_material_bytes(endf_file, path, position):
+    entry = endf_file.index[position]
+    with open(path, "rb") as fh:
+        fh.seek(entry.byte_offset)
+        return entry, fh.read(entry.byte_length)
+
+
+def _section_bytes(entry, data, mf, mt):
+    sec_entry = entry.sections[mf, mt]
+    start = sec_entry.offset - entry.byte_offset
+    return data[start : start + sec_entry.length]
+
+
+def _selected_sections(material, include):
+    """Return ``{MF: set of MT}`` with the sections of ``material`` to compare."""
+    sections = defaultdict(set)
+    for mf, mt in material.sections():
+        if include is None or mf in include or (mf, mt) in include:
+            sections[mf].add(mt)
+    return sections
+
+
+def _compare_material_pair(endf_file1, endf_file2, pos1, pos2, opts):
+    """Compare two materials section by section and print the differences.
+
+    The MF/MT sections are compared one pair at a time, so at most one
+    section of each material is held in parsed form. Sections with
+    identical bytes in both files are taken as equal without parsing
+    them. The differences are printed in the same way and order as
+    :func:`~endf_parserpy.compare_objects` applied to the complete
+    material dictionaries would print them. With ``opts["quick"]``,
+    the comparison stops at the first difference. Returns ``True``
+    if the materials are equal.
+    """
+    path1, path2 = opts["files"]
+    entry1, data1 = _read_material_bytes(endf_file1, path1, pos1)
+    entry2, data2 = _read_material_bytes(endf_file2, path2, pos2)
+    if data1 == data2:
+        return True
+    material1 = endf_file1[pos1]
+    material2 = endf_file2[pos2]
+    sections1 = _selected_sections(material1, opts["include"])
+    sections2 = _selected_sections(material2, opts["include"])
+    quick = opts["quick"]
+    found_diff = False
+
+    def report(msg):
+        nonlocal found_diff
+        found_diff = True
+        print(msg)
+        return quick
+
+    only_in_1 = set(sections1).difference(sections2)
+    if only_in_1 and report(f"at path : only obj1 contains {only_in_1}"):
+        return False
+    only_in_2 = set(sections2).difference(sections1)
+    if only_in_2 and report(f"at path : only obj2 contains {only_in_2}"):
+        return False
+    for mf in sorted(set(sections1).intersection(sections2)):
+        mts1 = sections1[mf]
+        mts2 = sections2[mf]
+        only_in_1 = mts1.difference(mts2)
+        if only_in_1 and report(f"at path /{mf}: only obj1 contains {only_in_1}"):
+            return False
+        only_in_2 = mts2.difference(mts1)
+        if only_in_2 and report(f"at path /{mf}: only obj2 contains {only_in_2}"):
+            return False
+        for mt in sorted(mts1.intersection(mts2)):
+            raw1 = _section_bytes(entry1, data1, mf, mt)
+            raw2 = _section_bytes(entry2, data2, mf, mt)
+            if raw1 == raw2:
+                continue
+            try:
+                is_equal = _compare_objects(
+                    material1[mf, mt].detach(),
+                    material2[mf, mt].detach(),
+                    f"/{mf}/{mt}",
+                    atol=opts["atol"],
+                    rtol=opts["rtol"],
+                    fail_on_diff=quick,
+                )
+            except (TypeError, IndexError, ValueError) as exc:
+                report(str(exc))
+                return False
+            found_diff = found_diff or not is_equal
+    return not found_diff
+
+
+def _compare_pair_captured(endf_file1, endf_file2, pos1, pos2, opts):
+    """Run :func:`_compare_material_pair` and return its output and result."""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        if opts["annotate"]:
+            material1 = endf_file1[pos1]
+            material2 = endf_file2[pos2]
+            print(
+                f"=== comparing #{material1.position} (MAT {material1.mat}) "
+                f"<-> #{material2.position} (MAT {material2.mat}) ==="
+            )
+        is_equal = _compare_material_pair(endf_file1, endf_file2, pos1, pos2, opts)
+    return output.getvalue(), is_equal
+
+
+# the files of a pool worker, set by _init_worker
+_worker_files = None
+
+
+def _init_worker(endf_file1, endf_file2):
+    global _worker_files
+    _worker_files = (endf_file1, endf_file2)
+
+
+def _compare_task(pos1, pos2, opts):
+    return _compare_pair_captured(*_worker_files, pos1, pos2, opts)
+
+
+def _iter_results(endf_file1, endf_file2, pairs, opts, jobs):
+    """Yield the output and result of each material pair in order."""
+    if jobs == 1:
+        for pos1, pos2 in pairs:
+            yield _compare_pair_captured(endf_file1, endf_file2, pos1, pos2, opts)
+        return
+    executor = ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(endf_file1, endf_file2),
+    )
+    futures = []
+    try:
+        futures.extend(executor.submit(_compare_task, *p, opts) for p in pairs)
+        for future in futures:
+            yield future.result()
+    finally:
+        # with --quick, the pairs not started yet are dropped
+        # (shutdown(cancel_futures=True) requires Python 3.9)
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _compare_endf_files(parser, files, atol, rtol, include=None, quick=False, jobs=1):
+    """Compare the materials of two files and print the differences.
+
+    The materials are paired by :func:`_pair_materials` and compared
+    section by section; with ``jobs > 1``, the pairs are distributed
+    over a pool of processes, and the output is printed in the order
+    of the pairs in any case. With ``quick=True``, the comparison
+    stops at the first difference, and unpaired materials, which need
+    no parsing to be found, are reported before anything is compared.
+    """
     endf_file1 = _open(files[0], parser)
     endf_file2 = _open(files[1], parser)
     pairs, unpaired1, unpaired2 = _pair_materials(endf_file1, endf_file2)
-    # A plain single-vs-single comparison prints just the field diff, as
-    # the pre-multi-material CLI did; a header is only added once more
-    # than one material is in play.
-    annotate = len(endf_file1) > 1 or len(endf_file2) > 1
-    all_equal = True
-    for material1, material2 in pairs:
-        if annotate:
+
+    def report_unpaired():
+        for material in unpaired1:
             print(
-                f"=== comparing #{material1.position} (MAT {material1.mat}) "
-                f"<-> #{material2.position} (MAT {material2.mat}) ==="
+                f"unpaired: #{material.position} (MAT {material.mat}) "
+                f"only in {files[0]}"
+            )
+        for material in unpaired2:
+            print(
+                f"unpaired: #{material.position} (MAT {material.mat}) "
+                f"only in {files[1]}"
             )
-        is_equal = compare_objects(
-            parsed_material_dict(material1),
-            parsed_material_dict(material2),
-            atol=atol,
-            rtol=rtol,
-            fail_on_diff=False,
-        )
-        if not is_equal:
-            all_equal = False
-    for material in unpaired1:
-        print(
-            f"unpaired: #{material.position} (MAT {material.mat}) "
-            f"only in {files[0]}"
-        )
-    for material in unpaired2:
-        print(
-            f"unpaired: #{material.position} (MAT {material.mat}) "
-            f"only in {files[1]}"
-        )
+
+    if quick and (unpaired1 or unpaired2):
+        report_unpaired()
+        return 1
+    opts = {
+        "files": tuple(files),
+        "atol": atol,
+        "rtol": rtol,
+        "include": None if include is None else set(include),
+        "quick": quick,
+        # A plain single-vs-single comparison prints just the field diff, as
+        # the pre-multi-material CLI did; a header is only added once more
+        # than one material is in play.
+        "annotate": len(endf_file1) > 1 or len(endf_file2) > 1,
+    }
+    positions = [(m1.position, m2.position) for m1, m2 in pairs]
+    all_equal = True
+    for output, is_equal in _iter_results(
+        endf_file1, endf_file2, positions, opts, jobs
+    ):
+        print(output, end="")
+        all_equal = all_equal and is_equal
+        if quick and not is_equal:
+            return 1
+    report_unpaired()
     is_equal = all_equal and not unpaired1 and not unpaired2
     return 0 if is_equal else 1
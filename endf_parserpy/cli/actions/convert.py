@@ -3,21 +3,25 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2025/03/24
-# Last modified:   2026/05/17
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2025-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
 import sys
-import json
 from pathlib import Path
 from ..cmd_utils import (
     add_common_cmd_parser_args,
     get_endf_parser,
 )
-from endf_parserpy import parse_tape_file, write_tape_file
-from endf_parserpy.utils.user_tools import sanitize_fieldname_types
+from endf_parserpy import iter_parse_tape_file, write_tape_file
+from endf_parserpy.tape import iter_json_tape_file, write_json_tape_file
+from endf_parserpy.tape.columnar import (
+    is_npz_tape_file,
+    iter_npz_tape_file,
+    write_npz_tape_file,
+)
 
 
 COMMAND_NAME = "convert"
@@ -26,7 +30,7 @@ COMMAND_NAME = "convert"
 def add_subparser(subparsers):
     parser_convert = subparsers.add_parser(COMMAND_NAME)
     add_common_cmd_parser_args(parser_convert)
-    formats = ["endf", "json"]
+    formats = ["endf", "json", "jsonl", "npz"]
     parser_convert.add_argument(
         "sourcefile", type=str, help="file that should be converted"
     )
@@ -37,7 +41,14 @@ def add_subparser(subparsers):
         "--indent", type=int, nargs="?", help="Indent used for JSON output formatting"
     )
     parser_convert.add_argument(
-        "--to", type=str, choices=formats, required=True, help="Destination file format"
+        "--to",
+        type=str,
+        choices=formats,
+        required=True,
+        help=(
+            "Destination file format (jsonl: JSON Lines, one material per "
+            "line; npz: NumPy arrays with JSON metadata)"
+        ),
     )
 
 
@@ -56,32 +67,51 @@ def perform_action(args):
     if destfile.is_file():
         print(f"The destination file {destfile} already exists. Aborting.")
         sys.exit(1)
-    if dest_format == "endf":
-        retcode = _convert_to_endf(parser, sourcefile, destfile)
-    elif dest_format == "json":
-        retcode = _convert_to_json(parser, sourcefile, destfile, json_dump_kwargs)
+    if dest_format == "jsonl" and args["indent"] is not None:
+        print("--indent cannot be used with --to jsonl")
+        sys.exit(1)
+    try:
+        if dest_format == "endf":
+            retcode = _convert_to_endf(parser, sourcefile, destfile)
+        elif dest_format == "json":
+            retcode = _convert_to_json(parser, sourcefile, destfile, json_dump_kwargs)
+        elif dest_format == "jsonl":
+            retcode = _convert_to_json(parser, sourcefile, destfile, {"lines": True})
+        elif dest_format == "npz":
+            retcode = _convert_to_npz(parser, sourcefile, destfile)
+    except BaseException:
+        # the destination is written while the source is still being
+        # read, so a failure must not leave a truncated file behind
+        destfile.unlink(missing_ok=True)
+        raise
     sys.exit(retcode)
 
 
 def _convert_to_json(parser, sourcefile, destfile, json_dump_kwargs):
-    destfile = Path(destfile)
-    materials = parse_tape_file(sourcefile, parser=parser, on_error="raise")
-    # A single-material tape is written as a JSON object, a multi-material
-    # tape as a JSON array of material objects (design decision D); the
-    # json->endf direction tells the two apart by container type.
-    payload = materials[0] if len(materials) == 1 else materials
-    with open(destfile, "w") as f:
-        json.dump(payload, f, **json_dump_kwargs)
+    # The materials are parsed and written one at a time, so memory stays
+    # bounded by the largest material. A single-material tape is written
+    # as a JSON object, a multi-material tape as a JSON array of material
+    # objects (design decision D); the json->endf direction tells the two
+    # apart by container type.
+    materials = iter_parse_tape_file(sourcefile, parser=parser, on_error="raise")
+    write_json_tape_file(materials, destfile, **json_dump_kwargs)
+    return 0
+
+
+def _convert_to_npz(parser, sourcefile, destfile):
+    materials = iter_parse_tape_file(sourcefile, parser=parser, on_error="raise")
+    write_npz_tape_file(materials, destfile)
     return 0
 
 
 def _convert_to_endf(parser, sourcefile, destfile):
-    with open(sourcefile, "r") as f:
-        endf_data = json.load(f)
-    # A JSON array is a multi-material tape, a JSON object a single
-    # material; both are written through the multi-material tape writer.
-    materials = endf_data if isinstance(endf_data, list) else [endf_data]
-    for material in materials:
-        sanitize_fieldname_types(material)
+    # The source is an npz archive or JSON: a JSON array is a
+    # multi-material tape, a JSON object a single material, and JSON
+    # Lines one material per line. The materials are read one at a time
+    # and written through the multi-material tape writer.
+    if is_npz_tape_file(sourcefile):
+        materials = iter_npz_tape_file(sourcefile, tolist=True)
+    else:
+        materials = iter_json_tape_file(sourcefile)
     write_tape_file(materials, destfile, parser=parser)
     return 0
@@ -3,18 +3,23 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/10/06
-# Last modified:   2026/05/18
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import io
 from endf_parserpy.utils.matching import (
     eval_tree_print,
     expr_parser,
+    referenced_sections,
 )
 from ..cmd_utils import (
     add_common_cmd_parser_args,
+    add_jobs_arg,
     get_endf_parser,
     open_endf_file,
     parsed_material_dict,
@@ -29,6 +34,7 @@ COMMAND_NAME = "match"
 def add_subparser(subparsers):
     parser_search = subparsers.add_parser(COMMAND_NAME)
     add_common_cmd_parser_args(parser_search)
+    add_jobs_arg(parser_search)
     parser_search.add_argument("files", nargs="+", help="files to match")
     parser_search.add_argument("--query", "-q", type=str, help="search expression")
 
@@ -38,40 +44,105 @@ def perform_action(args):
     parser = get_endf_parser(args)
     files = []
     expr = args["query"]
-    tree = expr_parser.parse(expr)
+    # fail early on an invalid expression
+    expr_parser.parse(expr)
     for fp in args["files"]:
         matches = glob(fp)
         # keep a non-matching pattern or a missing literal path so that it
         # is reported as a parse failure rather than silently dropped
         files.extend(matches if matches else [fp])
-    retcode = _match_endf_files(parser, files, tree)
+    retcode = _match_endf_files(parser, files, expr, args.get("jobs", 1))
     sys.exit(retcode)
 
 
-def _match_endf_files(parser, files, tree):
-    any_failed = False
+def _required_sections(tree):
+    """Return the sections to parse for the search expression ``tree``.
+
+    The result is given in the format of the ``sections`` argument of
+    :func:`~endf_parserpy.cli.cmd_utils.parsed_material_dict`.
+    """
+    sections = referenced_sections(tree)
+    if sections is None:
+        return None
+    return {mf if mt is None else (mf, mt) for mf, mt in sections}
+
+
+def _match_file(parser, file, expr):
+    """Evaluate the search expression ``expr`` on the materials of ``file``.
+
+    Returns ``(output, failed_labels, any_match)``, where ``output`` is
+    the text printed for the matching materials and ``failed_labels``
+    lists the file or materials that could not be parsed.
+    """
+    tree = expr_parser.parse(expr)
+    # a material lacking the referenced sections is not parsed at all
+    sections = _required_sections(tree)
+    failed_labels = []
     any_match = False
-    for file in files:
+    output = io.StringIO()
+    try:
+        endf_file = open_endf_file(file, parser, on_error="raise")
+    except Exception:  # noqa: BLE001
+        return "", [file], False
+    multi = len(endf_file) > 1
+    for material in endf_file:
+        label = file
+        if multi:
+            label = f"{file} (material #{material.position}, MAT {material.mat})"
         try:
-            endf_file = open_endf_file(file, parser, on_error="raise")
+            endf_dict = parsed_material_dict(material, sections)
         except Exception:  # noqa: BLE001
-            any_failed = True
-            print(f"parsing failed: {file}", file=sys.stderr)
+            failed_labels.append(label)
             continue
-        multi = len(endf_file) > 1
-        for material in endf_file:
-            label = file
-            if multi:
-                label = f"{file} (material #{material.position}, MAT {material.mat})"
-            try:
-                endf_dict = parsed_material_dict(material)
-            except Exception:  # noqa: BLE001
-                any_failed = True
-                print(f"parsing failed: {label}", file=sys.stderr)
-                continue
-            opts = {"filename": label, "print": "match"}
+        opts = {"filename": label, "print": "match"}
+        with redirect_stdout(output):
             if eval_tree_print(tree, endf_dict, opts):
                 any_match = True
+    return output.getvalue(), failed_labels, any_match
+
+
+# the parser of a pool worker, set by _init_worker
+_worker_parser = None
+
+
+def _init_worker(parser):
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _match_task(file, expr):
+    return _match_file(_worker_parser, file, expr)
+
+
+def _iter_results(parser, files, expr, jobs):
+    """Yield the result of :func:`_match_file` for each of ``files`` in order."""
+    if jobs == 1:
+        for file in files:
+            yield _match_file(parser, file, expr)
+        return
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(parser,)
+    ) as executor:
+        futures = [executor.submit(_match_task, file, expr) for file in files]
+        for future in futures:
+            yield future.result()
+
+
+def _match_endf_files(parser, files, expr, jobs=1):
+    """Print the materials of ``files`` that match ``expr``.
+
+    Only the sections referenced by the expression are parsed. With
+    ``jobs > 1``, the files are processed in a pool of processes; the
+    output is printed in the order of ``files`` in any case.
+    """
+    any_failed = False
+    any_match = False
+    for output, failed_labels, matched in _iter_results(parser, files, expr, jobs):
+        print(output, end="")
+        for label in failed_labels:
+            print(f"parsing failed: {label}", file=sys.stderr)
+        any_failed = any_failed or bool(failed_labels)
+        any_match = any_match or matched
 
     # grep-like exit status: 2 if a file or material could not be parsed,
     # otherwise 0 when at least one material matched and 1 when none did
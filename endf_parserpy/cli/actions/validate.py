@@ -3,17 +3,21 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/10/06
-# Last modified:   2026/05/18
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
 from ..cmd_utils import (
     add_common_cmd_parser_args,
+    add_jobs_arg,
     get_endf_parser,
-    open_endf_file,
 )
+from endf_parserpy.tape.index import TapeIndex
+from endf_parserpy.tape.records import TEND_LINE
 from glob import glob
 import sys
 
@@ -35,6 +39,7 @@ STRICT_DEFAULT_ARGS = {
 def add_subparser(subparsers):
     parser_validate = subparsers.add_parser(COMMAND_NAME)
     add_common_cmd_parser_args(parser_validate, defaults=STRICT_DEFAULT_ARGS)
+    add_jobs_arg(parser_validate)
     parser_validate.add_argument("files", nargs="+", help="files for validation")
 
 
@@ -47,52 +52,145 @@ def perform_action(args):
         # keep a non-matching pattern or a missing literal path so that it
         # is reported as a failed file rather than silently dropped
         files.extend(matches if matches else [fp])
-    retcode = _validate_endf_files(parser, files)
+    retcode = _validate_endf_files(parser, files, args.get("jobs", 1))
     sys.exit(retcode)
 
 
-def _validate_file(parser, file):
-    """Validate every section of every material of ``file``.
+def _validate_material(parser, file, tpid_line, entry, multi):
+    """Validate every section of one material of ``file``.
 
-    Returns ``(ok, detail)``; ``detail`` is ``None`` on success and a
-    human-readable failure description otherwise. The file is opened as
-    an :class:`EndfFile`, so single- and multi-material files are
-    validated the same way -- a tape is valid only if every section of
-    every material parses.
+    The material is read in one go from the byte range recorded in its
+    :class:`~endf_parserpy.tape.index.MaterialIndexEntry` and checked
+    with :meth:`~endf_parserpy.EndfParserBase.check`, which reports all
+    failing sections without building the parsed data.
+    Returns a list of human-readable failure descriptions, which is
+    empty if the material is valid.
     """
+    prefix = f"material #{entry.position} (MAT {entry.mat}), " if multi else ""
     try:
-        endf_file = open_endf_file(file, parser, on_error="raise")
+        with open(file, "rb") as fh:
+            fh.seek(entry.byte_offset)
+            data = fh.read(entry.byte_length)
     except Exception as exc:  # noqa: BLE001
-        return False, str(exc)
-    multi = len(endf_file) > 1
-    for material in endf_file:
-        for mf, mt in material.sections():
+        return [f"{prefix}unable to read the material:\n{exc}"]
+    # the material is wrapped in a minimal single-material tape
+    mini_tape = [tpid_line] + data.decode("latin-1").splitlines() + [TEND_LINE]
+    try:
+        diagnostics = parser.check(mini_tape)
+    except Exception as exc:  # noqa: BLE001
+        return [f"{prefix}unable to check the material:\n{exc}"]
+    failures = []
+    for diag in diagnostics:
+        if diag.mf is None:
+            failures.append(f"{prefix}material structure:\n{diag.message}")
+        else:
+            section = f"section MF={diag.mf}/MT={diag.mt}"
+            failures.append(f"{prefix}{section}:\n{diag.message}")
+    return failures
+
+
+# the parser of a pool worker, set by _init_worker
+_worker_parser = None
+
+
+def _init_worker(parser):
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _validate_task(args):
+    return _validate_material(_worker_parser, *args)
+
+
+def _material_tasks(file):
+    """Return the arguments of :func:`_validate_material` for ``file``."""
+    index = TapeIndex.from_file(file)
+    multi = len(index) > 1
+    return [(file, index.tpid_line, entry, multi) for entry in index]
+
+
+def _iter_results(parser, tasks, jobs):
+    """Validate the materials of ``(key, args)`` tasks.
+
+    ``(key, args, failures)`` is yielded for each task, in task order
+    if ``jobs`` is 1 and in completion order otherwise. ``tasks`` is
+    consumed lazily: at most ``2 * jobs`` tasks are pending at a time,
+    so that the first results are reported while later files are yet
+    to be indexed.
+    """
+    tasks = iter(tasks)
+    if jobs == 1:
+        for key, args in tasks:
+            yield key, args, _validate_material(parser, *args)
+        return
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(parser,)
+    ) as executor:
+        pending = {}
+
+        def submit(count):
+            for key, args in islice(tasks, count):
+                pending[executor.submit(_validate_task, args)] = (key, args)
+
+        submit(2 * jobs)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            submit(len(done))
+            for future in done:
+                key, args = pending.pop(future)
+                yield key, args, future.result()
+
+
+def _print_failure(file, failures):
+    print("\n" + "=" * 80)
+    print(f"  Validation of {file} failed for the following reason:\n")
+    print("\n\n".join(failures))
+
+
+def _validate_endf_files(parser, files, jobs=1):
+    """Validate ``files`` and print all failures and a summary.
+
+    The work is split into one task per material, using the byte ranges
+    of a :class:`~endf_parserpy.tape.index.TapeIndex` of each file, and
+    with ``jobs > 1`` distributed over a pool of processes. The failures
+    of a file are printed as soon as all of its materials have been
+    validated, the summary in the order of ``files`` concludes the
+    output.
+    """
+    # failures[i][position] are the failures of a material of files[i]
+    failures = [{} for _ in files]
+    remaining = [0] * len(files)
+    file_status_list = []
+
+    def report(i):
+        messages = [m for _, msgs in sorted(failures[i].items()) for m in msgs]
+        if messages:
+            _print_failure(files[i], messages)
+
+    def tasks():
+        for i, file in enumerate(files):
             try:
-                material[mf, mt]
+                file_tasks = _material_tasks(file)
             except Exception as exc:  # noqa: BLE001
-                prefix = (
-                    f"material #{material.position} (MAT {material.mat}), "
-                    if multi
-                    else ""
-                )
-                return False, f"{prefix}section MF={mf}/MT={mt}:\n{exc}"
-    return True, None
+                failures[i][-1] = [str(exc)]
+                report(i)
+                continue
+            remaining[i] = len(file_tasks)
+            if not file_tasks:
+                report(i)
+            yield from ((i, args) for args in file_tasks)
 
+    for i, args, material_failures in _iter_results(parser, tasks(), jobs):
+        failures[i][args[2].position] = material_failures
+        remaining[i] -= 1
+        if remaining[i] == 0:
+            report(i)
 
-def _validate_endf_files(parser, files):
     any_failed = False
-    file_status_list = []
-    for file in files:
-        ok, detail = _validate_file(parser, file)
-        file_status_list.append((file, "ok" if ok else "failed"))
-        if not ok:
-            any_failed = True
-            print("\n" + "=" * 80)
-            print(f"  Validation of {file} failed for the following reason:\n")
-            print(detail)
-
     print("\n========== VALIDATION SUMMARY ==========")
-    for file_status in file_status_list:
-        print(f"{file_status[1]} - {file_status[0]}")
+    for i, file in enumerate(files):
+        failed = any(failures[i].values())
+        any_failed = any_failed or failed
+        print(f"{'failed' if failed else 'ok'} - {file}")
     retcode = 1 if any_failed else 0
     return retcode
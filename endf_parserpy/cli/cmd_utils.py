@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/10/06
-# Last modified:   2026/05/18
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
@@ -102,6 +102,48 @@ def add_common_cmd_parser_args(parser, defaults=None):
         parser.add_argument(f"--{arg_str}", **kwargs)
 
 
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def add_jobs_arg(parser):
+    """Add the ``-j/--jobs`` argument to command-line argument parser.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        Parser to which the argument will be added.
+    """
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=_positive_int,
+        default=1,
+        help="number of worker processes (default: 1)",
+    )
+
+
+def section_spec(value):
+    """Convert an ``MF`` or ``MF/MT`` command-line argument.
+
+    Returns the MF number as :class:`int` or the MF and MT number
+    as a tuple, i.e., an element of the ``include`` argument of
+    :meth:`~endf_parserpy.EndfParserPy.parsefile`.
+    """
+    parts = value.strip("/").split("/")
+    try:
+        numbers = tuple(int(p) for p in parts)
+    except ValueError:
+        numbers = ()
+    if len(numbers) not in (1, 2):
+        raise argparse.ArgumentTypeError(f"expected MF or MF/MT, got {value}")
+    return numbers[0] if len(numbers) == 1 else numbers
+
+
 def _map_cmd_args_to_endf_parser_args(args, cpp):
     """Map command-line args to END parser args."""
     arg_names = (v[0] for v in ENDF_PARSER_ARGS)
@@ -197,18 +239,26 @@ def open_endf_file(file, parser, **kwargs):
     return EndfFile(file, parser=parser, **kwargs)
 
 
-def parsed_material_dict(material):
-    """Return a fully parsed ``{MF: {MT: section}}`` dict for ``material``.
+def parsed_material_dict(material, sections=None):
+    """Return a parsed ``{MF: {MT: section}}`` dict for ``material``.
 
-    Every section of the :class:`MaterialView` is accessed (and hence
-    parsed) and detached to a plain ``dict``, yielding the same data
-    structure the single-file parser used to return from ``parsefile``.
+    Every selected section of the :class:`MaterialView` is accessed
+    (and hence parsed) and detached to a plain ``dict``, yielding the
+    same data structure the single-file parser used to return from
+    ``parsefile``. The other sections are left out and not parsed.
     The tape-level MF=0/MT=0 head is not a material section and is left
     out, so the result describes the material's own data only.
+
+    ``sections`` selects the sections by MF numbers and ``(MF, MT)``
+    tuples, as the ``include`` argument of ``parsefile``; the default
+    ``None`` selects all sections.
     """
+    if sections is not None:
+        sections = set(sections)
     endf_dict = {}
     for mf, mt in material.sections():
-        endf_dict.setdefault(mf, {})[mt] = material[mf, mt].detach()
+        if sections is None or mf in sections or (mf, mt) in sections:
+            endf_dict.setdefault(mf, {})[mt] = material[mf, mt].detach()
     return endf_dict
 
 
@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/12
-# Last modified:   2026/05/13
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
@@ -21,6 +21,7 @@ from .code_generator_core import (
 from .code_generator_parsing_core import (
     generate_endf_dict_assignments,
     generate_parse_or_read_verbatim,
+    generate_check_or_skip_section,
     generate_expr_validation,
 )
 from lark.lexer import Token
@@ -80,6 +81,15 @@ def _canonical_parsefun_name(recipe):
     return "parse_recipe_" + md5(recipe.encode()).hexdigest()[:16]
 
 
+def _checkfun_name(parsefun_name):
+    """Name of the check function belonging to a parse function.
+
+    The check function runs the same recipe as the parse function but
+    stores nothing, see :func:`generate_cpp_parsefun`.
+    """
+    return "check" + parsefun_name[len("parse") :]
+
+
 def _mf_mt_dict_varname(mf, mt):
     if mt is None or mt == -1:
         return f"mf{mf}_dict"
@@ -171,12 +181,32 @@ def _finalize_section_func_wrapper(sectok, vardict):
     return code
 
 
+def _prepare_section_check_func_wrapper(sectok, vardict):
+    # nothing is stored, so no dicts are needed
+    return ""
+
+
+def _finalize_section_check_func_wrapper(sectok, vardict):
+    return ""
+
+
 def _generate_expr_validation_wrapper(actual_value, node, vardict):
     code = generate_expr_validation(actual_value, node, vardict)
     return code
 
 
-def generate_cpp_parsefun(name, endf_recipe, mat=None, mf=None, mt=None, parser=None):
+def generate_cpp_parsefun(
+    name, endf_recipe, mat=None, mf=None, mt=None, parser=None, check_only=False
+):
+    """Generate the C++ function parsing an MF/MT section.
+
+    With ``check_only=True``, a function is generated that reads and
+    validates the section in the same way but creates no Python
+    objects: the values are only held in C++ variables as far as
+    needed to evaluate the recipe, and nothing is stored in a dict.
+    Such a function returns nothing and throws on the first deviation
+    from the recipe.
+    """
     vardict = {}
     register_numeric_field_getter(_get_numeric_field_wrapper, vardict)
     register_text_field_getter(_get_text_field_wrapper, vardict)
@@ -189,8 +219,12 @@ def generate_cpp_parsefun(name, endf_recipe, mat=None, mf=None, mt=None, parser=
     register_finalize_line_func(_finalize_line_func_wrapper, vardict)
     register_prepare_line_tape_func(_prepare_line_tape_func_wrapper, vardict)
     register_finalize_line_tape_func(_finalize_line_tape_func_wrapper, vardict)
-    register_prepare_section_func(_prepare_section_func_wrapper, vardict)
-    register_finalize_section_func(_finalize_section_func_wrapper, vardict)
+    if check_only:
+        register_prepare_section_func(_prepare_section_check_func_wrapper, vardict)
+        register_finalize_section_func(_finalize_section_check_func_wrapper, vardict)
+    else:
+        register_prepare_section_func(_prepare_section_func_wrapper, vardict)
+        register_finalize_section_func(_finalize_section_func_wrapper, vardict)
     register_generate_expr_validation_func(_generate_expr_validation_wrapper, vardict)
     register_lookahead_tellg_statement(
         cpp.statement("std::streampos cpp_old_streampos = cont.tellg()"), vardict
@@ -219,12 +253,15 @@ def generate_cpp_parsefun(name, endf_recipe, mat=None, mf=None, mt=None, parser=
     ctrl_code += generate_code_for_varassign(var_mf, vardict, mfval, int)
     ctrl_code += generate_code_for_varassign(var_mt, vardict, mtval, int)
 
-    ctrl_code += cpp_varops_assign.store_var_in_endf_dict(var_mat, vardict)
-    ctrl_code += cpp_varops_assign.store_var_in_endf_dict(var_mf, vardict)
-    ctrl_code += cpp_varops_assign.store_var_in_endf_dict(var_mt, vardict)
-
-    fun_header = cpp_boilerplate_reading.parsefun_header(name)
-    fun_footer = cpp_boilerplate_reading.parsefun_footer()
+    if check_only:
+        fun_header = cpp_boilerplate_reading.parsefun_header(name, "void")
+        fun_footer = cpp_boilerplate_reading.checkfun_footer()
+    else:
+        ctrl_code += cpp_varops_assign.store_var_in_endf_dict(var_mat, vardict)
+        ctrl_code += cpp_varops_assign.store_var_in_endf_dict(var_mf, vardict)
+        ctrl_code += cpp_varops_assign.store_var_in_endf_dict(var_mt, vardict)
+        fun_header = cpp_boilerplate_reading.parsefun_header(name)
+        fun_footer = cpp_boilerplate_reading.parsefun_footer()
     return generate_cpp_parse_or_write_fun(
         name,
         endf_recipe,
@@ -288,17 +325,32 @@ def _generate_check_end_records_fun(funname):
     return checker_fun
 
 
-def generate_master_parsefun(name, recipefuns):
+def generate_master_parsefun(name, recipefuns, check_only=False):
+    """Generate the C++ function parsing all sections of a tape.
+
+    With ``check_only=True``, the generated function calls the check
+    functions of the sections instead (see :func:`generate_cpp_parsefun`)
+    and returns a list of ``(MAT, MF, MT, message)`` tuples, one for each
+    section failing the check, instead of a dict with the parsed data.
+    A violation of the tape structure ends the check and is reported
+    with ``None`` for MAT, MF and MT.
+    """
     code = ""
-    code += cpp.line("")
-    code += _generate_check_end_records_fun("_check_end_records")
+    if not check_only:
+        # shared with the check function emitted after this one
+        code += cpp.line("")
+        code += _generate_check_end_records_fun("_check_end_records")
     code += cpp.line("")
 
+    decls = ""
+    decls += cpp.statement("bool is_firstline = true")
+    decls += cpp.statement("std::streampos curpos")
+    if check_only:
+        decls += cpp.statement("py::list diagnostics")
+    else:
+        decls += cpp.statement("py::dict mfmt_dict")
+        decls += cpp.statement("py::dict curdict")
     body = ""
-    body += cpp.statement("bool is_firstline = true")
-    body += cpp.statement("std::streampos curpos")
-    body += cpp.statement("py::dict mfmt_dict")
-    body += cpp.statement("py::dict curdict")
     body += cpp.statement("int mat")
     body += cpp.statement("int mf")
     body += cpp.statement("int mt")
@@ -365,7 +417,7 @@ def generate_master_parsefun(name, recipefuns):
             varname = _mf_mt_dict_varname(mf, None)
             funname = mfdic
             conditions.append(f"mf == {mf}")
-            sec_read_code = generate_parse_or_read_verbatim(funname, "parse_opts")
+            sec_read_code = _section_read_code(funname, check_only)
             section_code = sec_prep_code + sec_read_code
             statements.append(section_code)
             continue
@@ -382,7 +434,7 @@ def generate_master_parsefun(name, recipefuns):
                 # in case of MF=0/MT=0, we want to register that the tpid record has been read
                 section_code += cpp.statement("found_tpid = true")
 
-            sec_read_code = generate_parse_or_read_verbatim(funname, "parse_opts")
+            sec_read_code = _section_read_code(funname, check_only)
             section_code += sec_prep_code + sec_read_code
             statements.append(section_code)
             conditions.append(curcond)
@@ -393,7 +445,8 @@ def generate_master_parsefun(name, recipefuns):
     curstat = aux.read_section_verbatim(
         "verbatim_section", "mat", "mf", "mt", "cont", "is_firstline", "parse_opts"
     )
-    curstat += cpp_varaux.dict_assign("mfmt_dict", ["mf", "mt"], "verbatim_section")
+    if not check_only:
+        curstat += cpp_varaux.dict_assign("mfmt_dict", ["mf", "mt"], "verbatim_section")
     statements.append(curstat)
     conditions.append(curcond)
 
@@ -462,7 +515,18 @@ def generate_master_parsefun(name, recipefuns):
         "parse_opts.ignore_send_records == false && after_tend == false",
         eof_check,
     )
-    body += cpp.statement("return mfmt_dict")
+    if check_only:
+        body = cpp.trycatch(
+            body,
+            "const std::exception& exc",
+            cpp.statement(
+                "diagnostics.append(py::make_tuple("
+                "py::none(), py::none(), py::none(), std::string(exc.what())))"
+            ),
+        )
+        body += cpp.statement("return diagnostics")
+    else:
+        body += cpp.statement("return mfmt_dict")
 
     args = (
         ("std::istream&", "cont"),
@@ -470,11 +534,18 @@ def generate_master_parsefun(name, recipefuns):
         ("py::object", "include"),
         ("ParsingOptions", f"parse_opts=default_parsing_options()"),
     )
-    code += cpp.function(name, body, "py::dict", *args)
+    return_type = "py::list" if check_only else "py::dict"
+    code += cpp.function(name, decls + body, return_type, *args)
     code += cpp.line("")
     return code
 
 
+def _section_read_code(funname, check_only):
+    if check_only:
+        return generate_check_or_skip_section(_checkfun_name(funname), "parse_opts")
+    return generate_parse_or_read_verbatim(funname, "parse_opts")
+
+
 def _split_wrapper_names(entry):
     """Accept either a single name string (legacy) or a (outer, inner_istream)
     pair. Returns ``(outer_name, inner_callee_name)`` where the wrapper is
@@ -485,7 +556,9 @@ def _split_wrapper_names(entry):
     return entry, entry
 
 
-def generate_cpp_parsefun_wrappers_string(parsefuns, *extra_args):
+def generate_cpp_parsefun_wrappers_string(
+    parsefuns, *extra_args, return_type="py::dict"
+):
     args_str = ", ".join(arg[0] + " " + arg[1] for arg in extra_args)
     args_str = ", " + args_str if args_str != "" else args_str
     args_str2 = ", ".join(arg[1] for arg in extra_args)
@@ -493,7 +566,7 @@ def generate_cpp_parsefun_wrappers_string(parsefuns, *extra_args):
     code = ""
     for entry in parsefuns:
         outer, inner = _split_wrapper_names(entry)
-        code += cpp.line(f"py::dict {outer}(std::string& strcont{args_str}) {{")
+        code += cpp.line(f"{return_type} {outer}(std::string& strcont{args_str}) {{")
         code += cpp.statement("std::istringstream iss(strcont)", cpp.INDENT)
         code += cpp.statement(f"return {inner}_istream(iss{args_str2})", cpp.INDENT)
         code += cpp.close_block()
@@ -501,7 +574,7 @@ def generate_cpp_parsefun_wrappers_string(parsefuns, *extra_args):
     return code
 
 
-def generate_cpp_parsefun_wrappers_file(parsefuns, *extra_args):
+def generate_cpp_parsefun_wrappers_file(parsefuns, *extra_args, return_type="py::dict"):
     args_str = ", ".join(arg[0] + " " + arg[1] for arg in extra_args)
     args_str = ", " + args_str if args_str != "" else args_str
     args_str2 = ", ".join(arg[1] for arg in extra_args)
@@ -509,7 +582,9 @@ def generate_cpp_parsefun_wrappers_file(parsefuns, *extra_args):
     code = ""
     for entry in parsefuns:
         outer, inner = _split_wrapper_names(entry)
-        code += cpp.line(f"py::dict {outer}_file(std::string& filename{args_str}) {{")
+        code += cpp.line(
+            f"{return_type} {outer}_file(std::string& filename{args_str}) {{"
+        )
         code += cpp.statement(
             "std::ifstream inpfile(filename, std::ios::binary)", cpp.INDENT
         )
@@ -525,9 +600,9 @@ def generate_cpp_parsefun_wrappers_file(parsefuns, *extra_args):
     return code
 
 
-def _parsefun_forward_decl(istream_name):
+def _parsefun_forward_decl(istream_name, return_type="py::dict"):
     return cpp.line(
-        f"py::dict {istream_name}(std::istream& cont, ParsingOptions& parse_opts);"
+        f"{return_type} {istream_name}(std::istream& cont, ParsingOptions& parse_opts);"
     )
 
 
@@ -535,8 +610,13 @@ def generate_all_cpp_parsefuns_code(recipes, module_name, shared_registry=None):
     """Generate all per-(mf, mt) parse functions plus wrappers, master
     dispatcher, and pybind glue for one ENDF flavor.
 
-    When ``shared_registry`` is provided (dict with keys ``"parse"`` and
-    ``"write"``), per-recipe parse function bodies are deduplicated across
+    For each recipe, a check function is generated alongside the parse
+    function, which validates a section without creating Python objects.
+    These functions are called by ``check_endf`` and ``check_endf_file``.
+
+    When ``shared_registry`` is provided (dict with keys ``"parse"``,
+    ``"check"`` and ``"write"``), per-recipe parse and check function
+    bodies are deduplicated across
     flavors via canonical recipe-hash-derived names. The full body is
     stored in the registry only the first time a given recipe hash is
     encountered; subsequent encounters (whether in the same flavor or in a
@@ -551,6 +631,7 @@ def generate_all_cpp_parsefuns_code(recipes, module_name, shared_registry=None):
     forward_decls_seen = set()
     if dedup:
         parse_reg = shared_registry.setdefault("parse", {})
+        check_reg = shared_registry.setdefault("check", {})
 
     def _route(recipe, outer_name, mf, mt_):
         nonlocal parsefuns_code
@@ -558,17 +639,32 @@ def generate_all_cpp_parsefuns_code(recipes, module_name, shared_registry=None):
             parsefuns_code += generate_cpp_parsefun(
                 outer_name + "_istream", recipe, mf=mf, mt=mt_
             )
+            parsefuns_code += generate_cpp_parsefun(
+                _checkfun_name(outer_name) + "_istream",
+                recipe,
+                mf=mf,
+                mt=mt_,
+                check_only=True,
+            )
             return outer_name
         recipe_hash = md5(recipe.encode()).hexdigest()
         canonical = _canonical_parsefun_name(recipe)
         canonical_istream = canonical + "_istream"
+        check_istream = _checkfun_name(canonical) + "_istream"
         if recipe_hash not in parse_reg:
             parse_reg[recipe_hash] = (
                 canonical,
                 generate_cpp_parsefun(canonical_istream, recipe, mf=mf, mt=mt_),
             )
+            check_reg[recipe_hash] = (
+                _checkfun_name(canonical),
+                generate_cpp_parsefun(
+                    check_istream, recipe, mf=mf, mt=mt_, check_only=True
+                ),
+            )
         if canonical_istream not in forward_decls_seen:
             parsefuns_code += _parsefun_forward_decl(canonical_istream)
+            parsefuns_code += _parsefun_forward_decl(check_istream, "void")
             forward_decls_seen.add(canonical_istream)
         return canonical
 
@@ -597,17 +693,25 @@ def generate_all_cpp_parsefuns_code(recipes, module_name, shared_registry=None):
     )
     # special case for the master function calling the other mf/mt parser funs
     master_parsefun_code = generate_master_parsefun("parse_endf_istream", recipefuns)
-    parsefun_wrappers_code1 += generate_cpp_parsefun_wrappers_string(
-        ["parse_endf"],
+    master_parsefun_code += generate_master_parsefun(
+        "check_endf_istream", recipefuns, check_only=True
+    )
+    master_args = (
         ("py::object", "exclude"),
         ("py::object", "include"),
         ("ParsingOptions", "parse_opts"),
     )
+    parsefun_wrappers_code1 += generate_cpp_parsefun_wrappers_string(
+        ["parse_endf"], *master_args
+    )
     parsefun_wrappers_code2 += generate_cpp_parsefun_wrappers_file(
-        ["parse_endf"],
-        ("py::object", "exclude"),
-        ("py::object", "include"),
-        ("ParsingOptions", "parse_opts"),
+        ["parse_endf"], *master_args
+    )
+    parsefun_wrappers_code1 += generate_cpp_parsefun_wrappers_string(
+        ["check_endf"], *master_args, return_type="py::list"
+    )
+    parsefun_wrappers_code2 += generate_cpp_parsefun_wrappers_file(
+        ["check_endf"], *master_args, return_type="py::list"
     )
     pybind_glue = ""
     pybind_glue += cpp_boilerplate.register_cpp_parsefuns(
@@ -626,6 +730,22 @@ def generate_all_cpp_parsefuns_code(recipes, module_name, shared_registry=None):
         'py::arg("include") = py::none()',
         'py::arg("parse_opts") = default_parsing_options()',
     )
+    pybind_glue += cpp_boilerplate.register_cpp_parsefuns(
+        ["check_endf"],
+        module_name,
+        'py::arg("cont")',
+        'py::arg("exclude") = py::none()',
+        'py::arg("include") = py::none()',
+        'py::arg("parse_opts") = default_parsing_options()',
+    )
+    pybind_glue += cpp_boilerplate.register_cpp_parsefuns(
+        ["check_endf_file"],
+        module_name,
+        'py::arg("filename")',
+        'py::arg("exclude") = py::none()',
+        'py::arg("include") = py::none()',
+        'py::arg("parse_opts") = default_parsing_options()',
+    )
 
     all_parsefun_codes = (
         parsefuns_code
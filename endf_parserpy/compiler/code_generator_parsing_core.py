@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/12
-# Last modified:   2024/05/26
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -65,6 +65,32 @@ def generate_parse_or_read_verbatim(funname, parse_opts):
     return code
 
 
+def generate_check_or_skip_section(funname, parse_opts):
+    # a section failing the check is recorded in the diagnostics
+    # and read again from its start, so that the check can continue
+    # with the next section
+    skip_code = aux.read_section_verbatim(
+        "verbatim_section", "mat", "mf", "mt", "cont", "is_firstline", parse_opts
+    )
+    record_code = cpp.statement(
+        "diagnostics.append(py::make_tuple(mat, mf, mt, std::string(exc.what())))"
+    )
+    record_code += cpp.statement("cont.clear()")
+    record_code += cpp.statement("cont.seekg(curpos)")
+    record_code += skip_code
+    check_code = cpp.trycatch(
+        cpp.statement(f"{funname}_istream(cont, {parse_opts})"),
+        "const std::exception& exc",
+        record_code,
+    )
+    code = cpp.ifelse(
+        aux.should_parse_section("mf", "mt", "exclude", "include"),
+        check_code,
+        skip_code,
+    )
+    return code
+
+
 def generate_expr_validation(actual_value, node, vardict):
     # no validation in lookahead
     if in_lookahead(vardict):
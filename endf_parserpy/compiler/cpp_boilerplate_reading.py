@@ -42,10 +42,10 @@ def register_reading_options():
     return cpp.indent_code(code, -4)
 
 
-def parsefun_header(fun_name):
+def parsefun_header(fun_name, return_type="py::dict"):
     code = cpp.indent_code(
         rf"""
-        py::dict {fun_name}(
+        {return_type} {fun_name}(
           std::istream& cont, ParsingOptions &parse_opts
         ) {{
           std::vector<int> cpp_intvec;
@@ -67,3 +67,7 @@ def parsefun_footer():
     code = cpp.statement("return cpp_current_dict", cpp.INDENT)
     code += cpp.close_block()
     return code
+
+
+def checkfun_footer():
+    return cpp.close_block()
@@ -49,7 +49,8 @@ def generate_cpp_module_code(recipes, module_name, shared_registry=None):
 
 def generate_shared_cpp_code(shared_registry, num_chunks=1):
     """Emit the shared TU(s) that hold every unique
-    ``parse_recipe_<hash>_istream`` / ``write_recipe_<hash>_ostream`` body
+    ``parse_recipe_<hash>_istream`` / ``check_recipe_<hash>_istream`` /
+    ``write_recipe_<hash>_ostream`` body
     collected across all flavors. Each flavor's .so links against the
     object files produced from these sources.
 
@@ -57,7 +58,7 @@ def generate_shared_cpp_code(shared_registry, num_chunks=1):
     ----------
     shared_registry : dict
         Registry populated by the per-flavor codegen pass. Keys
-        ``"parse"`` and ``"write"`` each map ``recipe_hash`` to
+        ``"parse"``, ``"check"`` and ``"write"`` each map ``recipe_hash`` to
         ``(canonical_name, function_code)``.
     num_chunks : int
         Number of output translation units to spread the canonical
@@ -76,10 +77,13 @@ def generate_shared_cpp_code(shared_registry, num_chunks=1):
         ``_shared.cpp`` (the legacy single-TU layout).
     """
     parse_reg = shared_registry.get("parse", {})
+    check_reg = shared_registry.get("check", {})
     write_reg = shared_registry.get("write", {})
     # Stable lexicographic order so chunk membership is deterministic
     # across runs (no surprises in incremental builds / debugging).
-    parse_items = sorted(parse_reg.items())
+    # The check functions are reading functions, too, and go along
+    # with the parse functions.
+    parse_items = sorted(list(parse_reg.items()) + list(check_reg.items()))
     write_items = sorted(write_reg.items())
     if num_chunks <= 1:
         return [("_shared.cpp", _format_shared_chunk(parse_items, write_items, None))]
@@ -3,16 +3,32 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/29
-# Last modified:   2026/05/17
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
 import importlib
+import inspect
 import os
 from endf_parserpy.utils.accessories import EndfDict
-from ..endf_parser_base import EndfParserBase, _record_init_kwargs
+from endf_parserpy.utils.matrices import (
+    pack_matrices,
+    _check_matrix_type,
+    _without_matrices,
+)
+from endf_parserpy.utils.distributions import (
+    pack_mf6,
+    _check_mf6_type,
+    _without_packed_mf6,
+)
+from endf_parserpy.utils.user_tools import list_parsed_sections
+from ..endf_parser_base import (
+    EndfParserBase,
+    SectionDiagnostic,
+    _record_init_kwargs,
+)
 
 
 class EndfParserCpp(EndfParserBase):
@@ -57,6 +73,8 @@ class EndfParserCpp(EndfParserBase):
         preserve_value_strings=False,
         include_linenum=True,
         array_type="dict",
+        matrix_type="nested",
+        mf6_type="nested",
         skip_intzero=False,
         prefer_noexp=False,
         endf_format="endf6-ext",
@@ -135,6 +153,18 @@ class EndfParserCpp(EndfParserBase):
             The Python datatype to use for representing arrays read from
             ENDF-6 files. The two options are ``"dict"`` (default) and
             ``"list"``.  *(parsing)*
+        matrix_type : str
+            The Python datatype to use for arrays with two indices if
+            ``array_type="dict"``: ``"nested"`` (default) for dicts of
+            dicts and ``"ndarray"`` for
+            :class:`~endf_parserpy.utils.matrices.EndfMatrix` objects,
+            see the equally named parameter of
+            :class:`~endf_parserpy.EndfParserPy`. *(parsing)*
+        mf6_type : str
+            The representation of the distributions of MF6 sections:
+            ``"nested"`` (default) or ``"ndarray"`` for flat NumPy
+            arrays, see the equally named parameter of
+            :class:`~endf_parserpy.EndfParserPy`. *(parsing)*
         skip_intzero: bool
             For numbers written out in decimal notation, eliminate
             the integer part if zero, e.g. `0.12` becomes `.12` to
@@ -157,6 +187,10 @@ class EndfParserCpp(EndfParserBase):
             structure. Off by default; only the Python parser performs
             this validation unconditionally. *(parsing, C++ only)*
         """
+        _check_matrix_type(matrix_type, array_type)
+        _check_mf6_type(mf6_type)
+        self.matrix_type = matrix_type
+        self.mf6_type = mf6_type
         self.read_opts = {
             "ignore_number_mismatch": ignore_number_mismatch,
             "ignore_zero_mismatch": ignore_zero_mismatch,
@@ -179,6 +213,8 @@ class EndfParserCpp(EndfParserBase):
             "preserve_value_strings": preserve_value_strings,
             "array_type": array_type,
         }
+        # built on first use by _partial_parser
+        self._py_parser = None
         subpackage = "endf_parserpy.cpp_parsers"
         endf_format = endf_format.replace("-", "_")
         # import the parsing functions
@@ -195,6 +231,17 @@ class EndfParserCpp(EndfParserBase):
             self._write_endf_file = self._dynamic_import(
                 f"{subpackage}.{endf_format}", "write_endf_file"
             )
+            # modules compiled by an earlier version of the package
+            # have no check functions, see check
+            try:
+                self._check_endf = self._dynamic_import(
+                    f"{subpackage}.{endf_format}", "check_endf"
+                )
+                self._check_endf_file = self._dynamic_import(
+                    f"{subpackage}.{endf_format}", "check_endf_file"
+                )
+            except AttributeError:
+                self._check_endf = self._check_endf_file = None
         except ImportError as exc:
             raise type(exc)(
                 "Unable to import the cpp module responsible "
@@ -210,7 +257,42 @@ class EndfParserCpp(EndfParserBase):
             return getattr(module, attribute_name)
         return module
 
-    def parse(self, lines, exclude=None, include=None):
+    def _partial_parser(self):
+        """Return the Python parser that performs partial parses.
+
+        The compiled parsing functions always parse sections in full,
+        so a parse with ``max_records`` is delegated to an
+        :class:`~endf_parserpy.EndfParserPy` instance built with the
+        options of this parser that it shares.
+        """
+        if self._py_parser is None:
+            from ..interpreter.endf_parser import EndfParserPy
+
+            names = inspect.signature(EndfParserPy.__init__).parameters
+            kwargs = {k: v for k, v in self._init_kwargs.items() if k in names}
+            self._py_parser = EndfParserPy(print_cache_info=False, **kwargs)
+        return self._py_parser
+
+    def _pack_arrays(self, endf_dict):
+        # the compiled functions return nested dicts and lists, which
+        # are converted here if mf6_type or matrix_type is "ndarray"
+        if self.mf6_type == "ndarray":
+            for mf, mt in list_parsed_sections(endf_dict):
+                if mf == 6:
+                    pack_mf6(endf_dict[mf][mt])
+        if self.matrix_type == "ndarray":
+            recipes = self._init_kwargs["endf_format"]
+            for mf, mt in list_parsed_sections(endf_dict):
+                pack_matrices(endf_dict[mf][mt], recipes)
+        return endf_dict
+
+    def _unpack_arrays(self, endf_dict):
+        # the compiled functions only accept nested dicts and lists
+        array_type = "list" if self.write_opts["array_type"] == "list" else "dict"
+        endf_dict = _without_packed_mf6(endf_dict, array_type)
+        return _without_matrices(endf_dict)
+
+    def parse(self, lines, exclude=None, include=None, max_records=None):
         """Parse ENDF-6 formatted data.
 
         Parameters
@@ -226,17 +308,25 @@ class EndfParserCpp(EndfParserBase):
         include : Union[None, tuple[Union[int, tuple[int, int]]]]
             See explanation of parameter ``include`` in
             :func:`parsefile` for details.
+        max_records : Optional[int]
+            See explanation of parameter ``max_records`` in
+            :func:`parsefile` for details.
 
         Returns
         -------
         dict
             See explanation in :func:`parsefile`.
         """
+        if max_records is not None:
+            return self._partial_parser().parse(
+                lines, exclude, include, max_records=max_records
+            )
         if isinstance(lines, list):
             lines = "\n".join(lines)
-        return self._parse_endf(lines, exclude, include, self.read_opts)
+        endf_dict = self._parse_endf(lines, exclude, include, self.read_opts)
+        return self._pack_arrays(endf_dict)
 
-    def parsefile(self, filename, exclude=None, include=None):
+    def parsefile(self, filename, exclude=None, include=None, max_records=None):
         """Parse ENDF-6 formatted data stored in a file.
 
         Parameters
@@ -262,6 +352,15 @@ class EndfParserCpp(EndfParserBase):
             strings. This argument is only active if ``exclude=None``.
             The MF and MF/MT sections are specified exactly in the
             same way as for the ``exclude`` argument.
+        max_records : Optional[int]
+            If given, stop parsing each MF/MT section after its first
+            ``max_records`` records and return the variables defined
+            up to that point, e.g. ``max_records=1`` reads only the
+            HEAD record of each section. The compiled functions always
+            parse whole sections, so such a partial parse is carried
+            out by an :class:`~endf_parserpy.EndfParserPy` instance
+            with the same options; see the equally named parameter of
+            :meth:`EndfParserPy.parsefile` for details.
 
         Returns
         -------
@@ -272,7 +371,62 @@ class EndfParserCpp(EndfParserBase):
             `MF`/`MT` combination is determined by the
             corresponding ENDF recipe.
         """
-        return self._parse_endf_file(str(filename), exclude, include, self.read_opts)
+        if max_records is not None:
+            return self._partial_parser().parsefile(
+                filename, exclude, include, max_records=max_records
+            )
+        endf_dict = self._parse_endf_file(
+            str(filename), exclude, include, self.read_opts
+        )
+        return self._pack_arrays(endf_dict)
+
+    def check(self, lines, exclude=None, include=None):
+        """Check ENDF-6 formatted data without creating Python objects.
+
+        The compiled check functions read each MF/MT section in the
+        same way as the parsing functions but store nothing, and a
+        section failing the check does not end the check of the other
+        sections.
+
+        Parameters
+        ----------
+        lines : Union[str, list[str]]
+            The lines of text containing the ENDF-6 formatted data,
+            see :func:`parse`.
+        exclude : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``exclude`` in
+            :func:`parsefile` for details.
+        include : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``include`` in
+            :func:`parsefile` for details.
+
+        Returns
+        -------
+        list[SectionDiagnostic]
+            One entry for each section failing the check. A violation
+            of the tape structure, e.g., a missing TEND record, ends the
+            check and is reported with ``None`` as MAT, MF and MT.
+            An empty list means that the data passed the check.
+        """
+        if self._check_endf is None:
+            return super().check(lines, exclude, include)
+        if isinstance(lines, list):
+            lines = "\n".join(lines)
+        diagnostics = self._check_endf(lines, exclude, include, self.read_opts)
+        return [SectionDiagnostic(*d) for d in diagnostics]
+
+    def checkfile(self, filename, exclude=None, include=None):
+        """Check an ENDF-6 file without creating Python objects.
+
+        See :func:`check` for an explanation of the parameters
+        and the return value.
+        """
+        if self._check_endf_file is None:
+            return super().checkfile(filename, exclude, include)
+        diagnostics = self._check_endf_file(
+            str(filename), exclude, include, self.read_opts
+        )
+        return [SectionDiagnostic(*d) for d in diagnostics]
 
     def write(self, endf_dict, exclude=None, include=None):
         """Convert data into the ENDF-6 format.
@@ -287,6 +441,7 @@ class EndfParserCpp(EndfParserBase):
         """
         if isinstance(endf_dict, EndfDict):
             endf_dict = endf_dict.unwrap()
+        endf_dict = self._unpack_arrays(endf_dict)
         cont = self._write_endf(endf_dict, exclude, include, self.write_opts)
         lines = cont.split("\n")
         if lines[-1] == "":
@@ -331,6 +486,7 @@ class EndfParserCpp(EndfParserBase):
                 "Change overwrite option to True if you "
                 "really want to overwrite this file."
             )
+        endf_dict = self._unpack_arrays(endf_dict)
         return self._write_endf_file(
             str(filename), endf_dict, exclude, include, self.write_opts
         )
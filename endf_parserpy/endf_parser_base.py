@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2025/06/01
-# Last modified:   2026/05/17
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2025-2026 International Atomic Energy Agency (IAEA)
 #
@@ -15,6 +15,7 @@ import functools
 from typing import Optional, Union
 from typing import Dict, List, Tuple
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
 
 StringInput = Union[str, List[str]]
@@ -60,6 +61,33 @@ MtDictType = Dict[int, EndfSectionType]
 MfMtDictType = Dict[int, MtDictType]
 
 
+@dataclass(frozen=True)
+class SectionDiagnostic:
+    """A failure reported by :meth:`EndfParserBase.check`.
+
+    Attributes
+    ----------
+    mat : int or None
+        The MAT number of the section failing the check.
+    mf : int or None
+        The MF number of the section failing the check.
+    mt : int or None
+        The MT number of the section failing the check.
+    message : str
+        The error message, the same as the one of the exception
+        raised when parsing the section.
+
+    ``mat``, ``mf`` and ``mt`` are ``None`` if the failure concerns
+    the structure of the tape rather than a specific section, e.g.,
+    a missing TEND record.
+    """
+
+    mat: Optional[int]
+    mf: Optional[int]
+    mt: Optional[int]
+    message: str
+
+
 class EndfParserBase(ABC):
     """Abstract base class for ENDF parsers.
 
@@ -102,6 +130,7 @@ class EndfParserBase(ABC):
         lines: StringInput,
         exclude: Optional[MfMtTuplesType] = None,
         include: Optional[MfMtTuplesType] = None,
+        max_records: Optional[int] = None,
     ) -> MfMtDictType:
         pass
 
@@ -111,6 +140,7 @@ class EndfParserBase(ABC):
         filename: str,
         exclude: Optional[MfMtTuplesType] = None,
         include: Optional[MfMtTuplesType] = None,
+        max_records: Optional[int] = None,
     ) -> MfMtDictType:
         pass
 
@@ -133,3 +163,55 @@ class EndfParserBase(ABC):
         overwrite: bool = False,
     ) -> None:
         pass
+
+    def check(
+        self,
+        lines: StringInput,
+        exclude: Optional[MfMtTuplesType] = None,
+        include: Optional[MfMtTuplesType] = None,
+    ) -> List[SectionDiagnostic]:
+        """Check ENDF-6 formatted data without building the parsed data.
+
+        All MF/MT sections selected by ``exclude`` and ``include`` are
+        checked against the ENDF recipes in the same way as by
+        :meth:`parse`, but a section failing the check does not end
+        the check of the other sections.
+
+        This implementation parses the data and reports the first
+        failure only; parser classes override it by a faster one that
+        does not keep the parsed data and reports all failing sections.
+
+        Parameters
+        ----------
+        lines : Union[str, list[str]]
+            The ENDF-6 formatted data, see :meth:`parse`.
+        exclude : Union[None, tuple[Union[int, tuple[int, int]]]]
+            MF/MT sections not to be checked, see :meth:`parsefile`.
+        include : Union[None, tuple[Union[int, tuple[int, int]]]]
+            MF/MT sections to be checked, see :meth:`parsefile`.
+
+        Returns
+        -------
+        list[SectionDiagnostic]
+            One entry for each failure, an empty list if the data passed
+            the check.
+        """
+        try:
+            self.parse(lines, exclude, include)
+        except Exception as exc:
+            return [SectionDiagnostic(None, None, None, str(exc))]
+        return []
+
+    def checkfile(
+        self,
+        filename: str,
+        exclude: Optional[MfMtTuplesType] = None,
+        include: Optional[MfMtTuplesType] = None,
+    ) -> List[SectionDiagnostic]:
+        """Check an ENDF-6 file without building the parsed data.
+
+        See :meth:`check` for details.
+        """
+        with open(filename, "r") as fin:
+            lines = fin.read()
+        return self.check(lines, exclude, include)
@@ -79,6 +79,8 @@ class EndfParserFactory:
         check_arrays=False,  # Python only
         strict_datatypes=False,
         array_type="dict",
+        matrix_type="nested",
+        mf6_type="nested",
         explain_missing_variable=None,  # Python only
         cache_dir=None,  # Python only
         print_cache_info=None,  # Python only
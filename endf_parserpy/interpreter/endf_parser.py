@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/05/30
-# Last modified:   2026/05/18
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
@@ -80,6 +80,7 @@ from .custom_exceptions import (
     VariableNotFoundError,
     UnexpectedControlRecordError,
     MissingSectionError,
+    UnexpectedEndOfInputError,
 )
 from .endf_recipe_utils import (
     get_recipe_parsetree_dic,
@@ -88,8 +89,37 @@ from .endf_recipe_utils import (
 )
 from endf_parserpy.endf_recipes import get_recipe_dict
 from endf_parserpy.utils.debugging_utils import TrackingDict
+from endf_parserpy.utils.matrices import pack_matrices, _check_matrix_type
+from endf_parserpy.utils.distributions import (
+    pack_mf6,
+    _check_mf6_type,
+    _without_packed_mf6,
+)
+from endf_parserpy.utils.user_tools import list_parsed_sections
 from .helpers import array_dict_to_list
-from ..endf_parser_base import EndfParserBase, _record_init_kwargs
+from ..endf_parser_base import (
+    EndfParserBase,
+    SectionDiagnostic,
+    _record_init_kwargs,
+)
+
+
+class _RecordLimitReached(Exception):
+    """Raised to end a partial parse once ``max_records`` were read."""
+
+
+def _close_open_sections(datadic):
+    """Close the sections left open by an interrupted parse.
+
+    Mirrors what :func:`close_section` and :func:`remove_working_vars`
+    do at the end of each section and returns the root dictionary.
+    """
+    while True:
+        if "__abbrevs" in datadic:
+            remove_working_vars(datadic)
+        if "__up" not in datadic:
+            return datadic
+        datadic = datadic.pop("__up")
 
 
 class EndfParserPy(EndfParserBase):
@@ -126,6 +156,8 @@ class EndfParserPy(EndfParserBase):
         check_arrays=True,
         strict_datatypes=False,
         array_type="dict",
+        matrix_type="nested",
+        mf6_type="nested",
         explain_missing_variable=True,
         cache_dir=None,
         print_cache_info=True,
@@ -234,6 +266,23 @@ class EndfParserPy(EndfParserBase):
             The Python datatype to use for representing arrays read from
             ENDF-6 files. The two options are ``"dict"`` (default) and
             ``"list"``.  *(parsing)*
+        matrix_type : str
+            The Python datatype to use for arrays with two indices,
+            such as ``F[k,kp]`` of MF33, if ``array_type="dict"``.
+            With ``"nested"`` (default), they are dicts of dicts,
+            with ``"ndarray"``, they are
+            :class:`~endf_parserpy.utils.matrices.EndfMatrix` objects
+            that store all elements in a single NumPy array and are
+            accepted for writing as well. Requires NumPy. *(parsing)*
+        mf6_type : str
+            The representation of the distributions of MF6 sections.
+            With ``"nested"`` (default), the data of each incident
+            energy is kept in its own dicts or lists, with
+            ``"ndarray"``, the data of all incident energies is
+            concatenated into flat NumPy arrays, see
+            :func:`~endf_parserpy.utils.distributions.pack_mf6`.
+            Such sections are accepted for writing as well.
+            Requires NumPy. *(parsing)*
         explain_missing_variable : bool
             If the :func:`write` or :func:`writefile` method
             fail because a variable is missing in the dictionary,
@@ -267,6 +316,8 @@ class EndfParserPy(EndfParserBase):
             which will trigger warnings. Use `logging.ERROR` to suppress
             these warnings (you will need to `import logging`).
         """
+        _check_matrix_type(matrix_type, array_type)
+        _check_mf6_type(mf6_type)
         # obtain the parsing tree for the language
         # in which ENDF reading recipes are formulated
         if recipes is None:
@@ -302,6 +353,8 @@ class EndfParserPy(EndfParserBase):
             "ignore_varspec_mismatch": ignore_varspec_mismatch,
             "fuzzy_matching": fuzzy_matching,
             "array_type": array_type,
+            "matrix_type": matrix_type,
+            "mf6_type": mf6_type,
         }
         self.write_opts = {
             "abuse_signpos": abuse_signpos,
@@ -326,6 +379,7 @@ class EndfParserPy(EndfParserBase):
         self.explain_missing_variable = explain_missing_variable
         self.variable_descriptions = EndfDict()
         self.current_path = None
+        self._max_records = None
         # set up the logging functionality
         if not hasattr(EndfParserPy, "instance_counter"):
             EndfParserPy.instance_counter = 0
@@ -445,6 +499,7 @@ class EndfParserPy(EndfParserBase):
 
     def process_text_line(self, tree):
         if self.rwmode == "read":
+            self._count_record()
             self.ofs = skip_blank_lines(self.lines, self.ofs)
             self.loop_vars["__ofs"] = self.ofs
             self.logbuffer.save_record_log(self.ofs, self.lines[self.ofs], tree)
@@ -488,6 +543,7 @@ class EndfParserPy(EndfParserBase):
 
     def process_head_line(self, tree):
         if self.rwmode == "read":
+            self._count_record()
             self.ofs = skip_blank_lines(self.lines, self.ofs)
             self.loop_vars["__ofs"] = self.ofs
             write_info(self.logger, "Reading a HEAD record", self.ofs)
@@ -528,6 +584,7 @@ class EndfParserPy(EndfParserBase):
 
     def process_cont_line(self, tree):
         if self.rwmode == "read":
+            self._count_record()
             self.ofs = skip_blank_lines(self.lines, self.ofs)
             self.loop_vars["__ofs"] = self.ofs
             write_info(self.logger, "Reading a CONT record", self.ofs)
@@ -565,6 +622,7 @@ class EndfParserPy(EndfParserBase):
 
     def process_dir_line(self, tree):
         if self.rwmode == "read":
+            self._count_record()
             self.ofs = skip_blank_lines(self.lines, self.ofs)
             self.loop_vars["__ofs"] = self.ofs
             self.logbuffer.save_record_log(self.ofs, self.lines[self.ofs], tree)
@@ -600,6 +658,7 @@ class EndfParserPy(EndfParserBase):
 
     def process_intg_line(self, tree):
         if self.rwmode == "read":
+            self._count_record()
             self.ofs = skip_blank_lines(self.lines, self.ofs)
             self.loop_vars["__ofs"] = self.ofs
             self.logbuffer.save_record_log(self.ofs, self.lines[self.ofs], tree)
@@ -644,6 +703,7 @@ class EndfParserPy(EndfParserBase):
 
     def process_tab1_line(self, tree):
         if self.rwmode == "read":
+            self._count_record()
             self.ofs = skip_blank_lines(self.lines, self.ofs)
             self.loop_vars["__ofs"] = self.ofs
             write_info(self.logger, "Reading a TAB1 record", self.ofs)
@@ -681,6 +741,7 @@ class EndfParserPy(EndfParserBase):
 
     def process_tab2_line(self, tree):
         if self.rwmode == "read":
+            self._count_record()
             self.ofs = skip_blank_lines(self.lines, self.ofs)
             self.loop_vars["__ofs"] = self.ofs
             write_info(self.logger, "Reading a TAB2 record", self.ofs)
@@ -717,6 +778,7 @@ class EndfParserPy(EndfParserBase):
 
     def process_list_line(self, tree):
         if self.rwmode == "read":
+            self._count_record()
             self.ofs = skip_blank_lines(self.lines, self.ofs)
             self.loop_vars["__ofs"] = self.ofs
             write_info(self.logger, "Reading a LIST record", self.ofs)
@@ -753,6 +815,9 @@ class EndfParserPy(EndfParserBase):
 
     def process_send_line(self, tree):
         if self.rwmode == "read":
+            if self._max_records is not None and self.ofs >= len(self.lines):
+                # a partial parse is not given the SEND record
+                return
             self.ofs = skip_blank_lines(self.lines, self.ofs)
             self.logbuffer.save_record_log(self.ofs, self.lines[self.ofs], tree)
             read_send(
@@ -770,6 +835,18 @@ class EndfParserPy(EndfParserBase):
             )
             self.lines += newlines
 
+    def _count_record(self):
+        """Count a record to be read; stop a partial parse at its limit.
+
+        Records read by a lookahead are not counted, as they are read
+        again once the branch is taken.
+        """
+        if self._max_records is None or "__lookahead" in self.loop_vars:
+            return
+        if self._records_read >= self._max_records:
+            raise _RecordLimitReached
+        self._records_read += 1
+
     def process_section(self, tree):
         self.loop_vars["__ofs"] = self.ofs
         section_head = get_child(tree, "section_head")
@@ -871,6 +948,7 @@ class EndfParserPy(EndfParserBase):
         self.ofs = 0
         self.logbuffer = RingBuffer(capacity=20)
         self.current_path = None
+        self._records_read = 0
 
     def get_parser_state(self):
         return {
@@ -916,7 +994,7 @@ class EndfParserPy(EndfParserBase):
                 return True
         return False
 
-    def parse(self, lines, exclude=None, include=None, nofail=False):
+    def parse(self, lines, exclude=None, include=None, nofail=False, max_records=None):
         """Parse ENDF-6 formatted data.
 
         Parameters
@@ -935,7 +1013,15 @@ class EndfParserPy(EndfParserBase):
         nofail : bool
             See explanation of parameter ``nofail`` in
             :func:`parsefile` for details.
+        max_records : Optional[int]
+            See explanation of parameter ``max_records`` in
+            :func:`parsefile` for details.
         """
+        if max_records is not None and max_records < 0:
+            raise ValueError(
+                f"max_records must be a non-negative integer, got {max_records!r}"
+            )
+        self._max_records = max_records
         if isinstance(lines, str):
             lines = lines.split("\n")
         array_type = self.parse_opts["array_type"]
@@ -973,17 +1059,30 @@ class EndfParserPy(EndfParserBase):
                         )
                 elif cur_tree is not None and not should_skip:
                     # we add the SEND line so that parsing fails
-                    # if the MT section cannot be completely parsed
-                    curlines += write_send(
-                        cur_ctrl, with_ctrl=True, write_opts=self.write_opts
-                    )
+                    # if the MT section cannot be completely parsed;
+                    # a partial parse may be given only the first lines
+                    # of a section, so it must fail on running out of
+                    # lines rather than read the SEND record as data
+                    if max_records is None:
+                        curlines += write_send(
+                            cur_ctrl, with_ctrl=True, write_opts=self.write_opts
+                        )
                     self.reset_parser_state(rwmode="read", lines=curlines)
                     self.current_path = EndfPath((mf, mt))
                     try:
                         initialize_working_vars(self.datadic)
                         self.datadic.update(cur_ctrl)
-                        self.run_instruction(cur_tree)
-                        remove_working_vars(self.datadic)
+                        try:
+                            self.run_instruction(cur_tree)
+                            remove_working_vars(self.datadic)
+                        except _RecordLimitReached:
+                            self.datadic = _close_open_sections(self.datadic)
+                        except IndexError:
+                            if max_records is None:
+                                raise
+                            raise UnexpectedEndOfInputError(
+                                "expected input but consumed all lines"
+                            )
                         mfmt_dic[mf][mt] = self.datadic
                         if self.parse_opts["array_type"] == "list":
                             array_dict_to_list(mfmt_dic[mf][mt])
@@ -998,8 +1097,109 @@ class EndfParserPy(EndfParserBase):
                                 + str(exc)
                             )
         del self.parse_opts["internal_array_type"]
+        if self.parse_opts.get("mf6_type") == "ndarray":
+            for mf, mt in list_parsed_sections(mfmt_dic):
+                if mf == 6:
+                    pack_mf6(mfmt_dic[mf][mt])
+        if self.parse_opts.get("matrix_type") == "ndarray":
+            recipes = self._init_kwargs["recipes"]
+            if recipes is None:
+                recipes = self._init_kwargs["endf_format"]
+            for mf, mt in list_parsed_sections(mfmt_dic):
+                pack_matrices(mfmt_dic[mf][mt], recipes)
         return mfmt_dic
 
+    def check(self, lines, exclude=None, include=None):
+        """Check ENDF-6 formatted data without keeping the parsed data.
+
+        Each MF/MT section is read in the same way as by :func:`parse`,
+        but neither converted nor collected in a dictionary, and a
+        section failing the check does not end the check of the
+        other sections.
+
+        Parameters
+        ----------
+        lines : Union[str, list[str]]
+            The lines of text containing the ENDF-6 formatted data,
+            see :func:`parse`.
+        exclude : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``exclude`` in
+            :func:`parsefile` for details.
+        include : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``include`` in
+            :func:`parsefile` for details.
+
+        Returns
+        -------
+        list[SectionDiagnostic]
+            One entry for each section failing the check with the
+            error message :func:`parse` would raise for it. An empty
+            list means that the data passed the check.
+        """
+        if isinstance(lines, str):
+            lines = lines.split("\n")
+        self._max_records = None
+        try:
+            mfmt_dic = split_sections(lines, read_opts=self.read_opts)
+        except Exception as exc:
+            return [SectionDiagnostic(None, None, None, str(exc))]
+        array_type = self.parse_opts["array_type"]
+        self.parse_opts["internal_array_type"] = (
+            "list" if array_type == "list_slow" else "dict"
+        )
+        diagnostics = []
+        for mf in mfmt_dic:
+            for mt in mfmt_dic[mf]:
+                if self.should_skip_section(mf, mt, exclude, include):
+                    continue
+                cur_ctrl = read_ctrl(mfmt_dic[mf][mt][0], read_opts=self.read_opts)
+                curlines = mfmt_dic[mf][mt] + write_send(
+                    cur_ctrl, with_ctrl=True, write_opts=self.write_opts
+                )
+                cur_tree = get_responsible_recipe_parsetree(self.tree_dic, mf, mt)
+                cur_parsefun = get_responsible_recipe_parsefun(
+                    self.parsing_funs, mf, mt
+                )
+                try:
+                    if cur_parsefun is not None:
+                        cur_parsefun("".join(curlines))
+                    elif cur_tree is not None:
+                        self.reset_parser_state(rwmode="read", lines=curlines)
+                        self.current_path = EndfPath((mf, mt))
+                        initialize_working_vars(self.datadic)
+                        self.datadic.update(cur_ctrl)
+                        self.run_instruction(cur_tree)
+                except ParserException as exc:
+                    message = (
+                        "\nHere is the parser record log until failure:\n\n"
+                        + self.logbuffer.display_record_logs()
+                        + "Error message: "
+                        + str(exc)
+                    )
+                except Exception as exc:
+                    message = str(exc)
+                    if cur_parsefun is not None:
+                        message = (
+                            f"parsing function for MF={mf}/MT={mt} failed "
+                            + "with error message:\n"
+                            + message
+                        )
+                else:
+                    continue
+                diagnostics.append(SectionDiagnostic(cur_ctrl["MAT"], mf, mt, message))
+        del self.parse_opts["internal_array_type"]
+        return diagnostics
+
+    def checkfile(self, filename, exclude=None, include=None):
+        """Check an ENDF-6 file without keeping the parsed data.
+
+        See :func:`check` for an explanation of the parameters
+        and the return value.
+        """
+        with open(filename, "r") as fin:
+            lines = fin.readlines()
+        return self.check(lines, exclude, include)
+
     def write(self, endf_dic, exclude=None, include=None, zero_as_blank=False):
         """Convert data into the ENDF-6 format.
 
@@ -1018,6 +1218,7 @@ class EndfParserPy(EndfParserBase):
         self.parse_opts["internal_array_type"] = (
             "list" if array_type in ("list", "list_slow") else "dict"
         )
+        endf_dic = _without_packed_mf6(endf_dic, self.parse_opts["internal_array_type"])
         self.reset_parser_state(rwmode="write", datadic={})
         self.variable_descriptions = EndfDict()
         should_check_arrays = self.write_opts["check_arrays"]
@@ -1160,7 +1361,9 @@ class EndfParserPy(EndfParserBase):
         del self.parse_opts["internal_array_type"]
         return lines
 
-    def parsefile(self, filename, exclude=None, include=None, nofail=False):
+    def parsefile(
+        self, filename, exclude=None, include=None, nofail=False, max_records=None
+    ):
         """Parse ENDF-6 formatted data stored in a file.
 
         Parameters
@@ -1193,6 +1396,17 @@ class EndfParserPy(EndfParserBase):
             parsing failed will only be available as list of strings.
             On the other hand, ``nofail=false`` instructs the parser
             to abort immediately upon the first parsing failure.
+        max_records : Optional[int]
+            If given, stop parsing each MF/MT section after its first
+            ``max_records`` records (a TAB1 or LIST record counts as
+            one record, however many lines it spans) and return the
+            variables defined up to that point. For instance,
+            ``max_records=1`` reads only the HEAD record of each
+            section. A section with fewer records is parsed in full,
+            except that its SEND record is not checked. The lines
+            beyond the records read need not be present, which allows
+            to parse only the first lines of a section. Sections
+            handled by ``parsing_funs`` are always parsed in full.
 
         Returns
         -------
@@ -1205,7 +1419,9 @@ class EndfParserPy(EndfParserBase):
         """
         with open(filename, "r") as fin:
             lines = fin.readlines()
-        return self.parse(lines, exclude, include, nofail=nofail)
+        return self.parse(
+            lines, exclude, include, nofail=nofail, max_records=max_records
+        )
 
     def writefile(
         self,
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2025/05/25
-# Last modified:   2025/05/29
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -88,6 +88,11 @@ def perform_lookahead(
         tree_handler(if_body)
     except UnexpectedControlRecordError:
         pass
+    except Exception:
+        # leave the parser in its state before the lookahead
+        # so that the failure can be reported and parsing resumed
+        set_parser_state(orig_parser_state)
+        raise
 
     del loop_vars["__lookahead"]
     return datadic, loop_vars, orig_parser_state
@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2026/05/15
-# Last modified:   2026/05/16
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2026 International Atomic Energy Agency (IAEA)
 #
@@ -33,6 +33,10 @@ from .index import TapeIndex, MaterialIndexEntry, SectionIndexEntry
 from .address import EndfMaterialPath
 from .material import MaterialView
 from .endf_file import EndfFile, FailedSection
+from .planner import QueryPlan
+from .jsonio import write_json_tape_file, iter_json_tape_file
+from .columnar import write_npz_tape_file, iter_npz_tape_file
+from .aio import AsyncEndfFile, aiter_parse_tape_file
 
 __all__ = (
     "parse_tape",
@@ -41,15 +45,22 @@ __all__ = (
     "iter_parse_tape_file",
     "write_tape",
     "write_tape_file",
+    "write_json_tape_file",
+    "iter_json_tape_file",
+    "write_npz_tape_file",
+    "iter_npz_tape_file",
     "split_materials",
     "FailedMaterial",
     "TapeIndex",
     "MaterialIndexEntry",
     "SectionIndexEntry",
     "EndfFile",
+    "AsyncEndfFile",
+    "aiter_parse_tape_file",
     "EndfMaterialPath",
     "MaterialView",
     "FailedSection",
+    "QueryPlan",
     "TapeError",
     "TapeStructureError",
     "AmbiguousMaterialError",
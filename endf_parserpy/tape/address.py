@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2026/05/15
-# Last modified:   2026/05/16
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2026 International Atomic Energy Agency (IAEA)
 #
@@ -186,6 +186,32 @@ def parse_section_path(spec):
     return mf, mt, subpath
 
 
+def parse_section_selector(selector):
+    """Parse a section selector ``"MF[/MT]"``.
+
+    Either number may be ``*`` to match any value, and a missing MT
+    matches every MT of the MF file; an ``int`` selects a whole MF
+    file. Returns ``(mf, mt)`` with ``None`` standing for "any". Used
+    by :meth:`EndfFile.sections`.
+    """
+    if isinstance(selector, int):
+        return selector, None
+    parts = str(selector).strip().strip("/").split("/")
+    if len(parts) > 2 or parts[0] == "":
+        raise ValueError(
+            f"section selector {selector!r} must have the form MF[/MT], "
+            "e.g. '3', '3/*' or '*/451'"
+        )
+    parts += ["*"] * (2 - len(parts))
+    try:
+        mf, mt = (None if p == "*" else int(p) for p in parts)
+    except ValueError:
+        raise ValueError(
+            f"section selector {selector!r}: MF and MT must be integers or '*'"
+        ) from None
+    return mf, mt
+
+
 def parse_index_spec(spec):
     """Parse a :meth:`EndfFile.build_index` path specification.
 
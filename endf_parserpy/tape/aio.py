@@ -0,0 +1,236 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Asyncio front-end for the multi-material tape interface.
+
+:class:`AsyncEndfFile` wraps a thread-safe :class:`EndfFile` and exposes
+its read operations as coroutines that run on an executor, so disk
+reads and parsing never block the event loop. It adds no logic of its
+own: the index, the caches and the coalescing of concurrent misses are
+those of the wrapped :class:`EndfFile`. :func:`aiter_parse_tape_file`
+is the asynchronous counterpart of :func:`iter_parse_tape_file`.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+import threading
+
+from .endf_file import EndfFile
+from .operations import iter_parse_tape_file
+
+# marks the end of the iterator driven by aiter_parse_tape_file
+_DONE = object()
+
+
+def _locked_next(iterator, lock):
+    with lock:
+        return next(iterator, _DONE)
+
+
+def _locked_close(iterator, lock):
+    with lock:
+        iterator.close()
+
+
+class AsyncEndfFile:
+    """Awaitable access to an :class:`EndfFile` from an asyncio event loop.
+
+    Every operation is run on ``executor`` (the event loop's default
+    executor if ``None``); at most ``max_concurrency`` of them run at
+    the same time, further calls wait for a free slot. Open a tape
+    with :meth:`open`::
+
+        async with await AsyncEndfFile.open("tape.endf") as endf_file:
+            awr = await endf_file.get("#0/1/451/AWR")
+
+    Parameters
+    ----------
+    endf_file : EndfFile
+        The file to wrap. It must have been opened with
+        ``thread_safe=True``, as the operations run on executor threads.
+    max_concurrency : int
+        Maximum number of operations running at the same time.
+    executor : concurrent.futures.Executor, optional
+        The executor the operations run on.
+
+    Notes
+    -----
+    Reads run concurrently with each other. :meth:`export`, which the
+    thread-safe mode of :class:`EndfFile` does not cover, waits until
+    no other operation is running and blocks new ones until it is done.
+    Edits are not offered here; make them on :attr:`endf_file` while no
+    operation is pending.
+    """
+
+    def __init__(self, endf_file, *, max_concurrency=4, executor=None):
+        if not isinstance(endf_file, EndfFile):
+            raise TypeError(
+                f"endf_file must be an EndfFile, got {type(endf_file).__name__}"
+            )
+        if not endf_file.thread_safe:
+            raise ValueError(
+                "AsyncEndfFile needs an EndfFile opened with thread_safe=True"
+            )
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be a positive integer, got {max_concurrency!r}"
+            )
+        self._file = endf_file
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        # created on first use: before Python 3.10, asyncio primitives
+        # bind to the event loop current at their creation
+        self._semaphore = None
+        self._exclusive_lock = None
+
+    @classmethod
+    async def open(cls, filename, *, max_concurrency=4, executor=None, **kwargs):
+        """Open a tape without blocking the event loop.
+
+        The tape is indexed on ``executor``. The keyword arguments are
+        passed to :class:`EndfFile`; ``thread_safe`` is always set.
+        """
+        kwargs["thread_safe"] = True
+        loop = asyncio.get_running_loop()
+        endf_file = await loop.run_in_executor(
+            executor, partial(EndfFile, filename, **kwargs)
+        )
+        return cls(endf_file, max_concurrency=max_concurrency, executor=executor)
+
+    def _primitives(self):
+        """Return the semaphore and lock, creating them in the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._exclusive_lock = asyncio.Lock()
+        return self._semaphore, self._exclusive_lock
+
+    async def _run(self, func, *args, **kwargs):
+        semaphore, _ = self._primitives()
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, partial(func, *args, **kwargs)
+            )
+
+    @asynccontextmanager
+    async def _exclusive(self):
+        # take every concurrency slot; the lock keeps two exclusive
+        # operations from each holding a part of them
+        semaphore, lock = self._primitives()
+        acquired = 0
+        try:
+            async with lock:
+                while acquired < self._max_concurrency:
+                    await semaphore.acquire()
+                    acquired += 1
+            yield
+        finally:
+            # also hands back the slots taken before a cancellation
+            for _ in range(acquired):
+                semaphore.release()
+
+    async def get(self, path):
+        """Awaitable :meth:`EndfFile.get`."""
+        return await self._run(self._file.get, path)
+
+    async def peek(self, path, *, max_records=None):
+        """Awaitable :meth:`EndfFile.peek`."""
+        return await self._run(self._file.peek, path, max_records=max_records)
+
+    async def get_many(self, paths, *, workers=None):
+        """Awaitable :meth:`EndfFile.get_many`."""
+        return await self._run(self._file.get_many, list(paths), workers=workers)
+
+    async def sections(self, selector, *, workers=None):
+        """Awaitable :meth:`EndfFile.sections`."""
+        return await self._run(self._file.sections, selector, workers=workers)
+
+    async def query(self, section_path, *args, **kwargs):
+        """Awaitable :meth:`EndfFile.query`."""
+        return await self._run(self._file.query, section_path, *args, **kwargs)
+
+    async def build_index(self, section_path, *, name=None):
+        """Awaitable :meth:`EndfFile.build_index`."""
+        return await self._run(self._file.build_index, section_path, name=name)
+
+    async def export(self, path, *, overwrite=False, inplace=False, workers=None):
+        """Awaitable :meth:`EndfFile.export`, run with no other operation."""
+        async with self._exclusive():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                partial(
+                    self._file.export,
+                    path,
+                    overwrite=overwrite,
+                    inplace=inplace,
+                    workers=workers,
+                ),
+            )
+
+    async def close(self):
+        """Release the file descriptor of the wrapped :class:`EndfFile`."""
+        async with self._exclusive():
+            self._file.close()
+
+    @property
+    def endf_file(self):
+        """The wrapped :class:`EndfFile`."""
+        return self._file
+
+    def __len__(self):
+        return len(self._file)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
+
+    def __repr__(self):
+        return f"<AsyncEndfFile wrapping {self._file!r}>"
+
+
+async def aiter_parse_tape_file(path, *, executor=None, **kwargs):
+    """Asynchronously iterate over the materials of a tape file.
+
+    The asynchronous counterpart of :func:`iter_parse_tape_file`, which
+    receives the keyword arguments: each material is read and parsed
+    on ``executor`` (the event loop's default executor if ``None``)
+    while the event loop keeps running::
+
+        async for material in aiter_parse_tape_file("tape.endf"):
+            ...
+
+    Materials are produced one at a time, so peak memory stays bounded
+    by the largest single material.
+    """
+    loop = asyncio.get_running_loop()
+    # creating the iterator may build the default parser, so it is
+    # done on the executor as well
+    iterator = await loop.run_in_executor(
+        executor, partial(iter_parse_tape_file, path, **kwargs)
+    )
+    # a cancelled call of next may still be running on the executor;
+    # the lock makes closing the iterator wait until it has returned
+    lock = threading.Lock()
+    try:
+        while True:
+            material = await loop.run_in_executor(
+                executor, _locked_next, iterator, lock
+            )
+            if material is _DONE:
+                return
+            yield material
+    finally:
+        await loop.run_in_executor(executor, _locked_close, iterator, lock)
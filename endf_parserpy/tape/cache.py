@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2026/05/15
-# Last modified:   2026/05/16
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2026 International Atomic Energy Agency (IAEA)
 #
@@ -22,12 +22,22 @@ Two cache tiers sit below the always-resident structural index:
 
 Both caches weight an entry by the raw-text byte size of its section,
 which is available for free from the structural index.
+
+Created with ``thread_safe=True`` a cache guards its state with its own
+lock, so the two tiers can be used from several threads without one
+tier's bookkeeping holding up the other.
 """
 
+import threading
 from collections import OrderedDict
+from contextlib import nullcontext
 from weakref import WeakValueDictionary
 
 
+def _cache_lock(thread_safe):
+    return threading.Lock() if thread_safe else nullcontext()
+
+
 class _Section(dict):
     """A parsed ENDF section.
 
@@ -43,39 +53,44 @@ class _Section(dict):
 class _RawCache:
     """Byte-budgeted LRU cache of raw section text (Tier 1)."""
 
-    def __init__(self, max_bytes):
+    def __init__(self, max_bytes, thread_safe=False):
         self.max_bytes = max_bytes
         self._od = OrderedDict()
         self._weights = {}
         self._size = 0
+        self._lock = _cache_lock(thread_safe)
 
     def get(self, key):
-        if key in self._od:
-            self._od.move_to_end(key)
-            return self._od[key]
-        return None
+        with self._lock:
+            if key in self._od:
+                self._od.move_to_end(key)
+                return self._od[key]
+            return None
 
     def put(self, key, value, weight):
-        if key in self._od:
-            self._size -= self._weights[key]
-        self._od[key] = value
-        self._od.move_to_end(key)
-        self._weights[key] = weight
-        self._size += weight
-        # an item larger than the whole budget is kept on its own
-        while self._size > self.max_bytes and len(self._od) > 1:
-            old, _ = self._od.popitem(last=False)
-            self._size -= self._weights.pop(old)
+        with self._lock:
+            if key in self._od:
+                self._size -= self._weights[key]
+            self._od[key] = value
+            self._od.move_to_end(key)
+            self._weights[key] = weight
+            self._size += weight
+            # an item larger than the whole budget is kept on its own
+            while self._size > self.max_bytes and len(self._od) > 1:
+                old, _ = self._od.popitem(last=False)
+                self._size -= self._weights.pop(old)
 
     def drop_material(self, position):
-        for key in [k for k in self._od if k[0] == position]:
-            self._size -= self._weights.pop(key)
-            del self._od[key]
+        with self._lock:
+            for key in [k for k in self._od if k[0] == position]:
+                self._size -= self._weights.pop(key)
+                del self._od[key]
 
     def clear(self):
-        self._od.clear()
-        self._weights.clear()
-        self._size = 0
+        with self._lock:
+            self._od.clear()
+            self._weights.clear()
+            self._size = 0
 
     @property
     def nbytes(self):
@@ -100,48 +115,53 @@ class _SectionCache:
     entries it actually counts against its budget.
     """
 
-    def __init__(self, max_bytes):
+    def __init__(self, max_bytes, thread_safe=False):
         self.max_bytes = max_bytes
         self._strong = OrderedDict()  # key -> (section, weight)
         self._weak = WeakValueDictionary()
         self._size = 0
+        self._lock = _cache_lock(thread_safe)
 
     def get(self, key):
-        entry = self._strong.get(key)
-        if entry is not None:
-            self._strong.move_to_end(key)
-            return entry[0]
-        # evicted from the strong cache but possibly still alive
-        # elsewhere: return it by identity without re-promoting it, so
-        # no bookkeeping is retained for a section the budget no longer
-        # accounts for (WeakValueDictionary.get yields None if it died)
-        return self._weak.get(key)
+        with self._lock:
+            entry = self._strong.get(key)
+            if entry is not None:
+                self._strong.move_to_end(key)
+                return entry[0]
+            # evicted from the strong cache but possibly still alive
+            # elsewhere: return it by identity without re-promoting it, so
+            # no bookkeeping is retained for a section the budget no longer
+            # accounts for (WeakValueDictionary.get yields None if it died)
+            return self._weak.get(key)
 
     def put(self, key, value, weight):
-        try:
-            self._weak[key] = value
-        except TypeError:
-            pass  # value not weakly referenceable; identity not preserved
-        if key in self._strong:
-            self._size -= self._strong[key][1]
-        self._strong[key] = (value, weight)
-        self._strong.move_to_end(key)
-        self._size += weight
-        while self._size > self.max_bytes and len(self._strong) > 1:
-            _, (_, evicted_weight) = self._strong.popitem(last=False)
-            self._size -= evicted_weight
+        with self._lock:
+            try:
+                self._weak[key] = value
+            except TypeError:
+                pass  # value not weakly referenceable; identity not preserved
+            if key in self._strong:
+                self._size -= self._strong[key][1]
+            self._strong[key] = (value, weight)
+            self._strong.move_to_end(key)
+            self._size += weight
+            while self._size > self.max_bytes and len(self._strong) > 1:
+                _, (_, evicted_weight) = self._strong.popitem(last=False)
+                self._size -= evicted_weight
 
     def drop_material(self, position):
-        for key in [k for k in self._strong if k[0] == position]:
-            self._size -= self._strong[key][1]
-            del self._strong[key]
-        for key in [k for k in list(self._weak) if k[0] == position]:
-            self._weak.pop(key, None)
+        with self._lock:
+            for key in [k for k in self._strong if k[0] == position]:
+                self._size -= self._strong[key][1]
+                del self._strong[key]
+            for key in [k for k in list(self._weak) if k[0] == position]:
+                self._weak.pop(key, None)
 
     def clear(self):
-        self._strong.clear()
-        self._weak.clear()
-        self._size = 0
+        with self._lock:
+            self._strong.clear()
+            self._weak.clear()
+            self._size = 0
 
     @property
     def nbytes(self):
@@ -0,0 +1,317 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Binary columnar export and import of multi-material tapes (npz).
+
+A parsed material is split into its numeric arrays and the rest: every
+list of numbers -- a table of energies or cross sections, the body of a
+LIST record -- and every dict of numbers indexed by consecutive
+integers (as produced by the loops of a recipe) is stored as a
+contiguous typed NumPy array, provided it holds at least
+:data:`_MIN_ARRAY_LENGTH` elements of one type (all ``float`` or all
+``int``). A dict of such dicts, the representation of an array with two
+indices such as a covariance block ``F[k,kp]`` or ``COV[i,j]``, is
+stored as one two-dimensional array, unless its rows differ so much
+in length that the padding would more than double its size. The
+remaining structure, with the scalar fields and short lists, is stored
+as a small JSON document in which each array is replaced by a
+reference.
+
+The file is an uncompressed ``.npz`` archive (a ZIP file of ``.npy``
+arrays) holding, for material ``i``, the members ``material<i>.json``
+and ``material<i>/array<j>.npy``. As the members are stored
+uncompressed, :func:`iter_npz_tape_file` can memory-map the arrays
+straight from the archive: reloading a tape decodes only the JSON
+documents, and an array is read from disk only when it is used. The
+arrays indexed by integers come back as an :class:`EndfVector` or
+:class:`EndfMatrix`, which keep the memory-mapped array.
+
+Floats are stored as IEEE doubles and integers as 64-bit integers, so
+a material reads back exactly as it was written, and writing it with
+:func:`write_tape_file` reproduces the ENDF-6 text of the original.
+This module requires NumPy.
+"""
+
+import json
+import os
+import struct
+import zipfile
+
+from ..utils.matrices import EndfMatrix, EndfVector
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
+# shorter lists stay in the JSON document, where they cost less than a
+# separate archive member
+_MIN_ARRAY_LENGTH = 8
+
+# the fixed part of a ZIP local file header, up to the name and extra
+# field lengths (see the ZIP file format specification, section 4.3.7)
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+# a two-dimensional array may hold at most this many times the number
+# of its elements, the rest being padding of rows of different length
+_MAX_MATRIX_PADDING = 2
+
+_ARRAY_KEY = "__array__"
+_START_KEY = "__start__"
+_COL_START_KEY = "__colstart__"
+_COL_RANGES_KEY = "__colranges__"
+
+
+def _require_numpy():
+    if _np is None:
+        raise ImportError("the npz tape format requires NumPy")
+
+
+def _uniform_type(values):
+    """Return ``float`` or ``int`` if all ``values`` are of that exact type."""
+    first = type(values[0])
+    if first is not float and first is not int:
+        return None
+    for value in values:
+        if type(value) is not first:
+            return None
+    return first
+
+
+def _as_array(values):
+    """The values as a typed array, or ``None`` if they do not qualify."""
+    if len(values) < _MIN_ARRAY_LENGTH:
+        return None
+    kind = _uniform_type(values)
+    if kind is None:
+        return None
+    try:
+        return _np.array(values, dtype=_np.float64 if kind is float else _np.int64)
+    except OverflowError:
+        return None
+
+
+def _index_start(keys):
+    """The first key of consecutive integer ``keys``, else ``None``."""
+    start = keys[0]
+    if type(start) is not int:
+        return None
+    for offset, key in enumerate(keys):
+        if type(key) is not int or key != start + offset:
+            return None
+    return start
+
+
+def _as_matrix(obj):
+    """The :class:`EndfMatrix` of a dict of dicts, or ``None``.
+
+    ``obj`` qualifies if the keys at both levels are consecutive
+    integers, all values are numbers of one type and the padding of
+    the two-dimensional array is bounded by :data:`_MAX_MATRIX_PADDING`.
+    """
+    rows = list(obj.values())
+    if _index_start(list(obj)) is None or not all(
+        isinstance(row, dict) and row and _index_start(list(row)) is not None
+        for row in rows
+    ):
+        return None
+    values = [value for row in rows for value in row.values()]
+    if len(values) < _MIN_ARRAY_LENGTH or _uniform_type(values) is None:
+        return None
+    try:
+        matrix = EndfMatrix.from_dict(obj)
+    except (ValueError, OverflowError):
+        return None
+    if matrix.array.size > _MAX_MATRIX_PADDING * len(values):
+        return None
+    return matrix
+
+
+def _split(obj, arrays):
+    """Replace the qualifying arrays in ``obj`` by references.
+
+    The arrays are appended to ``arrays``; the returned object is
+    JSON-serializable, apart from unsupported leaf types.
+    """
+    if isinstance(obj, dict):
+        if obj:
+            matrix = _as_matrix(obj)
+            if matrix is not None:
+                arrays.append(matrix.array)
+                ref = {
+                    _ARRAY_KEY: len(arrays) - 1,
+                    _START_KEY: matrix.row_start,
+                    _COL_START_KEY: matrix.col_start,
+                }
+                ncols = matrix.array.shape[1]
+                full = [matrix.col_start, matrix.col_start + ncols]
+                col_ranges = matrix.col_ranges.tolist()
+                if any(cols != full for cols in col_ranges):
+                    ref[_COL_RANGES_KEY] = col_ranges
+                return ref
+            keys = list(obj)
+            start = _index_start(keys)
+            if start is not None:
+                array = _as_array(list(obj.values()))
+                if array is not None:
+                    arrays.append(array)
+                    return {_ARRAY_KEY: len(arrays) - 1, _START_KEY: start}
+        return {key: _split(value, arrays) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        array = _as_array(obj) if obj else None
+        if array is not None:
+            arrays.append(array)
+            return {_ARRAY_KEY: len(arrays) - 1}
+        return [_split(value, arrays) for value in obj]
+    return obj
+
+
+def _int_key(key):
+    # the keys of a JSON object are strings; integer keys are restored
+    # the way sanitize_fieldname_types restores them
+    try:
+        return int(key)
+    except ValueError:
+        return key
+
+
+def write_npz_tape_file(materials, path, *, overwrite=False):
+    """Write materials to a columnar ``.npz`` file, one at a time.
+
+    Parameters
+    ----------
+    materials : Iterable[dict]
+        The parsed materials, e.g. from :func:`iter_parse_tape_file`.
+        The iterable is consumed lazily, so when it is a generator the
+        whole tape is never held in memory at once.
+    path : str or os.PathLike
+        The destination file.
+    overwrite : bool
+        An existing file is only overwritten when ``overwrite=True``.
+
+    Raises :class:`TypeError` for a material with values that are
+    neither numbers, strings nor ``None``, such as the value strings
+    kept by ``preserve_value_strings=True``.
+    """
+    _require_numpy()
+    path = os.fspath(path)
+    if os.path.exists(path) and not overwrite:
+        raise FileExistsError(
+            f"file {path} already exists; pass overwrite=True to replace it"
+        )
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as archive:
+        for i, material in enumerate(materials):
+            arrays = []
+            document = json.dumps(_split(material, arrays))
+            for j, array in enumerate(arrays):
+                name = f"material{i}/array{j}.npy"
+                with archive.open(name, "w", force_zip64=True) as fh:
+                    _np.lib.format.write_array(fh, array, allow_pickle=False)
+            archive.writestr(f"material{i}.json", document)
+
+
+def _member_count(archive):
+    count = 0
+    while f"material{count}.json" in archive.NameToInfo:
+        count += 1
+    return count
+
+
+def _load_array(archive, fh, name, mmap):
+    """Load an ``.npy`` member, memory-mapped from ``fh`` if ``mmap``."""
+    npy_format = _np.lib.format
+    with archive.open(name) as member:
+        if not mmap:
+            return npy_format.read_array(member, allow_pickle=False)
+        if npy_format.read_magic(member) == (1, 0):
+            header = npy_format.read_array_header_1_0(member)
+        else:
+            header = npy_format.read_array_header_2_0(member)
+        shape, fortran_order, dtype = header
+        header_length = member.tell()
+    info = archive.getinfo(name)
+    fh.seek(info.header_offset)
+    fields = _LOCAL_HEADER.unpack(fh.read(_LOCAL_HEADER.size))
+    name_length, extra_length = fields[-2:]
+    offset = (
+        info.header_offset
+        + _LOCAL_HEADER.size
+        + name_length
+        + extra_length
+        + header_length
+    )
+    return _np.memmap(
+        fh,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def iter_npz_tape_file(path, *, mmap=True, tolist=False):
+    """Read the materials of a columnar ``.npz`` file, one at a time.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        A file written by :func:`write_npz_tape_file`.
+    mmap : bool
+        If true, the arrays are memory-mapped read-only from the file
+        rather than read into memory.
+    tolist : bool
+        If true, the arrays are converted back to lists of Python
+        numbers, so each material is identical to the one written.
+
+    Yields
+    ------
+    dict
+        The materials. Unless ``tolist=True``, each list of numbers
+        stored as an array is a NumPy array (a :class:`numpy.memmap` if
+        ``mmap``), each dict of numbers indexed by integers a read-only
+        :class:`EndfVector` and each dict of such dicts an
+        :class:`EndfMatrix`, both backed by that array; the writers of
+        the parsers accept them as they are.
+    """
+    _require_numpy()
+    path = os.fspath(path)
+    with open(path, "rb") as fh, zipfile.ZipFile(fh) as archive:
+        for i in range(_member_count(archive)):
+
+            def restore(obj, _i=i):
+                if _ARRAY_KEY not in obj:
+                    return {_int_key(key): value for key, value in obj.items()}
+                name = f"material{_i}/array{obj[_ARRAY_KEY]}.npy"
+                array = _load_array(archive, fh, name, mmap and not tolist)
+                if _COL_START_KEY in obj:
+                    matrix = EndfMatrix(
+                        array,
+                        obj[_START_KEY],
+                        obj[_COL_START_KEY],
+                        obj.get(_COL_RANGES_KEY),
+                    )
+                    return matrix.to_dict() if tolist else matrix
+                if _START_KEY in obj:
+                    vector = EndfVector(array, obj[_START_KEY])
+                    return vector.to_dict() if tolist else vector
+                return array.tolist() if tolist else array
+
+            document = archive.read(f"material{i}.json")
+            yield json.loads(document, object_hook=restore)
+
+
+def is_npz_tape_file(path):
+    """Whether ``path`` is a file written by :func:`write_npz_tape_file`."""
+    if not zipfile.is_zipfile(path):
+        return False
+    with zipfile.ZipFile(path) as archive:
+        return "material0.json" in archive.NameToInfo or not archive.namelist()
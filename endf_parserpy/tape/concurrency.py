@@ -0,0 +1,128 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Synchronisation helpers for the thread-safe mode of :class:`EndfFile`.
+
+* :class:`_SingleFlight` coalesces concurrent cache misses on the same
+  key, so a section requested by several threads at once is read and
+  parsed only once.
+* :class:`_SharedReader` serves positioned reads from one shared file
+  descriptor. Reads use :func:`os.pread`, which carries no shared seek
+  position, so any number of threads can read concurrently; where
+  ``os.pread`` is unavailable (Windows) a lock serialises seek and read.
+"""
+
+import os
+import threading
+
+
+class _Call:
+    """The outcome of one in-flight computation of :class:`_SingleFlight`."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _SingleFlight:
+    """Run at most one computation per key at a time.
+
+    The first thread to call :meth:`do` for a key runs the function; any
+    thread calling :meth:`do` for the same key while it is running waits
+    for it and receives the same result, or the same exception. Once the
+    computation finishes the key is forgotten, so the caller is expected
+    to cache the result itself.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+class _SharedReader:
+    """Positioned reads of a file through one shared descriptor.
+
+    The descriptor is opened on the first read and kept until
+    :meth:`close`; a read after :meth:`close` opens it again.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._fd = None
+        self._lock = threading.Lock()
+
+    def _descriptor(self):
+        fd = self._fd
+        if fd is None:
+            with self._lock:
+                if self._fd is None:
+                    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+                    self._fd = os.open(self._path, flags)
+                fd = self._fd
+        return fd
+
+    def read(self, offset, length):
+        """Return ``length`` bytes starting at byte ``offset``.
+
+        Fewer bytes are returned only if the file ends first.
+        """
+        fd = self._descriptor()
+        chunks = []
+        if hasattr(os, "pread"):
+            while length > 0:
+                data = os.pread(fd, length, offset)
+                if not data:
+                    break
+                chunks.append(data)
+                offset += len(data)
+                length -= len(data)
+        else:
+            with self._lock:
+                os.lseek(fd, offset, os.SEEK_SET)
+                while length > 0:
+                    data = os.read(fd, length)
+                    if not data:
+                        break
+                    chunks.append(data)
+                    length -= len(data)
+        return b"".join(chunks)
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
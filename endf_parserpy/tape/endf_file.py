@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2026/05/15
-# Last modified:   2026/05/18
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2026 International Atomic Energy Agency (IAEA)
 #
@@ -29,20 +29,26 @@ byte-for-byte but is not necessarily byte-identical overall -- the same
 guarantee the ordinary writer gives.
 """
 
+import dataclasses
 import os
-from contextlib import contextmanager
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from collections.abc import Mapping
 
 from ..endf_parser_factory import EndfParserFactory
+from ..interpreter.custom_exceptions import UnexpectedEndOfInputError
 from ..endf_parser_base import EndfParserBase
 from .address import (
     EndfMaterialPath,
     parse_index_spec,
     parse_section_path,
+    parse_section_selector,
     section_has,
     walk_section,
 )
 from .cache import _RawCache, _SectionCache, _Section
+from .concurrency import _SharedReader, _SingleFlight
 from .errors import (
     AmbiguousMaterialError,
     SectionParseError,
@@ -50,10 +56,26 @@ from .errors import (
     StaleSourceError,
     TapeStructureError,
 )
-from .index import TapeIndex
+from .index import TapeIndex, _read_index_file, _read_za_awr, _write_index_file
+from .journal import patch_file, recover_journal
 from .material import MaterialView, _MaterialSlot
-from .operations import write_tape, write_tape_file, _VALID_ON_ERROR, _FailedUnit
-from .records import _control_numbers, _control_line, _strip_send, TEND_LINE
+from .operations import (
+    write_tape,
+    write_tape_file,
+    _SourceSpan,
+    _VALID_ON_ERROR,
+    _FailedUnit,
+)
+from .parallel import (
+    _ordered_map,
+    _parse_section_lines,
+    _render_section_lines,
+    parse_sections_parallel,
+    render_sections_parallel,
+)
+from .planner import QueryPlan, decode_header_field, header_slot, peek_records
+from .records import _control_line, _control_numbers, _strip_send, TEND_LINE
+from .secondary import _SecondaryIndex
 from .views import (
     _FrozenMapping,
     _FrozenSequence,
@@ -73,6 +95,16 @@ _VALID_CHECK_EDITS = ("eager", "deferred")
 # sentinel distinguishing "no value given" from an explicit value of None
 _UNSET = object()
 
+# upper bound on a single coalesced read of adjacent sections
+_COALESCE_BYTES = 16 << 20
+
+
+def _as_section(section):
+    """Wrap a freshly parsed section for the parsed-section cache."""
+    if isinstance(section, Mapping):
+        return _Section(section)
+    return section  # a section without a recipe stays a list of strings
+
 
 def _value_match(field, value, tol):
     if tol and isinstance(field, (int, float)) and isinstance(value, (int, float)):
@@ -163,6 +195,14 @@ class EndfFile:
         pre-reads section text into the raw cache; ``"parse_all"`` also
         parses every section. The cache budgets still apply, so these
         modes pre-warm the caches rather than guarantee residency.
+    workers : int, optional
+        Number of workers used to pre-warm the caches in the
+        ``"load_raw"`` and ``"parse_all"`` modes. ``"parse_all"`` parses
+        the sections in a pool of that many processes (neither parsing
+        engine releases the GIL, so threads would not run in parallel);
+        ``"load_raw"`` reads the materials with that many threads. The
+        caches are filled in tape order either way. ``None`` (default)
+        or ``1`` preloads serially.
     parsed_cache_bytes, raw_cache_bytes : int
         Budgets, in raw-text-equivalent bytes, for the parsed-section
         and raw-text caches.
@@ -183,13 +223,36 @@ class EndfFile:
         If true, the file's size and mtime are checked against the
         index before every disk read; a change raises
         :class:`StaleSourceError`.
+    thread_safe : bool
+        If true, the object can be read from several threads at once;
+        see the notes below.
+    index_file : str or os.PathLike, optional
+        A file to load the structural index and the named secondary
+        indexes from, as written by :meth:`save_index`. It is used only
+        if it exists, can be read and still matches the tape (same size
+        and mtime); otherwise the tape is indexed afresh. It is also the default
+        destination of :meth:`save_index`.
 
     Notes
     -----
-    An :class:`EndfFile` is not safe for concurrent use from several
-    threads: its caches, material list and edit overlays are plain,
-    unguarded state, so any access racing with another is undefined.
-    Use one :class:`EndfFile` per thread.
+    By default an :class:`EndfFile` is not safe for concurrent use from
+    several threads: its caches, material list and edit overlays are
+    plain, unguarded state, so any access racing with another is
+    undefined. Use one :class:`EndfFile` per thread, or open it with
+    ``thread_safe=True``.
+
+    With ``thread_safe=True`` any number of threads may *read*
+    concurrently -- index lookups, ``endf_file[path]``, material views,
+    :meth:`query` and :meth:`build_index` -- sharing one index and one
+    set of caches. Each cache tier has its own lock, disk reads go
+    through :func:`os.pread` on a single shared file descriptor (no
+    shared seek position), and concurrent misses on the same section
+    are coalesced so it is read and parsed only once. Calls into the
+    parser are serialised, as the Python engine keeps per-call state.
+    Edits, :meth:`export` and :meth:`to_string` are not covered: the
+    caller must not run them concurrently with any other operation.
+    The shared descriptor stays open until :meth:`close` (called on
+    leaving a ``with`` block).
     """
 
     def __init__(
@@ -203,9 +266,14 @@ class EndfFile:
         on_error="mark",
         check_edits="eager",
         verify_source=False,
+        thread_safe=False,
+        workers=None,
+        index_file=None,
     ):
         if mode not in _VALID_MODES:
             raise ValueError(f"mode must be one of {_VALID_MODES}, got {mode!r}")
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError(f"workers must be a positive integer, got {workers!r}")
         if on_error not in _VALID_ON_ERROR:
             raise ValueError(
                 f"on_error must be one of {_VALID_ON_ERROR}, got {on_error!r}"
@@ -225,20 +293,64 @@ class EndfFile:
         self._on_error = on_error
         self._check_edits = check_edits
         self._verify_source = verify_source
-        self._index = TapeIndex.from_file(self._path)
+        self._thread_safe = bool(thread_safe)
+        self._index_file = None if index_file is None else os.fspath(index_file)
+        # complete an in-place export that was interrupted by a crash
+        recover_journal(self._path)
+        self._index, stored_indexes = self._open_index()
         self._materials = [
             _MaterialSlot(e.position, e.mat, e.za, e.awr) for e in self._index
         ]
-        self._raw_cache = _RawCache(raw_cache_bytes)
-        self._section_cache = _SectionCache(parsed_cache_bytes)
-        self._material_views = {}
-        self._secondary_indexes = {}
-        self._read_fh = None
         self._invalidated = False
+        self._init_runtime_state(raw_cache_bytes, parsed_cache_bytes)
+        for name, stored in stored_indexes.items():
+            self._secondary_indexes[name] = _SecondaryIndex.from_stored(
+                stored, self._materials
+            )
         if mode == "load_raw":
-            self._preload(parse=False)
+            self._preload(parse=False, workers=workers or 1)
         elif mode == "parse_all":
-            self._preload(parse=True)
+            self._preload(parse=True, workers=workers or 1)
+
+    def _init_runtime_state(self, raw_cache_bytes, parsed_cache_bytes):
+        """Create the caches and the state that is not pickled.
+
+        In thread-safe mode the caches carry their own locks, disk reads
+        go through a shared :class:`_SharedReader` and section misses
+        through a :class:`_SingleFlight`; otherwise these are left out
+        and the locks are no-op contexts.
+        """
+        thread_safe = self._thread_safe
+        self._raw_cache = _RawCache(raw_cache_bytes, thread_safe=thread_safe)
+        self._section_cache = _SectionCache(parsed_cache_bytes, thread_safe=thread_safe)
+        self._material_views = {}
+        self._secondary_indexes = {}
+        self._read_fh = None
+        if thread_safe:
+            self._reader = _SharedReader(self._path)
+            self._inflight = _SingleFlight()
+            self._parser_lock = threading.Lock()
+        else:
+            self._reader = None
+            self._inflight = None
+            self._parser_lock = nullcontext()
+
+    def _open_index(self):
+        """Return the structural index and the stored secondary indexes.
+
+        They are loaded from the index file if there is one that can be
+        read and still matches the tape; otherwise the tape is scanned
+        and no stored secondary indexes are returned.
+        """
+        if self._index_file is not None and os.path.exists(self._index_file):
+            try:
+                index, stored = _read_index_file(self._index_file)
+            except (OSError, ValueError):
+                # an unreadable, malformed or outdated index file
+                index = None
+            if index is not None and index.matches_file(self._path):
+                return index, stored
+        return TapeIndex.from_file(self._path), {}
 
     def _ensure_valid(self):
         """Raise if the object was invalidated by an export onto its source.
@@ -257,7 +369,13 @@ class EndfFile:
                 f"EndfFile({self._path!r})"
             )
 
-    def _preload(self, parse):
+    def _preload(self, parse, workers=1):
+        if workers > 1:
+            if parse:
+                self._preload_parsed_parallel(workers)
+            else:
+                self._preload_raw_parallel(workers)
+            return
         # a whole-tape operation: read every section through a single
         # held file handle instead of reopening the file per section
         with self._read_session():
@@ -268,6 +386,65 @@ class EndfFile:
                     else:
                         self._get_raw(entry.position, mf, mt, entry.sections[(mf, mt)])
 
+    def _preload_parsed_parallel(self, workers):
+        """Parse every section in a pool of ``workers`` processes.
+
+        The raw text is read here, in tape order, and sent to the pool;
+        the parsed sections come back and are put into the cache in the
+        same order, so the cache ends up as after a serial preload.
+        """
+
+        def tasks():
+            with self._read_session():
+                for entry in self._index:
+                    for (mf, mt), sec_entry in entry.sections.items():
+                        raw = self._get_raw(entry.position, mf, mt, sec_entry)
+                        yield entry.position, entry.mat, mf, mt, raw
+
+        results = parse_sections_parallel(
+            self._parser, self._index.tpid_line, tasks(), workers
+        )
+        for (position, _, mf, mt, raw), (ok, value) in results:
+            entry = self._index[position]
+            if ok:
+                section = _as_section(value)
+            else:
+                section = self._failed_section(value, entry, mf, mt, raw)
+            length = entry.sections[(mf, mt)].length
+            self._section_cache.put((position, mf, mt), section, length)
+
+    def _preload_raw_parallel(self, workers):
+        """Read every material with ``workers`` threads.
+
+        Each thread reads the byte range of a whole material with a
+        positioned read; the text is split into its sections and put
+        into the raw cache in tape order.
+        """
+        if self._verify_source:
+            self._check_source()
+        reader = self._reader or _SharedReader(self._path)
+
+        def read_material(entry):
+            return reader.read(entry.byte_offset, entry.byte_length)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                materials = _ordered_map(
+                    executor, read_material, self._index, 4 * workers
+                )
+                for entry, data in materials:
+                    for (mf, mt), sec_entry in entry.sections.items():
+                        start = sec_entry.offset - entry.byte_offset
+                        raw = data[start : start + sec_entry.length]
+                        self._raw_cache.put(
+                            (entry.position, mf, mt),
+                            raw.decode("latin-1").splitlines(),
+                            sec_entry.length,
+                        )
+        finally:
+            if reader is not self._reader:
+                reader.close()
+
     # -- polymorphic item protocol -------------------------------------
     #
     # ``[]``, ``[]=``, ``del`` and ``in`` accept either an integer
@@ -283,8 +460,8 @@ class EndfFile:
         """Return the (cached) :class:`MaterialView` of a slot."""
         view = self._material_views.get(slot)
         if view is None:
-            view = MaterialView(self, slot)
-            self._material_views[slot] = view
+            # setdefault is atomic, so racing readers share one view
+            view = self._material_views.setdefault(slot, MaterialView(self, slot))
         return view
 
     def _remove_material(self, position):
@@ -293,23 +470,16 @@ class EndfFile:
         Dropping the :class:`MaterialView` keeps ``_material_views`` from
         accumulating entries for materials that no longer exist; an
         external reference to the view stays valid as an *invalid* view
-        (its :attr:`~MaterialView.position` then raises). The named
-        secondary indexes are dropped too -- see :meth:`_invalidate_indexes`.
+        (its :attr:`~MaterialView.position` then raises). The material is
+        also dropped from the named secondary indexes, whose positions
+        shift even if the material was not indexed.
         """
         slot = self._materials.pop(position)
         slot.removed = True
         self._material_views.pop(slot, None)
-        self._invalidate_indexes()
-
-    def _invalidate_indexes(self):
-        """Drop the cached secondary indexes after a structural edit.
-
-        :meth:`build_index` keys its result by tape position, so adding,
-        removing or reordering materials would silently leave a stored
-        index pointing at the wrong materials. Rather than let it go
-        stale, any structural edit clears it; rebuild it afterwards.
-        """
-        self._secondary_indexes.clear()
+        for index in self._secondary_indexes.values():
+            index.drop(slot)
+            index.reordered()
 
     def _resolve_key(self, key):
         """Resolve a path key to ``(position, mf, mt, subpath)``.
@@ -518,7 +688,8 @@ class EndfFile:
                     self._check_section(*mf_mt, section)
                 slot.overlay[mf_mt] = section
         self._materials.append(slot)
-        self._invalidate_indexes()
+        for index in self._secondary_indexes.values():
+            self._update_index_key(index, slot)
         return self[len(self._materials) - 1]
 
     def reorder(self, order):
@@ -532,7 +703,8 @@ class EndfFile:
         if sorted(order) != list(range(len(self._materials))):
             raise ValueError("order must be a permutation of range(len(self))")
         self._materials = [self._materials[i] for i in order]
-        self._invalidate_indexes()
+        for index in self._secondary_indexes.values():
+            index.reordered()
 
     # -- secondary lookups ---------------------------------------------
 
@@ -606,6 +778,182 @@ class EndfFile:
         """
         return self[path]
 
+    def peek(self, path, *, max_records=None):
+        """Return a section or field from the first records of a section.
+
+        ``path`` addresses a section or a field, as for :meth:`get`.
+        Only the first ``max_records`` records of the section are read
+        from disk and parsed (a TAB1 or LIST record counts as one
+        record), so a header field such as ``"#0/1/451/TEMP"`` or
+        ``"#0/4/2/LTT"`` costs a few lines rather than a full parse. By
+        default, the records up to the field are read when the recipe
+        of the section sets the field in one of its leading records,
+        and otherwise all such leading records, at least one.
+
+        A section-depth path yields a read-only view of the partially
+        parsed section, which holds only the variables defined by the
+        records read; a field that is not among them raises
+        :class:`KeyError`. A section that is edited or already parsed
+        is returned in full. The partial section is not cached. If the
+        records cannot be parsed a :class:`SectionParseError` is raised.
+        """
+        self._ensure_valid()
+        if isinstance(path, int):
+            raise ValueError("peek needs a section or field path, e.g. '#0/3/1/QI'")
+        position, mf, mt, subpath = self._resolve_key(path)
+        if mf is None:
+            raise ValueError(
+                f"peek needs a section or field path, e.g. '#0/3/1/QI', got {path!r}"
+            )
+        slot = self._materials[position]
+        key = self._disk_key(slot, mf, mt)
+        section = None if key is None else self._section_cache.get(key)
+        if section is None:
+            if key is None:
+                section = self._get_slot_section(slot, mf, mt)
+            else:
+                if max_records is None:
+                    max_records = peek_records(self._parser, mf, mt, subpath)
+                section = self._parse_section_head(key, max_records)
+        if isinstance(section, FailedSection):
+            raise SectionParseError(
+                f"MF={mf}/MT={mt} of the material at position "
+                f"{section.position} failed to parse"
+            ) from section.exception
+        view = (
+            _FrozenMapping(section)
+            if isinstance(section, Mapping)
+            else _FrozenSequence(section)
+        )
+        return view if subpath is None else view[subpath]
+
+    def _parse_section_head(self, key, max_records):
+        """Parse the first ``max_records`` records of an on-disk section.
+
+        The section's first lines are read and parsed with a record
+        limit; should the records extend beyond the lines read, more
+        lines are read, up to the whole section.
+        """
+        position, mf, mt = key
+        entry = self._index[position]
+        sec_entry = entry.sections[(mf, mt)]
+        message = (
+            f"failed to parse the first {max_records} record(s) of "
+            f"MF={mf}/MT={mt} of the material at position {position} "
+            f"(MAT={entry.mat})"
+        )
+        nlines = 4 * max(max_records, 1)
+        with self._read_session():
+            while True:
+                complete = nlines >= sec_entry.line_count or key in self._raw_cache
+                if complete:
+                    lines = self._get_raw(position, mf, mt, sec_entry)
+                else:
+                    # the first lines, closed by a SEND record
+                    lines = self._read_section_head(key, nlines)
+                    lines.append(_control_line(entry.mat, mf, 0))
+                try:
+                    with self._parser_lock:
+                        section = _parse_section_lines(
+                            self._parser,
+                            self._index.tpid_line,
+                            entry.mat,
+                            mf,
+                            mt,
+                            lines,
+                            max_records=max_records,
+                        )
+                except UnexpectedEndOfInputError as exc:
+                    if complete:
+                        raise SectionParseError(message) from exc
+                    nlines *= 4
+                    continue
+                except Exception as exc:
+                    raise SectionParseError(message) from exc
+                return _as_section(section)
+
+    def get_many(self, paths, *, workers=None):
+        """Return the objects addressed by several paths in one batch.
+
+        Each element of ``paths`` is anything :meth:`get` accepts (or an
+        integer material position), and the results are returned as a
+        list in request order, exactly as ``[self.get(p) for p in
+        paths]`` would. The difference is in how the sections are
+        fetched: every path is resolved up front, the on-disk sections
+        that are not cached are sorted by byte offset so that adjacent
+        sections are read in one sequential read, and the sections are
+        then parsed as a batch -- in a pool of ``workers`` processes if
+        ``workers`` is greater than one. A section requested several
+        times is read and parsed once.
+
+        As with :meth:`get`, a missing section raises :class:`KeyError`
+        and an unparsable one :class:`SectionParseError`.
+        """
+        self._ensure_valid()
+        resolved = []
+        for path in paths:
+            if isinstance(path, int):
+                resolved.append((self._materials[path], None, None, None))
+                continue
+            if not isinstance(path, (str, EndfMaterialPath)):
+                raise TypeError(
+                    "get_many() expects integer material positions or "
+                    "EndfMaterialPath objects (strings or objects)"
+                )
+            position, mf, mt, subpath = self._resolve_key(path)
+            resolved.append((self._materials[position], mf, mt, subpath))
+        loaded = self._load_sections(
+            [
+                self._disk_key(slot, mf, mt)
+                for slot, mf, mt, _ in resolved
+                if mf is not None
+            ],
+            workers,
+        )
+        results = []
+        for slot, mf, mt, subpath in resolved:
+            if mf is None:
+                results.append(self._material_view(slot))
+                continue
+            key = self._disk_key(slot, mf, mt)
+            if key is None:
+                section = self._get_slot_section(slot, mf, mt)
+            else:
+                section = loaded[key]
+            results.append(self._view(slot, mf, mt, section, subpath))
+        return results
+
+    def sections(self, selector, *, workers=None):
+        """Return the sections of every material that match ``selector``.
+
+        ``selector`` is a string ``"MF[/MT]"`` in which either number may
+        be ``*``; a missing MT selects the whole MF file, so ``"3"``
+        yields the MF=3 sections of every material and ``"*/451"`` the
+        MF=1/MT=451 sections. The sections are fetched in one batch, as
+        by :meth:`get_many`, and returned as a dict keyed by
+        ``(position, MF, MT)`` in tape order. A section that failed to
+        parse under ``on_error="mark"`` is left out, as in :meth:`query`.
+        """
+        self._ensure_valid()
+        sel_mf, sel_mt = parse_section_selector(selector)
+        wanted = [
+            (position, slot, mf, mt)
+            for position, slot in enumerate(self._materials)
+            for mf, mt in self._slot_section_keys(slot)
+            if (sel_mf is None or mf == sel_mf) and (sel_mt is None or mt == sel_mt)
+        ]
+        loaded = self._load_sections(
+            [self._disk_key(slot, mf, mt) for _, slot, mf, mt in wanted], workers
+        )
+        result = {}
+        for position, slot, mf, mt in wanted:
+            key = self._disk_key(slot, mf, mt)
+            section = slot.overlay[(mf, mt)] if key is None else loaded[key]
+            if isinstance(section, FailedSection):
+                continue
+            result[(position, mf, mt)] = self._view(slot, mf, mt, section)
+        return result
+
     def build_index(self, section_path, *, name=None):
         """Build a secondary index over one or several section fields.
 
@@ -627,28 +975,107 @@ class EndfFile:
         One section is parsed per material per distinct ``MF/MT``, so
         the cost grows with the number of materials. With ``name`` the
         result is also stored and reachable via
-        :attr:`secondary_indexes`; because the index is keyed by tape
-        position, a stored index is dropped whenever a material is
-        appended, removed or reordered, and must then be rebuilt.
+        :attr:`secondary_indexes`. A stored index is kept up to date
+        incrementally: appending, removing or reordering materials only
+        remaps the positions, and editing a section the index covers
+        recomputes the key of that one material, so the index never has
+        to be rebuilt.
         """
         self._ensure_valid()
         specs, is_multi = parse_index_spec(section_path)
-        mapping = {}
-        for position, slot in enumerate(self._materials):
-            values = self._collect_index_values(slot, specs)
-            if values is None:
-                continue
-            key = tuple(values) if is_multi else values[0]
+        index = _SecondaryIndex(section_path, specs, is_multi)
+        for slot in self._materials:
             try:
-                mapping.setdefault(key, []).append(position)
+                index.set_values(slot, self._collect_index_values(slot, specs))
             except TypeError:
                 raise ValueError(
                     f"section path {section_path!r} resolves to a "
                     "non-hashable value; build_index needs scalar field(s)"
                 ) from None
         if name is not None:
-            self._secondary_indexes[name] = mapping
-        return mapping
+            self._secondary_indexes[name] = index
+        return index.mapping(self._materials)
+
+    def save_index(self, path=None):
+        """Persist the structural index and the named secondary indexes.
+
+        The indexes are written to ``path``, by default the
+        ``index_file`` the object was opened with, so that opening the
+        tape with ``EndfFile(..., index_file=path)`` in a later session
+        neither scans the tape nor parses any section to rebuild the
+        named secondary indexes. The file records the tape's size and
+        mtime and is ignored once the tape changes.
+
+        The stored indexes describe the tape *on disk*: for a material
+        whose indexed sections were edited (or which was removed) the
+        key is taken from the unedited section on disk, and appended
+        materials are not stored. The file is a JSON document; a key that
+        is not made up of numbers, strings, ``None`` and tuples cannot be
+        stored and raises :class:`TypeError`.
+        """
+        self._ensure_valid()
+        path = self._index_file if path is None else os.fspath(path)
+        if path is None:
+            raise ValueError(
+                "no index file to save to; pass a path or open the EndfFile "
+                "with index_file=..."
+            )
+        stored = {
+            name: {"spec": index.spec, "keys": self._on_disk_index_keys(index)}
+            for name, index in self._secondary_indexes.items()
+        }
+        _write_index_file(path, self._index, stored)
+
+    def _on_disk_index_keys(self, index):
+        """The keys of a secondary index for the materials on disk.
+
+        Returns ``{original position: key}``. The current key of a
+        material is reused unless its indexed sections were edited or
+        the material was removed; only then is the on-disk section read.
+        """
+        slots = {
+            slot.original_position: slot
+            for slot in self._materials
+            if slot.original_position is not None
+        }
+        keys = {}
+        for entry in self._index:
+            slot = slots.get(entry.position)
+            if slot is not None and not any(
+                k in slot.overlay or k in slot.deleted for k in index.sections
+            ):
+                found, key = index.key_of(slot)
+                if found:
+                    keys[entry.position] = key
+                continue
+            # an unedited stand-in slot reads the sections from disk
+            disk_slot = _MaterialSlot(entry.position, entry.mat)
+            values = self._collect_index_values(disk_slot, index.specs)
+            if values is None:
+                continue
+            try:
+                keys[entry.position] = index.make_key(values)
+            except TypeError:
+                pass
+        return keys
+
+    def _update_index_key(self, index, slot):
+        """Recompute the key of one material in a stored secondary index.
+
+        A material whose fields can no longer be indexed -- a covered
+        section or field was deleted, or now holds a non-hashable
+        value -- is dropped from the index.
+        """
+        try:
+            index.set_values(slot, self._collect_index_values(slot, index.specs))
+        except TypeError:
+            index.drop(slot)
+
+    def _refresh_indexes(self, slot, mf, mt):
+        """Update the stored secondary indexes after an edit of MF/MT."""
+        for index in self._secondary_indexes.values():
+            if index.covers(mf, mt):
+                self._update_index_key(index, slot)
 
     def _resolve_query_field(self, slot, mf, mt, subpath):
         """Resolve one section field of a material for the bulk lookups.
@@ -692,32 +1119,122 @@ class EndfFile:
         Pass exactly one of ``value`` (equality, within ``tol`` for
         numbers) or ``predicate`` (a callable applied to the field).
         Returns a list of :class:`MaterialView`.
+
+        The query is answered by the cheapest plan available (see
+        :meth:`explain`): from a named secondary index built over
+        exactly this field, by reading only the leading records of each
+        section for a header field such as ``1/451/TEMP`` or
+        ``3/102/QI``, or else by parsing each addressed section. With a
+        secondary index the predicate is called once per distinct value
+        rather than once per material. A header read does not check the
+        rest of the section, so under ``on_error="mark"`` a material
+        whose section would fail to parse can still match; sections
+        that are edited or already parsed are always taken as parsed.
         """
         self._ensure_valid()
         if (value is _UNSET) == (predicate is None):
             raise ValueError("pass exactly one of value or predicate")
         mf, mt, subpath = parse_section_path(section_path)
-        matches = []
-        for position, slot in enumerate(self._materials):
-            found, field = self._resolve_query_field(slot, mf, mt, subpath)
-            if not found:
-                continue
+        plan = self._plan_query(section_path, mf, mt, subpath)
+
+        def matches(field):
             if predicate is not None:
-                matched = bool(predicate(field))
-            else:
-                matched = _value_match(field, value, tol)
-            if matched:
-                matches.append(self[position])
-        return matches
+                return bool(predicate(field))
+            return _value_match(field, value, tol)
+
+        if plan.strategy == "index":
+            index = self._secondary_indexes[plan.index_name]
+            positions = []
+            for key, key_positions in index.mapping(self._materials).items():
+                if matches(key):
+                    positions.extend(key_positions)
+            return [self[position] for position in sorted(positions)]
+        result = []
+        with self._read_session():
+            for position, slot in enumerate(self._materials):
+                if plan.strategy == "header":
+                    found, field = self._header_query_field(slot, mf, mt, subpath, plan)
+                else:
+                    found, field = self._resolve_query_field(slot, mf, mt, subpath)
+                if found and matches(field):
+                    result.append(self[position])
+        return result
+
+    def explain(self, section_path):
+        """Return the plan :meth:`query` would use for ``section_path``.
+
+        The returned :class:`QueryPlan` has a ``strategy`` of
+        ``"index"`` (answered from the named secondary index
+        ``index_name``, no section is read), ``"header"`` (only the
+        first ``records`` records of each section are read and decoded)
+        or ``"parse"`` (each section is parsed in full); ``str()`` of
+        the plan describes it in one line.
+        """
+        self._ensure_valid()
+        mf, mt, subpath = parse_section_path(section_path)
+        return self._plan_query(section_path, mf, mt, subpath)
+
+    def _plan_query(self, section_path, mf, mt, subpath):
+        for name, index in self._secondary_indexes.items():
+            if not index.is_multi and index.specs[0] == (mf, mt, subpath):
+                return QueryPlan(str(section_path), "index", index_name=name)
+        header = header_slot(self._parser, mf, mt, subpath)
+        if header is not None:
+            return QueryPlan(
+                str(section_path), "header", records=header[0] + 1, _header=header
+            )
+        return QueryPlan(str(section_path), "parse")
+
+    def _header_query_field(self, slot, mf, mt, subpath, plan):
+        """Resolve a header field from the first records of a section.
+
+        Falls back to :meth:`_resolve_query_field` for a section that is
+        held in the overlay or already parsed, or whose leading records
+        cannot be decoded.
+        """
+        key = self._disk_key(slot, mf, mt)
+        if key is None or key in self._section_cache:
+            return self._resolve_query_field(slot, mf, mt, subpath)
+        try:
+            lines = self._read_section_head(key, plan.records)
+            return True, decode_header_field(lines, plan._header)
+        except StaleSourceError:
+            raise
+        except Exception:
+            return self._resolve_query_field(slot, mf, mt, subpath)
+
+    def _read_section_head(self, key, nlines):
+        """Return the first ``nlines`` lines of an on-disk section.
+
+        Only a prefix of the section's byte range is read, sized from
+        its average line length and grown if it falls short; a section
+        in the raw cache is taken from there.
+        """
+        raw = self._raw_cache.get(key)
+        if raw is not None:
+            return raw[:nlines]
+        position, mf, mt = key
+        sec_entry = self._index[position].sections[(mf, mt)]
+        line_length = -(-sec_entry.length // max(sec_entry.line_count, 1))
+        length = min(sec_entry.length, (nlines + 1) * line_length)
+        while True:
+            lines = self._read_span(sec_entry.offset, length)
+            # one line beyond those wanted shows the last one is complete
+            if len(lines) > nlines or length == sec_entry.length:
+                return lines[:nlines]
+            length = min(sec_entry.length, 2 * length)
 
     @property
     def secondary_indexes(self):
         """The named secondary indexes built by :meth:`build_index`.
 
-        Emptied whenever a material is appended, removed or reordered,
-        since the indexes are keyed by tape position.
+        A dict mapping each name to its ``{key: [positions]}`` index,
+        reflecting the current material order and edits.
         """
-        return self._secondary_indexes
+        return {
+            name: index.mapping(self._materials)
+            for name, index in self._secondary_indexes.items()
+        }
 
     # -- per-material section access (slot-aware) ----------------------
 
@@ -733,6 +1250,20 @@ class EndfFile:
     def _slot_section_keys(self, slot):
         return sorted(self._slot_section_keys_set(slot))
 
+    def _disk_key(self, slot, mf, mt):
+        """The cache key of a section that is read from disk, or ``None``.
+
+        ``None`` is returned when the section is held in the overlay or
+        is not present in the material at all.
+        """
+        key = (mf, mt)
+        if key in slot.overlay or key in slot.deleted:
+            return None
+        position = slot.original_position
+        if position is None or key not in self._index[position].sections:
+            return None
+        return (position, mf, mt)
+
     def _get_slot_section(self, slot, mf, mt):
         self._ensure_valid()
         key = (mf, mt)
@@ -791,6 +1322,7 @@ class EndfFile:
             self._check_section(mf, mt, value)
         slot.overlay[(mf, mt)] = value
         slot.deleted.discard((mf, mt))
+        self._refresh_indexes(slot, mf, mt)
 
     def _set_slot_field(self, slot, mf, mt, subpath, value):
         """Read-modify-write a single field within a section.
@@ -815,6 +1347,7 @@ class EndfFile:
             self._set_at(section, subpath, value)
             slot.overlay[(mf, mt)] = section
             slot.deleted.discard((mf, mt))
+        self._refresh_indexes(slot, mf, mt)
 
     def _delete_slot_section(self, slot, mf, mt):
         self._ensure_valid()
@@ -826,6 +1359,7 @@ class EndfFile:
             and (mf, mt) in self._index[slot.original_position].sections
         ):
             slot.deleted.add((mf, mt))
+        self._refresh_indexes(slot, mf, mt)
 
     def _delete_slot_field(self, slot, mf, mt, subpath):
         """Delete a single field within a section (deferred mode only)."""
@@ -841,6 +1375,7 @@ class EndfFile:
         self._del_at(section, subpath)
         slot.overlay[(mf, mt)] = section
         slot.deleted.discard((mf, mt))
+        self._refresh_indexes(slot, mf, mt)
 
     def _require_mapping_section(self, section, mf, mt):
         """Raise unless ``section`` is a parsed (mapping) section."""
@@ -884,6 +1419,7 @@ class EndfFile:
             def touch(_slot=slot, _mf=mf, _mt=mt, _section=section):
                 _slot.overlay[(_mf, _mt)] = _section
                 _slot.deleted.discard((_mf, _mt))
+                self._refresh_indexes(_slot, _mf, _mt)
 
             if isinstance(section, Mapping):
                 view = _LiveMapping(section, touch)
@@ -909,7 +1445,8 @@ class EndfFile:
         if not isinstance(section, Mapping):
             return
         try:
-            self._parser.write({0: {0: [self._index.tpid_line]}, mf: {mt: section}})
+            with self._parser_lock:
+                self._parser.write({0: {0: [self._index.tpid_line]}, mf: {mt: section}})
         except Exception as exc:
             raise SectionRenderError(
                 f"the edited MF={mf}/MT={mt} section does not render to "
@@ -958,6 +1495,18 @@ class EndfFile:
         cached = self._section_cache.get(key)
         if cached is not None:
             return cached
+        if self._inflight is None:
+            return self._load_section(position, mf, mt)
+        return self._inflight.do(key, lambda: self._load_section(position, mf, mt))
+
+    def _load_section(self, position, mf, mt):
+        key = (position, mf, mt)
+        if self._inflight is not None:
+            # another thread may have finished loading the section
+            # between our cache miss and becoming the loader
+            cached = self._section_cache.get(key)
+            if cached is not None:
+                return cached
         entry = self._index[position]
         sec_entry = entry.sections.get((mf, mt))
         if sec_entry is None:
@@ -970,31 +1519,111 @@ class EndfFile:
         self._section_cache.put(key, section, sec_entry.length)
         return section
 
+    def _load_sections(self, keys, workers=None):
+        """Fetch several on-disk sections in one batch.
+
+        ``keys`` are ``(position, MF, MT)`` keys of the on-disk index
+        (``None`` entries are ignored). Cached sections are taken from
+        the cache; the others are read in byte-offset order with
+        adjacent sections coalesced into a single read, parsed --
+        serially, or in a pool of ``workers`` processes -- and put into
+        the cache. Returns a dict mapping each key to its section, so a
+        batch larger than the cache budget is still returned whole.
+        """
+        result = {}
+        misses = []
+        for key in dict.fromkeys(k for k in keys if k is not None):
+            cached = self._section_cache.get(key)
+            if cached is not None:
+                result[key] = cached
+            else:
+                misses.append(key)
+        if not misses:
+            return result
+        raws = self._read_sections(misses)
+        if workers is not None and workers > 1 and len(misses) > 1:
+            tasks = (
+                (pos, self._index[pos].mat, mf, mt, raws[(pos, mf, mt)])
+                for pos, mf, mt in misses
+            )
+            parsed = parse_sections_parallel(
+                self._parser, self._index.tpid_line, tasks, workers
+            )
+            for (pos, _, mf, mt, raw), (ok, value) in parsed:
+                if ok:
+                    section = _as_section(value)
+                else:
+                    section = self._failed_section(value, self._index[pos], mf, mt, raw)
+                result[(pos, mf, mt)] = section
+        else:
+            for pos, mf, mt in misses:
+                raw = raws[(pos, mf, mt)]
+                result[(pos, mf, mt)] = self._parse_section(
+                    self._index[pos], mf, mt, raw
+                )
+        for key in misses:
+            length = self._index[key[0]].sections[key[1:]].length
+            self._section_cache.put(key, result[key], length)
+        return result
+
+    def _read_sections(self, keys):
+        """Return ``{key: raw_lines}`` for several on-disk sections.
+
+        Sections in the raw cache are taken from there. The others are
+        sorted by byte offset and each run of adjacent sections (up to
+        ``_COALESCE_BYTES``) is fetched with one read; the text read is
+        also put into the raw cache.
+        """
+        raws = {}
+        spans = []
+        for key in keys:
+            cached = self._raw_cache.get(key)
+            if cached is not None:
+                raws[key] = cached
+            else:
+                spans.append((self._index[key[0]].sections[key[1:]], key))
+        spans.sort(key=lambda span: span[0].offset)
+        runs = []
+        for sec_entry, key in spans:
+            run = runs[-1] if runs else None
+            if (
+                run is not None
+                and run[0] + run[1] == sec_entry.offset
+                and run[1] + sec_entry.length <= _COALESCE_BYTES
+            ):
+                run[1] += sec_entry.length
+                run[2].append((sec_entry, key))
+            else:
+                runs.append([sec_entry.offset, sec_entry.length, [(sec_entry, key)]])
+        with self._read_session():
+            for offset, length, members in runs:
+                data = self._read_bytes(offset, length)
+                for sec_entry, key in members:
+                    start = sec_entry.offset - offset
+                    raw = data[start : start + sec_entry.length]
+                    raw = raw.decode("latin-1").splitlines()
+                    self._raw_cache.put(key, raw, sec_entry.length)
+                    raws[key] = raw
+        return raws
+
     def _parse_section(self, entry, mf, mt, raw_lines):
-        # wrap the section in a minimal single-material tape so the
-        # ordinary parser can be used unchanged
-        mini_tape = (
-            [self._index.tpid_line]
-            + list(raw_lines)
-            + [
-                _control_line(entry.mat, 0, 0),  # FEND
-                _control_line(0, 0, 0),  # MEND
-                TEND_LINE,  # TEND
-            ]
-        )
         try:
-            result = self._parser.parse(mini_tape)
-            section = result[mf][mt]
+            with self._parser_lock:
+                section = _parse_section_lines(
+                    self._parser, self._index.tpid_line, entry.mat, mf, mt, raw_lines
+                )
         except Exception as exc:
-            if self._on_error == "raise":
-                raise SectionParseError(
-                    f"failed to parse MF={mf}/MT={mt} of the material at "
-                    f"position {entry.position} (MAT={entry.mat})"
-                ) from exc
-            return FailedSection(exc, raw_lines, entry.position, mf, mt)
-        if isinstance(section, Mapping):
-            return _Section(section)
-        return section  # a section without a recipe stays a list of strings
+            return self._failed_section(exc, entry, mf, mt, raw_lines)
+        return _as_section(section)
+
+    def _failed_section(self, exc, entry, mf, mt, raw_lines):
+        """Apply the ``on_error`` policy to a section that failed to parse."""
+        if self._on_error == "raise":
+            raise SectionParseError(
+                f"failed to parse MF={mf}/MT={mt} of the material at "
+                f"position {entry.position} (MAT={entry.mat})"
+            ) from exc
+        return FailedSection(exc, raw_lines, entry.position, mf, mt)
 
     @contextmanager
     def _read_session(self):
@@ -1004,8 +1633,12 @@ class EndfFile:
         instead of reopening the file per section. Used for whole-tape
         operations; outside such a block every read opens and closes the
         file on its own, which keeps interactive use simple and never
-        pins the file open.
+        pins the file open. In thread-safe mode every read already goes
+        through the shared descriptor, so the block does nothing.
         """
+        if self._reader is not None:
+            yield
+            return
         with open(self._path, "rb") as fh:
             self._read_fh = fh
             try:
@@ -1014,17 +1647,20 @@ class EndfFile:
                 self._read_fh = None
 
     def _read_span(self, offset, length):
+        return self._read_bytes(offset, length).decode("latin-1").splitlines()
+
+    def _read_bytes(self, offset, length):
         if self._verify_source:
             self._check_source()
+        if self._reader is not None:
+            return self._reader.read(offset, length)
         fh = self._read_fh
         if fh is None:
             with open(self._path, "rb") as fh:
                 fh.seek(offset)
-                data = fh.read(length)
-        else:
-            fh.seek(offset)
-            data = fh.read(length)
-        return data.decode("latin-1").splitlines()
+                return fh.read(length)
+        fh.seek(offset)
+        return fh.read(length)
 
     def _check_source(self):
         stat = os.stat(self._path)
@@ -1038,15 +1674,18 @@ class EndfFile:
 
     # -- write-back ----------------------------------------------------
 
-    def _assemble(self, slot):
+    def _assemble(self, slot, rendered=None):
         """Build a ``{MF: {MT: section}}`` dict ready for the writer.
 
         Untouched sections are taken verbatim from disk; edited or added
-        sections come from the overlay.
+        sections come from the overlay, unless ``rendered`` maps their
+        ``(MF, MT)`` key to the lines they were already rendered to.
         """
         material = {0: {0: [self._index.tpid_line]}}
         for mf, mt in self._slot_section_keys(slot):
-            if (mf, mt) in slot.overlay:
+            if rendered is not None and (mf, mt) in rendered:
+                section = _strip_send(rendered[(mf, mt)])
+            elif (mf, mt) in slot.overlay:
                 section = slot.overlay[(mf, mt)]
                 # an overlay section is always a parsed mapping or a raw
                 # list of lines; a raw list is stripped of any trailing
@@ -1066,7 +1705,8 @@ class EndfFile:
         Under ``check_edits="deferred"`` a non-conformant edited section
         raises :class:`SectionRenderError` here, before any output is
         produced; under ``"eager"`` every edit was already checked when
-        it was made, so this is a no-op.
+        it was made, so this is a no-op. Used by :meth:`to_string`;
+        :meth:`export` checks the edits as it renders them.
         """
         if self._check_edits != "deferred":
             return
@@ -1119,6 +1759,95 @@ class EndfFile:
         for slot in self._materials:
             yield self._assemble(slot)
 
+    def _source_span(self, slot):
+        """The on-disk byte range of an unedited material, or ``None``.
+
+        ``None`` is returned for an edited or added material, and for a
+        material whose last record does not end with a bare LF
+        terminator (CRLF or no terminator at all), which could not be
+        joined with the re-rendered materials as it is.
+        """
+        if slot.is_modified:
+            return None
+        entry = self._index[slot.original_position]
+        if entry.byte_length < 2:
+            return None
+        tail = self._read_bytes(entry.byte_offset + entry.byte_length - 2, 2)
+        if tail[-1:] != b"\n" or tail == b"\r\n":
+            return None
+        return _SourceSpan(
+            self._path, entry.byte_offset, entry.byte_length, self._index.tpid_line
+        )
+
+    def _render_edit(self, position, mf, mt, section):
+        """Render an edited section in this process.
+
+        Returns ``(True, lines)`` or ``(False, exception)``, like the
+        pool task of :func:`render_sections_parallel`.
+        """
+        try:
+            with self._parser_lock:
+                return True, _render_section_lines(
+                    self._parser, self._index.tpid_line, mf, mt, section
+                )
+        except Exception as exc:
+            return False, exc
+
+    def _rendered_edits(self, workers=None):
+        """Render every edited section once, yielding them in tape order.
+
+        Yields ``((position, MF, MT), lines)`` for each parsed section in
+        the overlays, material by material and in ``(MF, MT)`` order
+        within a material; ``lines`` run through the SEND record. With
+        ``workers > 1`` the sections are rendered in a pool of that many
+        processes, with a bounded number of them in flight. A section
+        that fails to render raises :class:`SectionRenderError`.
+        """
+        tasks = (
+            (position, mf, mt, section)
+            for position, slot in enumerate(self._materials)
+            for (mf, mt), section in sorted(slot.overlay.items())
+            if isinstance(section, Mapping)
+        )
+        if workers is not None and workers > 1:
+            results = render_sections_parallel(
+                self._parser, self._index.tpid_line, tasks, workers
+            )
+        else:
+            results = ((task, self._render_edit(*task)) for task in tasks)
+        for (position, mf, mt, _), (ok, value) in results:
+            if not ok:
+                raise SectionRenderError(
+                    f"the edited MF={mf}/MT={mt} section of the material at "
+                    f"position {position} does not render to valid ENDF-6 "
+                    f"text: {value}; call invalid_edits() for the full report"
+                ) from value
+            yield (position, mf, mt), value
+
+    def _export_materials(self, workers=None):
+        """Yield each material ready for :func:`write_tape_file`.
+
+        Like :meth:`_output_materials`, but an unedited material is
+        produced as a :class:`_SourceSpan` of its on-disk bytes, which
+        the writer copies without decoding, parsing or rendering them,
+        and each edited section is rendered exactly once, by
+        :meth:`_rendered_edits`.
+        """
+        rendered = self._rendered_edits(workers)
+        try:
+            for slot in self._materials:
+                span = self._source_span(slot)
+                if span is not None:
+                    yield span
+                    continue
+                lines = {}
+                for key, section in sorted(slot.overlay.items()):
+                    if isinstance(section, Mapping):
+                        _, lines[key] = next(rendered)
+                yield self._assemble(slot, lines)
+        finally:
+            rendered.close()
+
     def to_string(self):
         """Return the (possibly edited) tape as an ENDF-6 formatted string.
 
@@ -1144,17 +1873,21 @@ class EndfFile:
         with self._read_session():
             return write_tape(self._output_materials(), parser=self._parser)
 
-    def export(self, path, *, overwrite=False):
+    def export(self, path, *, overwrite=False, inplace=False, workers=None):
         """Write the (possibly edited) tape to a file.
 
         The tape is written one material at a time via a temporary file
         and an atomic replace, so peak memory stays bounded by a single
-        material regardless of the tape size. Untouched sections keep
-        their data records verbatim from disk (they are not parsed) and
-        edited or added sections are rendered by the parser; the
-        SEND/FEND/MEND framing and the column 76-80 sequence numbers are
-        regenerated either way, preserving every data field byte-for-byte
-        without making the tape byte-identical. An existing file is only
+        material regardless of the tape size. A material that was not
+        edited is copied byte-for-byte from its range of the source file
+        (with :func:`os.copy_file_range` or :func:`os.sendfile` where
+        available), so it is neither decoded nor re-rendered and keeps
+        its exact bytes, including its sequence numbers. In an edited
+        material, untouched sections keep their data records verbatim
+        from disk (they are not parsed) and edited or added sections
+        are rendered by the parser; its SEND/FEND/MEND framing and the
+        column 76-80 sequence numbers are regenerated, preserving every
+        data field byte-for-byte. An existing file is only
         overwritten when ``overwrite=True``. A tape from which every
         material has been deleted is written as its tape head (TPID)
         followed by the tape end (TEND).
@@ -1166,22 +1899,62 @@ class EndfFile:
         :class:`StaleSourceError`, and the file must be re-opened with a
         new :class:`EndfFile` to continue. Exporting to any other path
         leaves the object usable.
+
+        With ``inplace=True``, ``path`` must be the source file, which
+        is then updated while the object stays valid. If no material was
+        added, removed or reordered, no section was deleted or added,
+        and every edited section renders to exactly as many bytes as it
+        occupies on disk (e.g. after changing ``AWR``, a Q-value or the
+        values of a cross section table), only those sections are
+        overwritten in the source file; the rest of the file is not
+        touched. The patches go through a journal flushed to disk first
+        (see :mod:`endf_parserpy.tape.journal`), and a patch interrupted
+        by a crash is completed when the tape is next opened with
+        :class:`EndfFile`. Otherwise the tape is rewritten as described
+        above and re-indexed. Either way, the edits are afterwards part
+        of the source file and the object continues to read from it.
+
+        Every edited section is rendered exactly once, in tape order;
+        with ``workers > 1`` the sections are rendered in a pool of that
+        many processes while the tape is written (neither parsing engine
+        releases the GIL, so threads would not run in parallel). Under
+        ``check_edits="deferred"`` this render is also the conformity
+        check: an edited section that does not render raises
+        :class:`SectionRenderError` and no output is written.
         """
         self._ensure_valid()
-        self._check_deferred_edits()
         self._check_materials_have_sections()
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError(f"workers must be a positive integer, got {workers!r}")
         path = os.fspath(path)
+        onto_source = os.path.realpath(path) == os.path.realpath(self._path)
+        if inplace:
+            if not onto_source:
+                raise ValueError(
+                    f"inplace=True updates the source file {self._path!r}; "
+                    f"got the path {path!r}"
+                )
+            self._export_inplace(workers)
+            return
         if os.path.exists(path) and not overwrite:
             raise FileExistsError(
                 f"file {path} already exists; pass overwrite=True to replace it"
             )
-        onto_source = os.path.realpath(path) == os.path.realpath(self._path)
+        self._write_via_temp(path, workers)
+        if onto_source:
+            # the file the index describes has just been rewritten; the
+            # offsets of untouched sections no longer match -- this object
+            # can no longer read from disk safely (see _ensure_valid)
+            self._invalidated = True
+
+    def _write_via_temp(self, path, workers=None):
+        """Write the tape to ``path`` via a temporary file and a replace."""
         tmp = path + ".endfparserpy-tmp"
         try:
             if self._materials:
                 with self._read_session():
                     write_tape_file(
-                        self._output_materials(),
+                        self._export_materials(workers),
                         tmp,
                         parser=self._parser,
                         overwrite=True,
@@ -1201,11 +1974,109 @@ class EndfFile:
             except OSError:
                 pass
             raise
-        if onto_source:
-            # the file the index describes has just been rewritten; the
-            # offsets of untouched sections no longer match -- this object
-            # can no longer read from disk safely (see _ensure_valid)
-            self._invalidated = True
+
+    def _inplace_patches(self, workers=None):
+        """Return the ``(offset, data)`` patches of an in-place export.
+
+        Every edited section is rendered to the bytes it would have in
+        the exported tape; ``None`` is returned if the tape was edited
+        structurally or a section does not fit its on-disk byte range
+        exactly. Sections that render to their current bytes are left
+        out.
+        """
+        if len(self._materials) != len(self._index):
+            return None
+        for position, slot in enumerate(self._materials):
+            if slot.original_position != position or slot.deleted:
+                return None
+            if not slot.overlay.keys() <= self._index[position].sections.keys():
+                return None
+        patches = []
+        rendered = self._rendered_edits(workers)
+        try:
+            for position, slot in enumerate(self._materials):
+                sections = self._index[position].sections
+                for (mf, mt), section in sorted(slot.overlay.items()):
+                    if isinstance(section, Mapping):
+                        _, lines = next(rendered)
+                    else:
+                        with self._parser_lock:
+                            lines = _render_section_lines(
+                                self._parser,
+                                self._index.tpid_line,
+                                mf,
+                                mt,
+                                _strip_send(section),
+                            )
+                    data = ("\n".join(lines) + "\n").encode("latin-1")
+                    sec_entry = sections[(mf, mt)]
+                    if len(data) != sec_entry.length:
+                        return None
+                    current = self._read_bytes(sec_entry.offset, sec_entry.length)
+                    if data != current:
+                        patches.append((sec_entry.offset, data))
+        finally:
+            rendered.close()
+        return patches
+
+    def _export_inplace(self, workers=None):
+        """Apply the edits to the source file (``export(inplace=True)``)."""
+        with self._read_session():
+            patches = self._inplace_patches(workers)
+        if patches is None:
+            self._write_via_temp(self._path, workers)
+            if self._reader is not None:
+                # the shared descriptor still refers to the replaced file
+                self._reader.close()
+            self._adopt_source(TapeIndex.from_file(self._path))
+            return
+        if patches:
+            patch_file(self._path, patches)
+        # the index stays exact; only the identifiers of a material whose
+        # first record was patched, and the file's mtime, may change
+        patched = {offset for offset, _ in patches}
+        entries = []
+        for entry in self._index:
+            if entry.byte_offset in patched:
+                first = self._read_bytes(entry.byte_offset, 80).decode("latin-1")
+                za, awr = _read_za_awr(first)
+                entry = dataclasses.replace(entry, za=za, awr=awr)
+            entries.append(entry)
+        stat = os.stat(self._path)
+        index = self._index
+        self._adopt_source(
+            TapeIndex(
+                entries,
+                index.tpid_line,
+                index.tpid_offset,
+                index.tpid_length,
+                source=index.source,
+                source_size=stat.st_size,
+                source_mtime_ns=stat.st_mtime_ns,
+            )
+        )
+
+    def _adopt_source(self, index):
+        """Make the rewritten source file, indexed by ``index``, the base.
+
+        The edits are now part of the file, so the overlays are emptied
+        and the caches cleared; each material slot keeps its identity
+        (and so its views and secondary index keys) and is pointed at
+        its new position in the file.
+        """
+        if len(index) != len(self._materials):
+            raise TapeStructureError(
+                f"the rewritten file {self._path!r} holds {len(index)} "
+                f"materials instead of {len(self._materials)}"
+            )
+        for entry, slot in zip(index, self._materials):
+            slot.original_position = entry.position
+            slot.mat, slot.za, slot.awr = entry.mat, entry.za, entry.awr
+            slot.overlay.clear()
+            slot.deleted.clear()
+        self._index = index
+        self._raw_cache.clear()
+        self._section_cache.clear()
 
     # -- memory management ---------------------------------------------
 
@@ -1225,6 +2096,21 @@ class EndfFile:
             self._raw_cache.drop_material(original)
             self._section_cache.drop_material(original)
 
+    def close(self):
+        """Release the shared file descriptor of the thread-safe mode.
+
+        A no-op unless the object was opened with ``thread_safe=True``.
+        The object stays usable: a later read opens the descriptor
+        again. It must not be called while other threads are reading.
+        """
+        if self._reader is not None:
+            self._reader.close()
+
+    @property
+    def thread_safe(self):
+        """Whether the object was opened with ``thread_safe=True``."""
+        return self._thread_safe
+
     @property
     def cache_nbytes(self):
         """The current ``(raw, parsed)`` cache sizes in bytes."""
@@ -1247,6 +2133,7 @@ class EndfFile:
 
     def __exit__(self, *exc):
         self.unload()
+        self.close()
         return False
 
     def __repr__(self):
@@ -1255,11 +2142,12 @@ class EndfFile:
 
     # -- pickling ------------------------------------------------------
     #
-    # The index, the material slots (which carry any edits) and the
-    # parser are pickled; the caches and named secondary indexes are
-    # not. The parser pickles by recipe (see EndfParserBase), so its
-    # construction options are preserved across pickling. Any secondary
-    # indexes must be rebuilt with build_index() afterwards.
+    # The index, the material slots (which carry any edits), the named
+    # secondary indexes and the parser are pickled; the caches are not.
+    # The parser pickles by recipe (see EndfParserBase), so its
+    # construction options are preserved across pickling. A secondary
+    # index keys materials by slot, and the slots are pickled along with
+    # it, so it stays attached to the right materials.
 
     def __getstate__(self):
         return {
@@ -1269,10 +2157,13 @@ class EndfFile:
             "check_edits": self._check_edits,
             "invalidated": self._invalidated,
             "verify_source": self._verify_source,
+            "thread_safe": self._thread_safe,
             "raw_cache_bytes": self._raw_cache.max_bytes,
             "parsed_cache_bytes": self._section_cache.max_bytes,
             "index": self._index,
+            "index_file": self._index_file,
             "materials": self._materials,
+            "secondary_indexes": self._secondary_indexes,
         }
 
     def __setstate__(self, state):
@@ -1282,10 +2173,9 @@ class EndfFile:
         self._check_edits = state.get("check_edits", "eager")
         self._invalidated = state.get("invalidated", False)
         self._verify_source = state["verify_source"]
+        self._thread_safe = state.get("thread_safe", False)
         self._index = state["index"]
+        self._index_file = state.get("index_file")
         self._materials = state["materials"]
-        self._raw_cache = _RawCache(state["raw_cache_bytes"])
-        self._section_cache = _SectionCache(state["parsed_cache_bytes"])
-        self._material_views = {}
-        self._secondary_indexes = {}
-        self._read_fh = None
+        self._init_runtime_state(state["raw_cache_bytes"], state["parsed_cache_bytes"])
+        self._secondary_indexes.update(state.get("secondary_indexes", {}))
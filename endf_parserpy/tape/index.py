@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2026/05/15
-# Last modified:   2026/05/18
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2026 International Atomic Energy Agency (IAEA)
 #
@@ -32,11 +32,12 @@ to the streaming line-by-line scan it falls back to for any tape that
 is not uniform-width.
 """
 
+import json
 import os
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Tuple
 
-from .errors import TapeStructureError
+from .errors import StaleSourceError, TapeStructureError
 from .records import _control_int, _MAT_COLS, _MF_COLS, _MT_COLS, _CTRL_COLS
 
 try:
@@ -48,6 +49,10 @@ except ImportError:  # pragma: no cover - numpy is an optional accelerator
 # indexing to a small multiple of this regardless of the tape size
 _DEFAULT_CHUNK_BYTES = 16 << 20
 
+# identification of a persisted index file (see _write_index_file)
+_INDEX_FILE_FORMAT = "endf-parserpy tape index"
+_INDEX_FILE_VERSION = 2
+
 
 def _endf_float(field_text):
     """Parse an 11-column ENDF number field; return ``None`` on failure.
@@ -491,6 +496,153 @@ def _vec_scan_file(fh, chunk_bytes):
     return st.materials, tpid
 
 
+def _encode_key(key):
+    """Encode a secondary index key as a JSON value."""
+    if isinstance(key, tuple):
+        return {"tuple": [_encode_key(k) for k in key]}
+    if key is None or isinstance(key, (bool, int, float, str)):
+        return key
+    raise TypeError(
+        f"the secondary index key {key!r} of type {type(key).__name__} cannot "
+        "be stored in an index file"
+    )
+
+
+def _decode_key(value):
+    if isinstance(value, dict):
+        return tuple(_decode_key(v) for v in value["tuple"])
+    return value
+
+
+def _encode_index(index):
+    return {
+        "tpid_line": index.tpid_line,
+        "tpid_offset": index.tpid_offset,
+        "tpid_length": index.tpid_length,
+        "source": index.source,
+        "source_size": index.source_size,
+        "source_mtime_ns": index.source_mtime_ns,
+        "materials": [
+            {
+                "position": entry.position,
+                "mat": entry.mat,
+                "za": entry.za,
+                "awr": entry.awr,
+                "byte_offset": entry.byte_offset,
+                "byte_length": entry.byte_length,
+                "sections": [
+                    [mf, mt, sec.offset, sec.length, sec.line_count]
+                    for (mf, mt), sec in entry.sections.items()
+                ],
+            }
+            for entry in index.materials
+        ],
+    }
+
+
+def _decode_index(data):
+    materials = []
+    for entry in data["materials"]:
+        sections = {
+            (mf, mt): SectionIndexEntry(offset, length, line_count)
+            for mf, mt, offset, length, line_count in entry["sections"]
+        }
+        materials.append(
+            MaterialIndexEntry(
+                position=entry["position"],
+                mat=entry["mat"],
+                za=entry["za"],
+                awr=entry["awr"],
+                byte_offset=entry["byte_offset"],
+                byte_length=entry["byte_length"],
+                sections=sections,
+            )
+        )
+    return TapeIndex(
+        materials,
+        data["tpid_line"],
+        data["tpid_offset"],
+        data["tpid_length"],
+        source=data["source"],
+        source_size=data["source_size"],
+        source_mtime_ns=data["source_mtime_ns"],
+    )
+
+
+def _write_index_file(path, index, secondary):
+    """Persist a :class:`TapeIndex` and stored secondary indexes.
+
+    The file is a versioned JSON document, so loading it never runs
+    code. It is written to a temporary file and atomically moved into
+    place, so a reader never sees a partly written index. Raises
+    :class:`TypeError` if a secondary index key is not made up of
+    numbers, strings, ``None`` and tuples.
+    """
+    payload = {
+        "format": _INDEX_FILE_FORMAT,
+        "version": _INDEX_FILE_VERSION,
+        "index": _encode_index(index),
+        "secondary": {
+            name: {
+                "spec": stored["spec"],
+                "keys": [
+                    [position, _encode_key(key)]
+                    for position, key in stored["keys"].items()
+                ],
+            }
+            for name, stored in secondary.items()
+        },
+    }
+    text = json.dumps(payload, separators=(",", ":"))
+    path = os.fspath(path)
+    tmp = path + ".endfparserpy-tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _read_index_file(path):
+    """Return ``(index, secondary)`` from a file written by :func:`_write_index_file`.
+
+    Raises :class:`ValueError` if the file is not a readable index file
+    of a supported version.
+    """
+    path = os.fspath(path)
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"{path!r} is not an endf-parserpy tape index file") from exc
+    if not isinstance(payload, dict) or payload.get("format") != _INDEX_FILE_FORMAT:
+        raise ValueError(f"{path!r} is not an endf-parserpy tape index file")
+    if payload.get("version") != _INDEX_FILE_VERSION:
+        raise ValueError(
+            f"the tape index file {path!r} has the unsupported format version "
+            f"{payload.get('version')!r}"
+        )
+    try:
+        index = _decode_index(payload["index"])
+        secondary = {
+            name: {
+                "spec": stored["spec"],
+                "keys": {
+                    position: _decode_key(key) for position, key in stored["keys"]
+                },
+            }
+            for name, stored in payload["secondary"].items()
+        }
+    except (KeyError, TypeError, ValueError, AttributeError) as exc:
+        raise ValueError(f"the tape index file {path!r} is malformed") from exc
+    return index, secondary
+
+
 class TapeIndex:
     """A structural index over the materials of an ENDF tape.
 
@@ -579,6 +731,52 @@ class TapeIndex:
         materials, tpid = _scan(_iter_line_records(lines))
         return cls(materials, tpid[0], tpid[1], tpid[2], source=source)
 
+    def matches_file(self, path=None):
+        """Whether a file still has the size and mtime recorded at index time.
+
+        ``path`` defaults to :attr:`source`. An index not built with
+        :meth:`from_file` records no fingerprint and matches no file.
+        """
+        path = self.source if path is None else os.fspath(path)
+        if path is None or self.source_size is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return (
+            stat.st_size == self.source_size
+            and stat.st_mtime_ns == self.source_mtime_ns
+        )
+
+    def save(self, path):
+        """Persist the index to the file ``path``.
+
+        The index can then be reloaded with :meth:`load` instead of
+        scanning the tape again. The file is a JSON document.
+        """
+        _write_index_file(path, self, {})
+
+    @classmethod
+    def load(cls, path, *, source=None, verify=True):
+        """Load an index persisted with :meth:`save`.
+
+        With ``verify`` (the default) the index is checked against the
+        tape it describes -- ``source``, or the path it was built from
+        -- and :class:`StaleSourceError` is raised if that file's size
+        or mtime changed since it was indexed, and :class:`ValueError`
+        if ``path`` is not a readable index file. Index files written by
+        :meth:`EndfFile.save_index` can be loaded too.
+        """
+        index, _ = _read_index_file(path)
+        if verify and not index.matches_file(source):
+            raise StaleSourceError(
+                f"the tape index in {os.fspath(path)!r} does not match the "
+                f"file {source or index.source!r}; the file changed after it "
+                "was indexed"
+            )
+        return index
+
     def by_mat(self, mat):
         """Return the positions of all materials with this MAT number."""
         return list(self._by_mat.get(mat, ()))
@@ -0,0 +1,159 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Crash-safe in-place patching of a tape file.
+
+:meth:`EndfFile.export` with ``inplace=True`` overwrites byte ranges of
+the source file directly. The patches are first written to a journal
+file next to the tape (``<tape>.endfparserpy-journal``) and flushed to
+disk; only then is the tape itself patched and flushed, and finally the
+journal is removed. A crash therefore leaves either
+
+- no journal: the tape is either untouched or fully patched;
+- an incomplete journal (its checksum does not match): the tape is
+  still untouched, and the journal is simply discarded;
+- a complete journal: the tape may be partially patched, and is
+  completed by writing the journalled bytes again.
+
+:func:`recover_journal` performs this recovery; :class:`EndfFile` calls
+it when a tape is opened.
+"""
+
+import hashlib
+import json
+import os
+
+from .errors import StaleSourceError
+
+JOURNAL_SUFFIX = ".endfparserpy-journal"
+
+_MAGIC = b"endf-parserpy patch journal 1\n"
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+def journal_path(path):
+    """Return the path of the journal belonging to the tape ``path``."""
+    return os.fspath(path) + JOURNAL_SUFFIX
+
+
+def _fsync_directory(path):
+    """Flush the directory entry of ``path`` to disk, where supported."""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        # directories cannot be opened on every platform (e.g. Windows)
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_journal(path, size, patches):
+    header = {
+        "size": size,
+        "patches": [[offset, len(data)] for offset, data in patches],
+    }
+    body = b"".join(
+        [_MAGIC, json.dumps(header).encode("ascii"), b"\n"]
+        + [data for _, data in patches]
+    )
+    with open(journal_path(path), "wb") as fh:
+        fh.write(body)
+        fh.write(hashlib.sha256(body).digest())
+        fh.flush()
+        os.fsync(fh.fileno())
+    _fsync_directory(path)
+
+
+def _read_journal(path):
+    """Return ``(size, patches)`` of a complete journal, else ``None``."""
+    with open(journal_path(path), "rb") as fh:
+        content = fh.read()
+    body, digest = content[:-_DIGEST_SIZE], content[-_DIGEST_SIZE:]
+    if not body.startswith(_MAGIC) or hashlib.sha256(body).digest() != digest:
+        return None
+    header_end = body.index(b"\n", len(_MAGIC))
+    header = json.loads(body[len(_MAGIC) : header_end])
+    patches = []
+    pos = header_end + 1
+    for offset, length in header["patches"]:
+        patches.append((offset, body[pos : pos + length]))
+        pos += length
+    return header["size"], patches
+
+
+def _remove_journal(path):
+    os.remove(journal_path(path))
+    _fsync_directory(path)
+
+
+def _apply_patches(path, patches):
+    with open(path, "r+b") as fh:
+        for offset, data in patches:
+            fh.seek(offset)
+            fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+def patch_file(path, patches):
+    """Overwrite byte ranges of the file ``path`` through a journal.
+
+    ``patches`` is a list of ``(offset, data)`` pairs; every range must
+    lie within the file, whose size is left unchanged. Returns once the
+    patched file has been flushed to disk and the journal removed.
+    """
+    path = os.fspath(path)
+    size = os.path.getsize(path)
+    for offset, data in patches:
+        if offset < 0 or offset + len(data) > size:
+            raise ValueError(
+                f"the patch of {len(data)} bytes at offset {offset} does not "
+                f"lie within the file {path!r} of {size} bytes"
+            )
+    _write_journal(path, size, patches)
+    _apply_patches(path, patches)
+    _remove_journal(path)
+
+
+def recover_journal(path):
+    """Complete or discard an interrupted in-place patch of ``path``.
+
+    Does nothing if the tape has no journal. A complete journal is
+    replayed onto the tape, an incomplete one (written only in part
+    before a crash, so the tape was not yet touched) is discarded;
+    either way the journal is removed. Returns ``True`` if patches were
+    replayed.
+
+    Raises :class:`StaleSourceError` if a complete journal does not
+    match the size of the tape, which means the tape was replaced after
+    the journal was written; the journal is then left in place.
+    """
+    path = os.fspath(path)
+    if not os.path.exists(journal_path(path)):
+        return False
+    journal = _read_journal(path)
+    if journal is None:
+        _remove_journal(path)
+        return False
+    size, patches = journal
+    if os.path.getsize(path) != size:
+        raise StaleSourceError(
+            f"the patch journal {journal_path(path)!r} does not match the "
+            f"size of {path!r}; remove the journal if the tape was replaced "
+            "on purpose"
+        )
+    _apply_patches(path, patches)
+    _remove_journal(path)
+    return True
@@ -0,0 +1,200 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Streaming JSON export and import of multi-material tapes.
+
+A tape is stored in JSON the way ``endf-cli convert`` has always
+written it: a single material as a JSON object, several materials as a
+JSON array of material objects. JSON Lines, with one material object per
+line, is supported as well. Both directions work one material at a
+time, so converting a tape needs memory bounded by the largest single
+material rather than by the whole tape::
+
+    materials = iter_parse_tape_file("tape.endf")
+    write_json_tape_file(materials, "tape.json")
+    write_tape_file(iter_json_tape_file("tape.json"), "copy.endf")
+"""
+
+import json
+import os
+from itertools import chain
+
+from ..utils.user_tools import sanitize_fieldname_types
+
+# the initial read size of iter_json_tape_file; the buffer grows as
+# needed to hold a whole material
+_READ_CHUNK_SIZE = 1 << 16
+
+_NOTHING = object()
+
+
+def write_json_tape_file(materials, path, *, lines=False, indent=None, overwrite=False):
+    """Write materials to a JSON or JSON Lines file, one at a time.
+
+    Parameters
+    ----------
+    materials : Iterable[dict]
+        The parsed materials, e.g. from :func:`iter_parse_tape_file`.
+        The iterable is consumed lazily, so when it is a generator the
+        whole tape is never held in memory at once.
+    path : str or os.PathLike
+        The destination file.
+    lines : bool
+        If true, JSON Lines is written: one material object per line.
+        Otherwise a single material is written as a JSON object and
+        any other number of materials as a JSON array, the same text
+        that :func:`json.dump` produces for it.
+    indent : int or str, optional
+        Passed to :func:`json.dump`; not supported with ``lines=True``.
+    overwrite : bool
+        An existing file is only overwritten when ``overwrite=True``.
+    """
+    path = os.fspath(path)
+    if lines and indent is not None:
+        raise ValueError("indent cannot be used with lines=True")
+    if os.path.exists(path) and not overwrite:
+        raise FileExistsError(
+            f"file {path} already exists; pass overwrite=True to replace it"
+        )
+    materials = iter(materials)
+    with open(path, "w") as fh:
+        if lines:
+            for material in materials:
+                json.dump(material, fh)
+                fh.write("\n")
+            return
+        first = next(materials, _NOTHING)
+        second = _NOTHING if first is _NOTHING else next(materials, _NOTHING)
+        if second is _NOTHING:
+            # a single material is a JSON object (and an empty tape an
+            # empty array), so the json -> endf direction can tell a
+            # single material from a tape by the container type
+            json.dump([] if first is _NOTHING else first, fh, indent=indent)
+            return
+        _write_json_array(fh, (first, second), materials, indent)
+
+
+def _write_json_array(fh, head, rest, indent):
+    """Write the elements of ``head`` and then ``rest`` as a JSON array.
+
+    The text is the one :func:`json.dump` writes for the whole list,
+    but only one element is encoded at a time.
+    """
+    if indent is None:
+        separator, prefix, opening, closing = ", ", "", "[", "]"
+        encoder = json.JSONEncoder()
+    else:
+        if not isinstance(indent, str):
+            indent = " " * indent
+        separator, prefix, opening, closing = ",\n", indent, "[\n", "\n]"
+        encoder = json.JSONEncoder(indent=indent)
+    fh.write(opening)
+    for i, material in enumerate(chain(head, rest)):
+        if i > 0:
+            fh.write(separator)
+        fh.write(prefix)
+        # newlines only occur between tokens (a newline in a string is
+        # escaped), so nesting the element one level is a replacement
+        for chunk in encoder.iterencode(material):
+            fh.write(chunk.replace("\n", "\n" + prefix) if prefix else chunk)
+    fh.write(closing)
+
+
+def iter_json_tape_file(path):
+    """Read the materials of a JSON or JSON Lines file, one at a time.
+
+    Accepts a JSON array of material objects, a single material object
+    and JSON Lines (one material object per line), as written by
+    :func:`write_json_tape_file`. Only one material is decoded and held
+    in memory at a time; the string keys of each material that stand
+    for numbers are converted to :class:`int` (see
+    :func:`~endf_parserpy.sanitize_fieldname_types`), so the materials
+    can be passed straight to :func:`write_tape_file`.
+
+    Raises :class:`json.JSONDecodeError` on malformed input.
+    """
+    path = os.fspath(path)
+    with open(path, "r") as fh:
+        for material in _JsonValueReader(fh).materials():
+            sanitize_fieldname_types(material)
+            yield material
+
+
+class _JsonValueReader:
+    """Decode the top-level JSON values of a text stream incrementally."""
+
+    def __init__(self, fh):
+        self._fh = fh
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size):
+        data = self._fh.read(size)
+        if not data:
+            self._eof = True
+        self._buf = self._buf[self._pos :] + data
+        self._pos = 0
+
+    def _peek(self):
+        """Return the next non-whitespace character, or ``""`` at the end."""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            self._pos = pos
+            if pos < len(buf) or self._eof:
+                return buf[pos : pos + 1]
+            self._fill(_READ_CHUNK_SIZE)
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # a value that ends with the buffer (e.g. a number) may
+                # continue in the part not yet read
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            # read as much again as is buffered, so a large value is
+            # re-scanned only a logarithmic number of times
+            self._fill(max(_READ_CHUNK_SIZE, len(self._buf) - self._pos))
+
+    def _expect(self, chars, what):
+        char = self._peek()
+        if char == "" or char not in chars:
+            raise json.JSONDecodeError(f"Expecting {what}", self._buf, self._pos)
+        self._pos += 1
+        return char
+
+    def materials(self):
+        """Yield the elements of a top-level array, or each top-level value."""
+        if self._peek() != "[":
+            while self._peek() != "":
+                yield self._value()
+            return
+        self._pos += 1
+        if self._peek() == "]":
+            self._pos += 1
+        else:
+            while True:
+                yield self._value()
+                if self._expect(",]", "',' delimiter") == "]":
+                    break
+        if self._peek() != "":
+            raise json.JSONDecodeError("Extra data", self._buf, self._pos)
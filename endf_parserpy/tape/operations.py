@@ -3,7 +3,7 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2026/05/15
-# Last modified:   2026/05/18
+# Last modified:   2026/10/19
 # License:         MIT
 # Copyright (c) 2026 International Atomic Energy Agency (IAEA)
 #
@@ -224,6 +224,72 @@ def parse_tape_file(path, *, parser=None, exclude=None, include=None, on_error="
 # --------------------------------------------------------------------------
 
 
+# the chunk size of the buffered fallback of _copy_byte_range
+_COPY_CHUNK_SIZE = 1 << 20
+
+
+class _SourceSpan:
+    """A material copied verbatim from a byte range of a file.
+
+    Produced by :meth:`EndfFile.export` for a material that was not
+    edited; :func:`write_tape_file` copies the ``length`` bytes at
+    ``offset`` of the file ``path`` straight into the output, without
+    decoding them. The span holds the material's records through its
+    MEND record. ``tpid_line`` is the tape head written if the span
+    opens the tape.
+    """
+
+    __slots__ = ("path", "offset", "length", "tpid_line")
+
+    def __init__(self, path, offset, length, tpid_line):
+        self.path = path
+        self.offset = offset
+        self.length = length
+        self.tpid_line = tpid_line
+
+
+def _copy_byte_range(src_fd, dst_fd, offset, length):
+    """Append ``length`` bytes at ``offset`` of ``src_fd`` to ``dst_fd``.
+
+    The bytes are copied in the kernel where possible -- with
+    :func:`os.copy_file_range`, else :func:`os.sendfile` -- and
+    otherwise through a buffer of :data:`_COPY_CHUNK_SIZE` bytes. The
+    copy is written at, and advances, the current position of
+    ``dst_fd``. Raises :class:`EOFError` if the source ends early.
+    """
+    end = offset + length
+    for name in ("copy_file_range", "sendfile"):
+        copy = getattr(os, name, None)
+        if copy is None:
+            continue
+        try:
+            while offset < end:
+                if name == "copy_file_range":
+                    count = copy(src_fd, dst_fd, end - offset, offset)
+                else:
+                    count = copy(dst_fd, src_fd, offset, end - offset)
+                if count == 0:
+                    break
+                offset += count
+        except OSError:
+            # not supported for this pair of files (e.g. across file
+            # systems or on an older kernel)
+            pass
+        if offset == end:
+            return
+        # carry on with the next method from where this one stopped;
+        # the buffered copy reports a source that ended early
+    while offset < end:
+        os.lseek(src_fd, offset, os.SEEK_SET)
+        data = os.read(src_fd, min(_COPY_CHUNK_SIZE, end - offset))
+        if not data:
+            raise EOFError("the source file ended within the copied range")
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dst_fd, view) :]
+        offset += len(data)
+
+
 def _material_lines(material, parser, exclude, include):
     # A material given as a list of ENDF-6 lines, or as a FailedMaterial,
     # is written verbatim -- no parse, no render. A parsed material
@@ -254,6 +320,13 @@ def _iter_tape_chunks(materials, parser, exclude, include):
     tpid_emitted = False
     final_tend = None
     for material in materials:
+        if isinstance(material, _SourceSpan):
+            # copied verbatim by write_tape_file
+            if not tpid_emitted:
+                yield material.tpid_line + "\n"
+                tpid_emitted = True
+            yield material
+            continue
         lines = _material_lines(material, parser, exclude, include)
         lines, tend = _strip_trailing_tend(lines)
         if tend is not None:
@@ -323,8 +396,26 @@ def write_tape_file(
         raise FileExistsError(
             f"file {path} already exists; pass overwrite=True to replace it"
         )
-    # newline="" disables newline translation so the tape is written with
-    # LF terminators on every platform (text mode would emit CRLF on Windows)
-    with open(path, "w", newline="") as fh:
-        for chunk in _iter_tape_chunks(materials, parser, exclude, include):
-            fh.write(chunk)
+    sources = {}
+    try:
+        # newline="" disables newline translation so the tape is written
+        # with LF terminators on every platform (text mode would emit
+        # CRLF on Windows)
+        with open(path, "w", newline="") as fh:
+            for chunk in _iter_tape_chunks(materials, parser, exclude, include):
+                if not isinstance(chunk, _SourceSpan):
+                    fh.write(chunk)
+                    continue
+                if chunk.path not in sources:
+                    sources[chunk.path] = os.open(
+                        chunk.path, os.O_RDONLY | getattr(os, "O_BINARY", 0)
+                    )
+                # the span is appended at the descriptor's position, so
+                # the text written so far must reach the file first
+                fh.flush()
+                _copy_byte_range(
+                    sources[chunk.path], fh.fileno(), chunk.offset, chunk.length
+                )
+    finally:
+        for fd in sources.values():
+            os.close(fd)
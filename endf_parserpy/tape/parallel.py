@@ -0,0 +1,163 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Parallel section parsing and rendering for :class:`EndfFile`.
+
+Neither parsing engine releases the GIL while it parses, so parsing is
+fanned out to a process pool: the raw text of a section is sent to a
+worker, which wraps it in a minimal single-material tape, parses it and
+sends the parsed section back. Rendering edited sections for
+:meth:`EndfFile.export` works the same way in the other direction. Each
+worker receives the parser (pickled by recipe, see
+:class:`EndfParserBase`) and the tape's TPID record once, through the
+pool initializer, rather than with every task.
+"""
+
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .records import _control_line, TEND_LINE
+
+
+def _parse_section_lines(parser, tpid_line, mat, mf, mt, raw_lines, max_records=None):
+    """Parse the raw lines of one section and return the section.
+
+    The section is wrapped in a minimal single-material tape so the
+    ordinary parser can be used unchanged. A section without a recipe
+    comes back as a list of strings. Parse errors propagate. With
+    ``max_records`` only the first records are parsed (see
+    :meth:`EndfParserPy.parse`).
+    """
+    mini_tape = (
+        [tpid_line]
+        + list(raw_lines)
+        + [
+            _control_line(mat, 0, 0),  # FEND
+            _control_line(0, 0, 0),  # MEND
+            TEND_LINE,  # TEND
+        ]
+    )
+    if max_records is None:
+        return parser.parse(mini_tape)[mf][mt]
+    return parser.parse(mini_tape, max_records=max_records)[mf][mt]
+
+
+def _render_section_lines(parser, tpid_line, mf, mt, section):
+    """Render one parsed section and return its lines.
+
+    The section is written as a minimal single-material tape; the lines
+    returned are its records through its SEND record, with the column
+    76-80 sequence numbers the writer gives them. Render errors
+    propagate.
+    """
+    lines = parser.write({0: {0: [tpid_line]}, mf: {mt: section}})
+    # drop the TPID, and the FEND, MEND and TEND records
+    return lines[1:-3]
+
+
+# per-process state of a pool worker, set by _init_worker
+_worker_parser = None
+_worker_tpid_line = None
+
+
+def _init_worker(parser, tpid_line):
+    global _worker_parser, _worker_tpid_line
+    _worker_parser = parser
+    _worker_tpid_line = tpid_line
+
+
+def _parse_task(task):
+    """Pool task: parse ``(position, mat, mf, mt, raw_lines)`` in a worker.
+
+    Returns ``(True, section)`` or ``(False, exception)``. An exception
+    that cannot be pickled back to the parent is replaced by a
+    :class:`RuntimeError` carrying its text.
+    """
+    _, mat, mf, mt, raw_lines = task
+    try:
+        return True, _parse_section_lines(
+            _worker_parser, _worker_tpid_line, mat, mf, mt, raw_lines
+        )
+    except Exception as exc:
+        try:
+            pickle.dumps(exc)
+        except Exception:
+            exc = RuntimeError(f"{type(exc).__name__}: {exc}")
+        return False, exc
+
+
+def _render_task(task):
+    """Pool task: render ``(position, mf, mt, section)`` in a worker.
+
+    Returns ``(True, lines)`` or ``(False, exception)``, like
+    :func:`_parse_task`.
+    """
+    _, mf, mt, section = task
+    try:
+        return True, _render_section_lines(
+            _worker_parser, _worker_tpid_line, mf, mt, section
+        )
+    except Exception as exc:
+        try:
+            pickle.dumps(exc)
+        except Exception:
+            exc = RuntimeError(f"{type(exc).__name__}: {exc}")
+        return False, exc
+
+
+def _ordered_map(executor, func, items, window):
+    """Like ``executor.map`` but with at most ``window`` tasks in flight.
+
+    ``(item, result)`` pairs are yielded in the order of ``items``,
+    which is consumed lazily, so only a bounded number of tasks (and
+    their arguments) is held in memory at a time.
+    """
+    pending = deque()
+    for item in items:
+        pending.append((item, executor.submit(func, item)))
+        if len(pending) >= window:
+            item, future = pending.popleft()
+            yield item, future.result()
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+
+
+def parse_sections_parallel(parser, tpid_line, tasks, workers):
+    """Parse sections in a process pool, yielding results in task order.
+
+    ``tasks`` is an iterable of ``(position, mat, mf, mt, raw_lines)``;
+    for each task ``(task, (True, section))`` or
+    ``(task, (False, exception))`` is yielded.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(parser, tpid_line),
+    ) as executor:
+        yield from _ordered_map(executor, _parse_task, tasks, 4 * workers)
+
+
+def render_sections_parallel(parser, tpid_line, tasks, workers):
+    """Render sections in a process pool, yielding results in task order.
+
+    ``tasks`` is an iterable of ``(position, mf, mt, section)``; for
+    each task ``(task, (True, lines))`` or ``(task, (False, exception))``
+    is yielded, where ``lines`` are as returned by
+    :func:`_render_section_lines`.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(parser, tpid_line),
+    ) as executor:
+        yield from _ordered_map(executor, _render_task, tasks, 4 * workers)
@@ -0,0 +1,273 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Query planning for :meth:`EndfFile.query`.
+
+A query reads one field of one section in every material. The planner
+picks the cheapest of three ways to answer it:
+
+``"index"``
+    A named secondary index built over exactly that field already holds
+    the value of every material, so no section is read at all.
+``"header"``
+    The field is set in one of the leading records of the section: the
+    HEAD record and the records that follow it unconditionally, up to
+    and including the control line of the first TAB1, TAB2 or LIST
+    record (e.g. ``ZA``, ``AWR``, ``TEMP`` of MF1/MT451 or ``QM``,
+    ``QI`` of MF3). The slot of the field is read off the section's
+    recipe, so only the first lines of each section are read and
+    decoded, the same way the parser decodes them.
+``"parse"``
+    Otherwise every addressed section is parsed in full.
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+
+from ..endf_recipes import get_recipe_dict
+from ..interpreter.fortran_utils import fortstr2float, read_fort_int
+
+# the header slots of each record type that may lead a section; the
+# interpolation-table counts (NR, NP) of a TAB1/TAB2 record are not
+# stored as fields
+_LEADING_SLOTS = {
+    "HEAD": range(6),
+    "CONT": range(6),
+    "TAB1": range(4),
+    "TAB2": (0, 1, 2, 3, 5),
+    "LIST": range(6),
+}
+
+_RECORD_START = re.compile(r"\s*\[")
+_RECORD_TYPE = re.compile(r"\s*([A-Z0-9]+)")
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*\Z")
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """How :meth:`EndfFile.query` answers a section path.
+
+    Returned by :meth:`EndfFile.explain`; ``str()`` gives a one-line
+    description.
+
+    Attributes
+    ----------
+    section_path : str
+        The queried section path.
+    strategy : str
+        ``"index"``, ``"header"`` or ``"parse"``.
+    index_name : str or None
+        The secondary index answering an ``"index"`` plan.
+    records : int or None
+        The number of leading records read per section by a
+        ``"header"`` plan.
+    """
+
+    section_path: str
+    strategy: str
+    index_name: Optional[str] = None
+    records: Optional[int] = None
+    # (record, slot, read_opts) of a "header" plan
+    _header: Optional[tuple] = field(default=None, repr=False, compare=False)
+
+    def __str__(self):
+        if self.strategy == "index":
+            how = f"answered from the secondary index {self.index_name!r}"
+        elif self.strategy == "header":
+            how = (
+                f"read the first {self.records} record(s) of the section "
+                "of each material"
+            )
+        else:
+            how = "parse the full section of each material"
+        return f"query {self.section_path!r}: {how}"
+
+
+def _closing_bracket(text, start):
+    """Return the index of the ``]`` matching the ``[`` at ``start``."""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == "[":
+            depth += 1
+        elif text[i] == "]":
+            depth -= 1
+            if depth == 0:
+                return i
+    return None
+
+
+@lru_cache(maxsize=None)
+def _leading_records(recipe):
+    """Return the header slots of the leading records of a recipe.
+
+    The leading records are those the recipe starts with
+    unconditionally; scanning stops at the first statement that is not
+    a HEAD or CONT record (a loop, a branch, a TEXT record, a named
+    block, ...), and after the control line of a TAB1, TAB2 or LIST
+    record. Returns a tuple with one tuple per leading record, which
+    holds the variable name in each of its header slots, or ``None``
+    for a slot that holds a number, an expression or, for a TAB1 or
+    TAB2 record, a table count.
+    """
+    text = "\n".join(line.split("#", 1)[0] for line in recipe.splitlines())
+    records = []
+    pos = 0
+    while True:
+        start = _RECORD_START.match(text, pos)
+        if start is None:
+            break
+        end = _closing_bracket(text, start.end() - 1)
+        if end is None:
+            break
+        kind = _RECORD_TYPE.match(text, end + 1)
+        if kind is None:
+            break
+        rtype = kind.group(1)
+        if rtype not in _LEADING_SLOTS:
+            break
+        parts = text[start.end() : end].split("/")
+        slots = [s.strip() for s in parts[1].split(",")] if len(parts) > 1 else []
+        if len(slots) < 6:
+            break
+        records.append(
+            tuple(
+                name if i in _LEADING_SLOTS[rtype] and _IDENTIFIER.match(name) else None
+                for i, name in enumerate(slots[:6])
+            )
+        )
+        if rtype not in ("HEAD", "CONT"):
+            break
+        pos = kind.end()
+    return tuple(records)
+
+
+@lru_cache(maxsize=None)
+def _leading_fields(recipe):
+    """Map the fields set by the leading records of a recipe to their slots.
+
+    Returns a dict ``{name: (record, slot)}`` for every field that a
+    leading record (see :func:`_leading_records`) assigns to one of its
+    header slots; a field set twice is located by its first occurrence.
+    """
+    fields = {}
+    for record, names in enumerate(_leading_records(recipe)):
+        for slot, name in enumerate(names):
+            if name is not None and name not in fields:
+                fields[name] = (record, slot)
+    return fields
+
+
+def _section_recipe(parser, mf, mt):
+    """Return the recipe string the parser uses for ``MF/MT``, or ``None``."""
+    kwargs = getattr(parser, "_init_kwargs", None)
+    if kwargs is None:
+        return None
+    recipes = kwargs.get("recipes")
+    if recipes is None:
+        try:
+            recipes = get_recipe_dict(kwargs.get("endf_format", "endf6-ext"))
+        except TypeError:
+            return None
+    mf_recipes = recipes.get(mf)
+    if isinstance(mf_recipes, Mapping):
+        mf_recipes = mf_recipes.get(mt, mf_recipes.get(-1))
+    return mf_recipes if isinstance(mf_recipes, str) else None
+
+
+def _read_options(parser):
+    """The number-reading options of a parser, or ``None`` if unsupported.
+
+    Header fields are only decoded outside the parser when it returns
+    plain numbers; a parser that preserves value strings or uses custom
+    parsing functions is always run in full.
+    """
+    kwargs = getattr(parser, "_init_kwargs", None)
+    if kwargs is None:
+        return None
+    if (
+        kwargs.get("preserve_value_strings", False)
+        or kwargs.get("parsing_funs") is not None
+    ):
+        return None
+    return {
+        "accept_spaces": kwargs.get("accept_spaces", True),
+        "accept_nan_inf": kwargs.get("accept_nan_inf", True),
+        "ignore_blank_lines": kwargs.get("ignore_blank_lines", False),
+        "width": kwargs.get("width", 11),
+    }
+
+
+def _field_name(subpath):
+    """The field name of a one-element path, else ``None``."""
+    if subpath is None or len(subpath) != 1:
+        return None
+    name = str(subpath)
+    return name if _IDENTIFIER.match(name) else None
+
+
+def peek_records(parser, mf, mt, subpath):
+    """The number of records to read for :meth:`EndfFile.peek`.
+
+    For a field set by a leading record of the section's recipe, the
+    records up to that one; otherwise all leading records, and at
+    least one.
+    """
+    recipe = _section_recipe(parser, mf, mt)
+    if recipe is None:
+        return 1
+    location = _leading_fields(recipe).get(_field_name(subpath))
+    if location is not None:
+        return location[0] + 1
+    return max(1, len(_leading_records(recipe)))
+
+
+def header_slot(parser, mf, mt, subpath):
+    """Locate a header field of ``MF/MT`` for a ``"header"`` plan.
+
+    Returns ``(record, slot, read_opts)`` if ``subpath`` names a field
+    set by the leading records of the section's recipe, else ``None``.
+    """
+    name = _field_name(subpath)
+    if name is None:
+        return None
+    read_opts = _read_options(parser)
+    if read_opts is None:
+        return None
+    recipe = _section_recipe(parser, mf, mt)
+    if recipe is None:
+        return None
+    location = _leading_fields(recipe).get(name)
+    if location is None:
+        return None
+    return location + (read_opts,)
+
+
+def decode_header_field(lines, header):
+    """Decode the field located by :func:`header_slot` from the first lines.
+
+    C1 and C2 are read as numbers, the other slots as integers, exactly
+    as the parser reads a CONT record; blank lines are skipped if the
+    parser ignores them. Raises if the line is missing or blank, or the
+    field cannot be read.
+    """
+    record, slot, read_opts = header
+    if read_opts["ignore_blank_lines"]:
+        lines = [line for line in lines if line.strip() != ""]
+    elif any(line.strip() == "" for line in lines[: record + 1]):
+        raise ValueError("blank line among the leading records")
+    width = read_opts["width"]
+    text = lines[record][slot * width : (slot + 1) * width]
+    if slot < 2:
+        return fortstr2float(text, read_opts=read_opts)
+    return read_fort_int(text)
@@ -0,0 +1,118 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Named secondary indexes of an :class:`EndfFile`.
+
+A :class:`_SecondaryIndex` stores the index key of every material it
+covers per :class:`_MaterialSlot`, not per tape position. A slot keeps
+its identity when materials are appended, removed or reordered, so such
+a structural edit needs no re-parsing: the ``{key: [positions]}``
+mapping is re-derived from the current material order on demand. When a
+section that the index covers is edited, only the key of that one
+material is recomputed.
+
+For persistence (see :meth:`EndfFile.save_index`) an index is stored as
+its section path(s) and the keys of the on-disk materials, keyed by
+their position in the file.
+"""
+
+from .address import parse_index_spec
+
+
+class _SecondaryIndex:
+    """The per-material keys of one named secondary index.
+
+    Parameters
+    ----------
+    spec : str or list[str]
+        The section path(s) the index was built from, as passed to
+        :meth:`EndfFile.build_index`.
+    specs : list[tuple]
+        The parsed ``(mf, mt, subpath)`` triples.
+    is_multi : bool
+        Whether the keys are tuples (a composite index).
+    """
+
+    @classmethod
+    def from_stored(cls, stored, slots):
+        """Rebuild an index from its stored form for unedited ``slots``."""
+        specs, is_multi = parse_index_spec(stored["spec"])
+        index = cls(stored["spec"], specs, is_multi)
+        keys = stored["keys"]
+        for slot in slots:
+            if slot.original_position in keys:
+                index._keys[slot] = keys[slot.original_position]
+        return index
+
+    def __init__(self, spec, specs, is_multi):
+        self.spec = spec
+        self.specs = specs
+        self.is_multi = is_multi
+        self.sections = frozenset((mf, mt) for mf, mt, _ in specs)
+        self._keys = {}  # slot -> key
+        self._mapping = None
+
+    def covers(self, mf, mt):
+        """Whether the index reads the ``MF/MT`` section."""
+        return (mf, mt) in self.sections
+
+    def make_key(self, values):
+        """The key for the indexed field values of a material.
+
+        Raises :class:`TypeError` if the key is not hashable.
+        """
+        key = tuple(values) if self.is_multi else values[0]
+        hash(key)
+        return key
+
+    def set_values(self, slot, values):
+        """Record the key of a material from its indexed field values.
+
+        ``values`` holds one value per section path, or is ``None`` if
+        the material cannot be indexed, in which case it is dropped.
+        Raises :class:`TypeError` if the key is not hashable.
+        """
+        if values is None:
+            self.drop(slot)
+            return
+        key = self.make_key(values)
+        if slot not in self._keys or self._keys[slot] != key:
+            self._keys[slot] = key
+            self._mapping = None
+
+    def key_of(self, slot):
+        """Return ``(True, key)`` for an indexed material, else ``(False, None)``."""
+        if slot in self._keys:
+            return True, self._keys[slot]
+        return False, None
+
+    def drop(self, slot):
+        """Forget a material, e.g. because it was removed from the tape."""
+        if self._keys.pop(slot, _MISSING) is not _MISSING:
+            self._mapping = None
+
+    def reordered(self):
+        """Note that the material order changed."""
+        self._mapping = None
+
+    def mapping(self, slots):
+        """The ``{key: [positions]}`` dict for the material order ``slots``."""
+        if self._mapping is None:
+            mapping = {}
+            for position, slot in enumerate(slots):
+                key = self._keys.get(slot, _MISSING)
+                if key is not _MISSING:
+                    mapping.setdefault(key, []).append(position)
+            self._mapping = mapping
+        return self._mapping
+
+
+_MISSING = object()
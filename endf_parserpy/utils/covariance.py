@@ -0,0 +1,520 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Covariance matrices assembled from parsed covariance sections.
+
+The parsed covariance data of MF31, MF33 and MF35 and of the MF33
+sections written by the ERRORR module of NJOY are nested dicts or lists
+with one Python object per matrix element. The functions of this module
+assemble them into NumPy arrays, with vectorized operations over the
+blocks of a section:
+
+- :func:`covariance_matrix` evaluates a subsection of an ENDF-6 MF31 or
+  MF33 section (the covariance between the reactions ``MT`` and
+  ``MT1``), or a subsection of an MF35 section, on a grid of energy
+  groups;
+- :func:`errorr_covariance_matrix` assembles a subsection of a group
+  covariance section of an ERRORR tape;
+- :func:`lb5_subsection` and :func:`errorr_subsection` turn a matrix
+  back into a parsed subsection that can be written.
+
+Both functions that assemble a matrix return a :class:`CooMatrix`
+instead of a dense array if ``sparse=True``, which can be converted to
+a :class:`CsrMatrix`; neither requires SciPy. The functions of this
+module require NumPy.
+"""
+
+import warnings
+from collections.abc import Mapping
+from itertools import chain
+
+from .interpolation import _require_numpy, _as_array
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
+
+class CooMatrix:
+    """A sparse matrix in coordinate format, stored in NumPy arrays.
+
+    Duplicate coordinates are summed, as by :meth:`toarray`.
+
+    Parameters
+    ----------
+    rows, cols : array_like
+        The zero-based row and column index of each element.
+    values : array_like
+        The values of the elements.
+    shape : tuple[int, int]
+        The shape of the matrix.
+    """
+
+    def __init__(self, rows, cols, values, shape):
+        _require_numpy()
+        self.rows = _np.asarray(rows, dtype=_np.int64)
+        self.cols = _np.asarray(cols, dtype=_np.int64)
+        self.values = _np.asarray(values, dtype=float)
+        self.shape = tuple(shape)
+        if not self.rows.shape == self.cols.shape == self.values.shape:
+            raise ValueError("rows, cols and values must be of equal length")
+
+    @classmethod
+    def from_dense(cls, matrix):
+        """Return the non-zero elements of a dense matrix."""
+        matrix = _np.asarray(matrix, dtype=float)
+        rows, cols = _np.nonzero(matrix)
+        return cls(rows, cols, matrix[rows, cols], matrix.shape)
+
+    @property
+    def nnz(self):
+        """The number of stored elements."""
+        return len(self.values)
+
+    def toarray(self):
+        """Return the matrix as a dense array."""
+        matrix = _np.zeros(self.shape)
+        _np.add.at(matrix, (self.rows, self.cols), self.values)
+        return matrix
+
+    def tocsr(self):
+        """Return the matrix in compressed sparse row format."""
+        order = _np.lexsort((self.cols, self.rows))
+        counts = _np.bincount(self.rows, minlength=self.shape[0])
+        indptr = _np.concatenate(([0], _np.cumsum(counts)))
+        return CsrMatrix(indptr, self.cols[order], self.values[order], self.shape)
+
+    def __repr__(self):
+        return f"CooMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+class CsrMatrix:
+    """A sparse matrix in compressed sparse row format.
+
+    Parameters
+    ----------
+    indptr : array_like
+        The elements of row ``i`` are at the positions
+        ``indptr[i]:indptr[i+1]`` of ``indices`` and ``values``.
+    indices : array_like
+        The zero-based column index of each element.
+    values : array_like
+        The values of the elements.
+    shape : tuple[int, int]
+        The shape of the matrix.
+    """
+
+    def __init__(self, indptr, indices, values, shape):
+        _require_numpy()
+        self.indptr = _np.asarray(indptr, dtype=_np.int64)
+        self.indices = _np.asarray(indices, dtype=_np.int64)
+        self.values = _np.asarray(values, dtype=float)
+        self.shape = tuple(shape)
+
+    @property
+    def nnz(self):
+        """The number of stored elements."""
+        return len(self.values)
+
+    def _row_indices(self):
+        return _np.repeat(_np.arange(self.shape[0]), _np.diff(self.indptr))
+
+    def toarray(self):
+        """Return the matrix as a dense array."""
+        matrix = _np.zeros(self.shape)
+        _np.add.at(matrix, (self._row_indices(), self.indices), self.values)
+        return matrix
+
+    def dot(self, vector):
+        """Return the product of the matrix with a vector."""
+        vector = _np.asarray(vector, dtype=float)
+        products = self.values * vector[self.indices]
+        return _np.bincount(
+            self._row_indices(), weights=products, minlength=self.shape[0]
+        )
+
+    def __repr__(self):
+        return f"CsrMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+def _items(container):
+    """The elements of a list, or of a dict indexed by counters, in order."""
+    if isinstance(container, Mapping):
+        return [container[key] for key in sorted(container)]
+    return list(container)
+
+
+def _packed_rows(matrix, first_column):
+    """Return ``(rows, firsts, values)`` of a nested row-wise matrix.
+
+    ``matrix`` is a dict of dicts indexed by counters or a list of
+    lists, in which row ``k`` (one-based) holds the consecutive columns
+    starting at ``first_column(k)``; in a dict the column keys tell the
+    first column instead.
+    """
+    rows = []
+    firsts = []
+    values = []
+    if isinstance(matrix, Mapping):
+        for k in sorted(matrix):
+            row = matrix[k]
+            cols = sorted(row)
+            rows.append(k)
+            firsts.append(cols[0] if cols else first_column(k))
+            values.append([row[col] for col in cols])
+    else:
+        for k, row in enumerate(matrix, start=1):
+            rows.append(k)
+            firsts.append(first_column(k))
+            values.append(row)
+    return rows, firsts, values
+
+
+def _coordinates(rows, firsts, values):
+    """Flatten packed rows to one-based coordinate arrays."""
+    lengths = _np.array([len(row) for row in values], dtype=_np.int64)
+    total = int(lengths.sum())
+    starts = _np.cumsum(lengths) - lengths
+    # the column of each element: the first column of its row plus its
+    # offset within the row
+    offsets = _np.arange(total) - _np.repeat(starts, lengths)
+    cols = _np.repeat(_np.asarray(firsts, dtype=_np.int64), lengths) + offsets
+    rows = _np.repeat(_np.asarray(rows, dtype=_np.int64), lengths)
+    data = _np.fromiter(chain.from_iterable(values), dtype=float, count=total)
+    return rows, cols, data
+
+
+def _square_matrix(ne, f, symmetric):
+    """The ``(ne-1) x (ne-1)`` matrix of an LB=5 (or MF35 LB=7) block."""
+    first = (lambda k: k) if symmetric else (lambda k: 1)
+    rows, cols, data = _coordinates(*_packed_rows(f, first))
+    matrix = _np.zeros((ne - 1, ne - 1))
+    matrix[rows - 1, cols - 1] = data
+    if symmetric:
+        matrix[cols - 1, rows - 1] = data
+    return matrix
+
+
+def _group_index(bounds, grid):
+    """The interval of ``bounds`` containing each group of ``grid``.
+
+    A group lies in an interval if its midpoint does; the index is -1
+    for a group outside of ``bounds``.
+    """
+    mid = 0.5 * (grid[:-1] + grid[1:])
+    idx = _np.searchsorted(bounds, mid, side="right") - 1
+    return _np.where((idx >= 0) & (idx < len(bounds) - 1), idx, -1)
+
+
+def _group_values(bounds, values, grid):
+    """The value of the interval of ``bounds`` of each group, else zero."""
+    idx = _group_index(bounds, grid)
+    return idx, _np.where(idx >= 0, values[idx], 0.0)
+
+
+def _same_interval(idx):
+    return (idx[:, None] == idx[None, :]) & (idx[:, None] >= 0)
+
+
+def _lookup(matrix, row_idx, col_idx):
+    """Elements ``matrix[row_idx[i], col_idx[j]]``, zero where an index is -1."""
+    valid = (row_idx[:, None] >= 0) & (col_idx[None, :] >= 0)
+    return _np.where(valid, matrix[row_idx[:, None], col_idx[None, :]], 0.0)
+
+
+def _pairs(ni):
+    """The ``(Ek, Fk)`` and ``(El, Fl)`` tables of an LB=0 to LB=4 block."""
+    return [_as_array(ni.get(key, [])) for key in ("Ek", "Fk", "El", "Fl")]
+
+
+def _ni_contribution(ni, grid):
+    """Return ``(absolute, matrix)`` of an NI-type block on ``grid``."""
+    lb = ni["LB"]
+    if lb in (0, 1, 2, 3, 4):
+        ek, fk, el, fl = _pairs(ni)
+        idx, f = _group_values(ek, fk, grid)
+        if lb in (0, 1):
+            return lb == 0, _np.where(_same_interval(idx), f[:, None], 0.0)
+        if lb == 2:
+            return False, _np.outer(f, f)
+        _, g = _group_values(el, fl, grid)
+        if lb == 3:
+            return False, _np.outer(f, g)
+        return False, _np.where(_same_interval(idx), f[:, None], 0.0) * _np.outer(g, g)
+    if lb == 5 or lb == 7:
+        # the blocks of MF35 (LB=7) are stored as the symmetric LB=5 ones
+        e = _as_array(ni["E"])
+        symmetric = lb == 7 or ni["LS"] == 1
+        matrix = _square_matrix(len(e), ni["F"], symmetric)
+        idx = _group_index(e, grid)
+        return False, _lookup(matrix, idx, idx)
+    if lb == 6:
+        er = _as_array(ni["ER"])
+        ec = _as_array(ni["EC"])
+        rows, cols, data = _coordinates(*_packed_rows(ni["F"], lambda k: 1))
+        matrix = _np.zeros((len(er) - 1, len(ec) - 1))
+        matrix[rows - 1, cols - 1] = data
+        return False, _lookup(matrix, _group_index(er, grid), _group_index(ec, grid))
+    if lb == 8:
+        # uncorrelated variances, which scale with the inverse width of
+        # the group within an interval
+        e = _as_array(ni["E"])
+        idx, f = _group_values(e, _as_array(ni["F"]), grid)
+        width = _np.where(idx >= 0, e[idx + 1] - e[idx], 0.0)
+        return True, _np.diag(f * width / _np.diff(grid))
+    raise ValueError(f"covariance blocks with LB={lb} are not supported")
+
+
+def _blocks(subsection):
+    """The NI-type blocks of an MF31/MF33 subsection or an MF35 subsection."""
+    if "LB" in subsection:
+        return [subsection]
+    return _items(subsection.get("ni_subsection", []))
+
+
+def _warn_nc_subsections(subsection):
+    """Warn that the NC-type subsections of a subsection are left out."""
+    nc = _items(subsection.get("nc_subsection", []))
+    if not nc:
+        return
+    ranges = ", ".join(
+        f"LTY={item['LTY']} from {item.get('E1')} to {item.get('E2')} eV" for item in nc
+    )
+    warnings.warn(
+        f"the matrix does not include the {len(nc)} NC-type subsection(s) "
+        f"({ranges}), which define covariances by those of other reactions",
+        UserWarning,
+    )
+
+
+def _block_energies(ni):
+    keys = ("Ek", "El", "E", "ER", "EC")
+    return [_as_array(ni[key]) for key in keys if key in ni]
+
+
+def covariance_matrix(subsection, energies=None, *, absolute=False, sparse=False):
+    """Assemble the covariance matrix of an ENDF-6 covariance subsection.
+
+    Parameters
+    ----------
+    subsection : dict
+        A subsection of a parsed MF31 or MF33 section, e.g.
+        ``section["subsection"][1]``, holding the covariance between the
+        reactions ``MT`` and ``MT1``; or a subsection of an MF35 section.
+    energies : array_like, optional
+        The boundaries of the energy groups of the matrix, in ascending
+        order. Defaults to the union of the energies of all blocks of
+        the subsection, on which each block is represented exactly.
+    absolute : bool
+        The blocks with LB=0 and LB=8 hold absolute covariances, the
+        others relative ones. The matrix is the sum of the relative
+        blocks, or of the absolute blocks if ``absolute=True``.
+    sparse : bool
+        If true, the matrix is returned as a :class:`CooMatrix`.
+
+    Returns
+    -------
+    energies : numpy.ndarray
+        The group boundaries.
+    matrix : numpy.ndarray or CooMatrix
+        The covariances of the groups, of shape
+        ``(len(energies) - 1, len(energies) - 1)``; a group gets the
+        value of the interval of a block that contains it.
+
+    Warns
+    -----
+    UserWarning
+        If the subsection has NC-type subsections, which define
+        covariances by those of other reactions and are not included
+        in the matrix; the groups in their energy ranges then hold
+        only the contributions of the NI-type blocks.
+
+    Notes
+    -----
+    Blocks with LB=9 are not supported.
+    """
+    _require_numpy()
+    _warn_nc_subsections(subsection)
+    blocks = _blocks(subsection)
+    if energies is None:
+        grids = [e for ni in blocks for e in _block_energies(ni)]
+        energies = _np.unique(_np.concatenate(grids)) if grids else _np.empty(0)
+    else:
+        energies = _np.asarray(energies, dtype=float)
+        if energies.ndim != 1 or _np.any(_np.diff(energies) <= 0):
+            raise ValueError("energies must be one-dimensional and increasing")
+    ngroups = max(len(energies) - 1, 0)
+    matrix = _np.zeros((ngroups, ngroups))
+    if ngroups > 0:
+        for ni in blocks:
+            is_absolute, contribution = _ni_contribution(ni, energies)
+            if is_absolute == absolute:
+                matrix += contribution
+    return energies, (CooMatrix.from_dense(matrix) if sparse else matrix)
+
+
+def errorr_covariance_matrix(subsection, *, sparse=False):
+    """Assemble the group covariance matrix of an ERRORR MF33 subsection.
+
+    Parameters
+    ----------
+    subsection : dict
+        A subsection of an MF33 section parsed with the ``errorr``
+        recipes, e.g. ``section["subsection"][1]``, holding the rows
+        ``COV`` of the covariances between the groups of the reactions
+        ``MT`` and ``MT1``.
+    sparse : bool
+        If true, the matrix is returned as a :class:`CooMatrix` of the
+        stored elements, without a dense array being created.
+
+    Returns
+    -------
+    numpy.ndarray or CooMatrix
+        The matrix, of shape ``(NG, NG)``; the groups are those of the
+        ``EG`` boundaries in MF1/MT451 of the tape.
+    """
+    _require_numpy()
+    ng = subsection["NG"]
+    # row IG[i] holds the columns IG1[i] to IG1[i] + NG1[i] - 1
+    row_of = _items(subsection["IG"])
+    first_of = _items(subsection["IG1"])
+    rows = [_items(row) for row in _items(subsection["COV"])]
+    if not len(row_of) == len(first_of) == len(rows):
+        raise ValueError("the fields IG, IG1 and COV do not match")
+    rows, cols, data = _coordinates(row_of, first_of, rows)
+    if sparse:
+        return CooMatrix(rows - 1, cols - 1, data, (ng, ng))
+    matrix = _np.zeros((ng, ng))
+    matrix[rows - 1, cols - 1] = data
+    return matrix
+
+
+def _nested(rows, array_type):
+    """Return rows of values in the form of the parser's ``array_type``.
+
+    ``rows`` is a list of ``(first_column, values)``, with one-based
+    first columns.
+    """
+    if array_type == "list":
+        return [list(values) for _, values in rows]
+    if array_type == "dict":
+        return {
+            k: {first + j: value for j, value in enumerate(values)}
+            for k, (first, values) in enumerate(rows, start=1)
+        }
+    raise ValueError("array_type must be 'dict' or 'list'")
+
+
+def _counted(values, array_type):
+    values = list(values)
+    if array_type == "list":
+        return values
+    return {i: value for i, value in enumerate(values, start=1)}
+
+
+def lb5_subsection(energies, matrix, *, symmetric=None, array_type="dict"):
+    """Return an LB=5 block of an MF31/MF33 subsection for a matrix.
+
+    This is the inverse of :func:`covariance_matrix` for a matrix of
+    relative covariances.
+
+    Parameters
+    ----------
+    energies : array_like
+        The group boundaries.
+    matrix : array_like or CooMatrix
+        The relative covariances of the groups.
+    symmetric : bool, optional
+        Whether the block is stored as a symmetric matrix (LS=1, only
+        the upper triangle is written). Defaults to whether ``matrix``
+        is symmetric.
+    array_type : {"dict", "list"}
+        The ``array_type`` of the parser that writes the block.
+
+    Returns
+    -------
+    dict
+        The block, an element of ``subsection["ni_subsection"]``.
+    """
+    _require_numpy()
+    if isinstance(matrix, (CooMatrix, CsrMatrix)):
+        matrix = matrix.toarray()
+    energies = _np.asarray(energies, dtype=float)
+    matrix = _np.asarray(matrix, dtype=float)
+    ne = len(energies)
+    if matrix.shape != (ne - 1, ne - 1):
+        raise ValueError("the matrix must have one row and column per group")
+    if symmetric is None:
+        symmetric = bool(_np.array_equal(matrix, matrix.T))
+    if symmetric:
+        rows = [(k + 1, matrix[k, k:].tolist()) for k in range(ne - 1)]
+    else:
+        rows = [(1, matrix[k].tolist()) for k in range(ne - 1)]
+    return {
+        "LS": int(symmetric),
+        "LB": 5,
+        "NE": ne,
+        "E": _counted(energies.tolist(), array_type),
+        "F": _nested(rows, array_type),
+    }
+
+
+def errorr_subsection(matrix, mt1, mat1=0, *, array_type="dict"):
+    """Return an ERRORR MF33 subsection for a group covariance matrix.
+
+    This is the inverse of :func:`errorr_covariance_matrix`. Each row
+    is stored from its first to its last non-zero column; an all-zero
+    row is left out, apart from the last one, which ends the
+    subsection.
+
+    Parameters
+    ----------
+    matrix : array_like or CooMatrix
+        The ``(NG, NG)`` covariances of the groups.
+    mt1, mat1 : int
+        The reaction and material of the columns of the matrix.
+    array_type : {"dict", "list"}
+        The ``array_type`` of the parser that writes the subsection.
+
+    Returns
+    -------
+    dict
+        The subsection, an element of ``section["subsection"]``.
+    """
+    _require_numpy()
+    if isinstance(matrix, (CooMatrix, CsrMatrix)):
+        matrix = matrix.toarray()
+    matrix = _np.asarray(matrix, dtype=float)
+    ng = matrix.shape[0]
+    if matrix.shape != (ng, ng) or ng == 0:
+        raise ValueError("the matrix must be square and not empty")
+    rows = []
+    row_of = []
+    for ig in range(ng):
+        nonzero = _np.flatnonzero(matrix[ig])
+        if len(nonzero) == 0:
+            if ig < ng - 1:
+                continue
+            nonzero = _np.array([ng - 1])
+        first = int(nonzero[0])
+        rows.append((first + 1, matrix[ig, first : nonzero[-1] + 1].tolist()))
+        row_of.append(ig + 1)
+    return {
+        "MAT1": mat1,
+        "MT1": mt1,
+        "NG": ng,
+        "NG1": _counted([len(values) for _, values in rows], array_type),
+        "IG1": _counted([first for first, _ in rows], array_type),
+        "IG": _counted(row_of, array_type),
+        # the columns of a row are counted from its first column
+        "COV": _nested([(1, values) for _, values in rows], array_type),
+    }
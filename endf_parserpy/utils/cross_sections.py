@@ -0,0 +1,156 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Tables of the MF3 cross sections of a material on a common grid.
+
+The reaction cross sections of MF3 are tabulated on energy grids that
+differ from reaction to reaction. :func:`cross_section_table` evaluates
+all of them on one grid, by default the union of their grids, and
+returns a two-dimensional array with one row per reaction::
+
+    mts, energies, table = cross_section_table(material)
+    capture = table[mts.index(102)]
+
+``material`` is a parsed material dict, as produced by
+:func:`~endf_parserpy.parse_tape_file`, or a
+:class:`~endf_parserpy.tape.MaterialView` of an
+:class:`~endf_parserpy.EndfFile`, whose MF3 sections are then parsed
+on access. The functions of this module require NumPy.
+"""
+
+from collections.abc import Mapping
+
+from .interpolation import Tab1Interpolator, _require_numpy, _as_array
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
+
+def _mf3_tables(material, mts):
+    """Return ``{MT: xstable}`` of the parsed MF3 sections of ``material``."""
+    if isinstance(material, Mapping):
+        sections = material.get(3, {})
+        available = sorted(
+            mt for mt, section in sections.items() if isinstance(section, Mapping)
+        )
+        get = sections.__getitem__
+    else:
+        # a MaterialView of an EndfFile: sections are addressed by (MF, MT)
+        available = sorted(mt for mf, mt in material.sections() if mf == 3)
+        get = lambda mt: material[3, mt]  # noqa: E731
+    if mts is None:
+        mts = available
+    else:
+        mts = list(mts)
+        missing = sorted(set(mts).difference(available))
+        if missing:
+            raise KeyError(f"no parsed MF3 section for MT {missing}")
+    return {mt: get(mt)["xstable"] for mt in mts}
+
+
+def _interpolators(tables):
+    interpolators = {}
+    for mt, xstable in tables.items():
+        try:
+            interpolators[mt] = Tab1Interpolator.from_record(xstable, "E", "xs")
+        except ValueError as exc:
+            raise ValueError(f"MF3/MT{mt}: {exc}") from exc
+    return interpolators
+
+
+def _union(grids):
+    """The union of sorted grids, keeping the energies of discontinuities.
+
+    An energy appears twice in the union if it appears more than once
+    in any of the grids, i.e. if a reaction is discontinuous there.
+    """
+    if not grids:
+        return _np.empty(0)
+    distinct, counts = zip(*(_np.unique(grid, return_counts=True) for grid in grids))
+    energies, inverse = _np.unique(_np.concatenate(distinct), return_inverse=True)
+    multiplicity = _np.ones(len(energies), dtype=_np.int64)
+    _np.maximum.at(multiplicity, inverse, _np.minimum(_np.concatenate(counts), 2))
+    return _np.repeat(energies, multiplicity)
+
+
+def unionized_energy_grid(material, mts=None):
+    """Return the sorted union of the MF3 energy grids of a material.
+
+    Parameters
+    ----------
+    material : dict or MaterialView
+        The material, see the module description.
+    mts : Iterable[int], optional
+        The MT numbers of the reactions whose grids are combined.
+        Defaults to all parsed MF3 sections.
+
+    Returns
+    -------
+    numpy.ndarray
+        The distinct energies of the grids, in ascending order. An
+        energy at which a reaction is discontinuous, i.e. which appears
+        twice in its grid, appears twice.
+    """
+    _require_numpy()
+    tables = _mf3_tables(material, mts)
+    return _union([_as_array(xstable["E"]) for xstable in tables.values()])
+
+
+def cross_section_table(material, mts=None, energies=None):
+    """Evaluate the MF3 cross sections of a material on a common grid.
+
+    Each reaction is evaluated by the
+    :class:`~endf_parserpy.utils.interpolation.Tab1Interpolator` of its
+    TAB1 record, with the interpolation laws INT=1 to INT=5, and is zero
+    outside of its tabulated energy range, e.g. below its threshold.
+    Where an energy appears twice in a row in the grid, the first column
+    holds the limits of the cross sections from the left and the second
+    their values to the right, so that a discontinuity is reproduced.
+
+    Parameters
+    ----------
+    material : dict or MaterialView
+        The material, see the module description.
+    mts : Iterable[int], optional
+        The MT numbers of the reactions, in the order of the rows of the
+        table. Defaults to all parsed MF3 sections in ascending order.
+    energies : array_like, optional
+        The energy grid (eV). Defaults to the unionized grid of the
+        selected reactions, see :func:`unionized_energy_grid`.
+
+    Returns
+    -------
+    mts : list[int]
+        The MT numbers of the rows.
+    energies : numpy.ndarray
+        The energy grid, the columns of the table.
+    table : numpy.ndarray
+        The cross sections (barn), of shape ``(len(mts), len(energies))``.
+    """
+    _require_numpy()
+    tables = _mf3_tables(material, mts)
+    interpolators = _interpolators(tables)
+    if energies is None:
+        energies = _union([xs.x for xs in interpolators.values()])
+    else:
+        energies = _np.asarray(energies, dtype=float)
+        if energies.ndim != 1:
+            raise ValueError("energies must be one-dimensional")
+    left = _np.zeros(len(energies), dtype=bool)
+    left[:-1] = energies[:-1] == energies[1:]
+    table = _np.empty((len(interpolators), len(energies)))
+    for row, xs in enumerate(interpolators.values()):
+        table[row] = xs(energies)
+        if left.any():
+            table[row, left] = xs(energies[left], side="left")
+    return list(interpolators), energies, table
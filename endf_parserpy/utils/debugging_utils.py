@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/09/09
-# Last modified:   2025/06/02
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -13,6 +13,16 @@ from collections.abc import MutableMapping, MutableSequence
 from endf_parserpy.utils.math_utils import math_allclose
 from endf_parserpy.utils.accessories import EndfDict
 from .math_utils import EndfFloat
+from .matrices import EndfMatrix, EndfVector
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
+
+# sequences with fewer elements are compared element by element
+_VECTORIZE_MIN_SIZE = 16
 
 
 def smart_is_equal(x, y, atol=1e-8, rtol=1e-6):
@@ -26,6 +36,59 @@ def smart_is_equal(x, y, atol=1e-8, rtol=1e-6):
         return x == y
 
 
+def _numeric_array(seq):
+    """Return the numbers in ``seq`` as a NumPy array.
+
+    ``None`` is returned if ``seq`` is not made up of elements that
+    all compare as :class:`float` or all as :class:`int` in
+    :func:`smart_is_equal`.
+    """
+    if isinstance(seq, _np.ndarray):
+        if seq.ndim > 0 and seq.dtype.kind in "fiu":
+            return seq
+        return None
+    types = set(map(type, seq))
+    if types == {float}:
+        return _np.array(seq, dtype=float)
+    if types <= {float, EndfFloat}:
+        return _np.array([float(v) for v in seq], dtype=float)
+    if types == {int}:
+        try:
+            return _np.array(seq, dtype=_np.int64)
+        except OverflowError:
+            return None
+    return None
+
+
+def _mismatch_positions(seq1, seq2, atol, rtol):
+    """Return the positions at which two numeric sequences differ.
+
+    The sequences are compared with a single vectorized operation
+    that gives the same result as :func:`smart_is_equal` applied
+    to each pair of elements. ``None`` is returned if the sequences
+    do not qualify for this comparison, e.g. because NumPy is not
+    available, they are short, or they contain other objects than
+    numbers of one type.
+    """
+    if _np is None or len(seq1) < _VECTORIZE_MIN_SIZE or len(seq1) != len(seq2):
+        return None
+    arr1 = _numeric_array(seq1)
+    if arr1 is None:
+        return None
+    arr2 = _numeric_array(seq2)
+    if arr2 is None or arr1.dtype != arr2.dtype or arr1.shape != arr2.shape:
+        return None
+    if arr1.dtype == _np.float64:
+        # same formula as math_isclose, which float elements are compared with
+        with _np.errstate(invalid="ignore", over="ignore"):
+            close = _np.abs(arr1 - arr2) <= atol + rtol * _np.abs(arr2)
+    else:
+        close = arr1 == arr2
+    if close.ndim > 1:
+        close = close.all(axis=tuple(range(1, close.ndim)))
+    return _np.flatnonzero(~close).tolist()
+
+
 def compare_objects(
     obj1,
     obj2,
@@ -128,6 +191,10 @@ def _compare_objects(
         obj1 = float(obj1)
     if isinstance(obj2, EndfFloat):
         obj2 = float(obj2)
+    if isinstance(obj1, (EndfMatrix, EndfVector)):
+        obj1 = obj1.to_dict()
+    if isinstance(obj2, (EndfMatrix, EndfVector)):
+        obj2 = obj2.to_dict()
 
     if type(obj1) != type(obj2):
         treat_diff(
@@ -149,6 +216,17 @@ def _compare_objects(
             )
 
         common_keys = set(obj1).intersection(set(obj2))
+        if len(common_keys) == len(obj1) == len(obj2) and all(
+            isinstance(k, int) for k in common_keys
+        ):
+            # an array emulated by a dict, compare its values in one go
+            # and descend only into the elements that differ
+            int_keys = sorted(common_keys)
+            positions = _mismatch_positions(
+                [obj1[k] for k in int_keys], [obj2[k] for k in int_keys], atol, rtol
+            )
+            if positions is not None:
+                common_keys = [int_keys[i] for i in positions]
         common_int_keys = [k for k in common_keys if isinstance(k, int)]
         common_nonint_keys = [k for k in common_keys if not isinstance(k, int)]
         common_int_keys.sort()
@@ -199,7 +277,15 @@ def _compare_objects(
                     ValueError,
                 )
 
-            for i, (subel1, subel2) in enumerate(zip(obj1, obj2)):
+            pairs = enumerate(zip(obj1, obj2))
+            if isinstance(obj1, (list, tuple)) or (
+                _np is not None and isinstance(obj1, _np.ndarray)
+            ):
+                positions = _mismatch_positions(obj1, obj2, atol, rtol)
+                if positions is not None:
+                    pairs = ((i, (obj1[i], obj2[i])) for i in positions)
+
+            for i, (subel1, subel2) in pairs:
                 ret = _compare_objects(
                     subel1,
                     subel2,
@@ -0,0 +1,351 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Flat array representation of MF6 energy-angle distributions.
+
+A parsed MF6 subsection stores the distribution at each incident
+energy ``E[j]`` in its own nested dicts or lists, e.g. the outgoing
+energies ``Ep[j,k]`` and the coefficients ``b[j,k,m]`` of a LAW=1
+distribution. :func:`pack_mf6` replaces these by one-dimensional
+NumPy arrays that concatenate the data of all incident energies,
+together with offset arrays in the manner of the compressed sparse
+row format. The data of the incident energy ``j`` (zero-based) is
+then the slice ``Ep[Ep_offsets[j]:Ep_offsets[j+1]]``, and all
+incident energies can be processed at once::
+
+    pack_mf6(section)
+    sub = section["subsection"][1]
+    counts = sub["NEP"]
+    incident = np.repeat(sub["E"], counts)  # E of each element of Ep
+
+The packed keys of a subsection depend on its LAW:
+
+=====  ==============================================================
+LAW    packed keys
+=====  ==============================================================
+1      ``E``, ``ND``, ``NA``, ``NEP``: one element per incident energy;
+       ``Ep`` with ``Ep_offsets``; ``b`` with ``b_offsets``, holding
+       the ``NEP[j]`` rows of ``NA[j]+1`` coefficients of energy ``j``
+2      ``E``, ``NLW``, ``NL``; ``A`` with ``A_offsets``
+5      ``E``, ``LTP``, ``NW``, ``NL``; ``A`` with ``A_offsets``
+7      ``E``, ``NMU``; ``mu`` with ``mu_offsets``; ``mu_NBT`` and
+       ``mu_INT`` with ``mu_int_offsets``; ``Ep`` and ``f`` of all
+       tables, in the order of ``mu``, with ``table_offsets``;
+       ``table_NBT`` and ``table_INT`` with ``table_int_offsets``
+=====  ==============================================================
+
+Subsections of other laws, e.g. LAW=6, have no such arrays and are
+left as they are. :func:`unpack_mf6` restores the nested
+representation. Parsers created with ``mf6_type="ndarray"`` apply
+:func:`pack_mf6` to every parsed MF6 section and unpack the sections
+they write. The functions of this module require NumPy.
+"""
+
+from collections.abc import Mapping
+from itertools import chain
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
+
+# the key whose presence marks a packed subsection of each law
+_PACKED_MARKER = {1: "Ep_offsets", 2: "A_offsets", 5: "A_offsets", 7: "mu_offsets"}
+# the incident energy arrays of each law with their data type
+_PER_ENERGY = {
+    1: (("E", float), ("ND", int), ("NA", int), ("NEP", int)),
+    2: (("E", float), ("NLW", int), ("NL", int)),
+    5: (("E", float), ("LTP", int), ("NW", int), ("NL", int)),
+    7: (("E", float), ("NMU", int)),
+}
+
+
+def _require_numpy():
+    if _np is None:
+        raise ImportError("the MF6 array representation requires NumPy")
+
+
+def _values(loop):
+    """Return the elements of a loop, a list or a dict indexed by counters."""
+    if isinstance(loop, Mapping):
+        return [loop[key] for key in sorted(loop)]
+    return list(loop)
+
+
+def _flatten(rows, dtype=float):
+    """Concatenate rows into one array and return it with the offsets."""
+    rows = [_values(row) for row in rows]
+    offsets = _np.zeros(len(rows) + 1, dtype=_np.int64)
+    offsets[1:] = _np.cumsum([len(row) for row in rows])
+    flat = _np.fromiter(chain.from_iterable(rows), dtype=dtype, count=offsets[-1])
+    return flat, offsets
+
+
+def _split(flat, offsets):
+    """Return the rows of a flattened array as lists."""
+    return [flat[start:stop].tolist() for start, stop in zip(offsets[:-1], offsets[1:])]
+
+
+def _loop(items, start, array_type):
+    items = list(items)
+    if array_type == "list":
+        return items
+    return dict(enumerate(items, start=start))
+
+
+def _check_offsets(law, offsets, counts, name):
+    if not _np.array_equal(_np.diff(offsets), counts):
+        raise ValueError(
+            f"LAW={law}: the number of elements of {name} does not match "
+            "the counts given for the incident energies"
+        )
+
+
+def _pack_law1(sub):
+    ep, ep_offsets = _flatten(_values(sub["Ep"]))
+    _check_offsets(1, ep_offsets, sub["NEP"], "Ep")
+    # the coefficients of an incident energy, row by row
+    blocks = (chain.from_iterable(map(_values, _values(b))) for b in _values(sub["b"]))
+    b, b_offsets = _flatten(blocks)
+    _check_offsets(1, b_offsets, sub["NEP"] * (sub["NA"] + 1), "b")
+    sub.update(Ep=ep, Ep_offsets=ep_offsets, b=b, b_offsets=b_offsets)
+
+
+def _unpack_law1(sub, array_type):
+    ep = _split(sub.pop("Ep"), sub.pop("Ep_offsets"))
+    blocks = _split(sub.pop("b"), sub.pop("b_offsets"))
+    b = []
+    for block, na in zip(blocks, sub["NA"].tolist()):
+        width = na + 1
+        rows = (block[i : i + width] for i in range(0, len(block), width))
+        b.append(_loop((_loop(row, 0, array_type) for row in rows), 1, array_type))
+    sub["Ep"] = _loop((_loop(row, 1, array_type) for row in ep), 1, array_type)
+    sub["b"] = _loop(b, 1, array_type)
+
+
+def _pack_law25(sub, law):
+    counts = sub["NLW"] if law == 2 else sub["NW"]
+    a, a_offsets = _flatten(_values(sub["A"]))
+    _check_offsets(law, a_offsets, counts, "A")
+    sub.update(A=a, A_offsets=a_offsets)
+
+
+def _unpack_law25(sub, array_type):
+    rows = _split(sub.pop("A"), sub.pop("A_offsets"))
+    sub["A"] = _loop((_loop(row, 1, array_type) for row in rows), 1, array_type)
+
+
+def _pack_law7(sub):
+    mu, mu_offsets = _flatten(_values(sub["mu"]))
+    _check_offsets(7, mu_offsets, sub["NMU"], "mu")
+    interpol = _values(sub["mu_interpol"])
+    mu_nbt, mu_int_offsets = _flatten([t["NBT"] for t in interpol], dtype=_np.int64)
+    mu_int, _ = _flatten([t["INT"] for t in interpol], dtype=_np.int64)
+    tables = list(chain.from_iterable(map(_values, _values(sub["table"]))))
+    if len(tables) != len(mu):
+        raise ValueError("LAW=7: the number of tables does not match mu")
+    ep, table_offsets = _flatten([t["Ep"] for t in tables])
+    f, _ = _flatten([t["f"] for t in tables])
+    table_nbt, table_int_offsets = _flatten([t["NBT"] for t in tables], dtype=_np.int64)
+    table_int, _ = _flatten([t["INT"] for t in tables], dtype=_np.int64)
+    del sub["mu_interpol"], sub["table"]
+    sub.update(
+        mu=mu,
+        mu_offsets=mu_offsets,
+        mu_NBT=mu_nbt,
+        mu_INT=mu_int,
+        mu_int_offsets=mu_int_offsets,
+        Ep=ep,
+        f=f,
+        table_offsets=table_offsets,
+        table_NBT=table_nbt,
+        table_INT=table_int,
+        table_int_offsets=table_int_offsets,
+    )
+
+
+def _unpack_law7(sub, array_type):
+    mu_offsets = sub.pop("mu_offsets")
+    mu = sub.pop("mu")
+    int_offsets = sub.pop("mu_int_offsets")
+    nbt = _split(sub.pop("mu_NBT"), int_offsets)
+    laws = _split(sub.pop("mu_INT"), int_offsets)
+    table_offsets = sub.pop("table_offsets")
+    ep = _split(sub.pop("Ep"), table_offsets)
+    f = _split(sub.pop("f"), table_offsets)
+    table_int_offsets = sub.pop("table_int_offsets")
+    table_nbt = _split(sub.pop("table_NBT"), table_int_offsets)
+    table_int = _split(sub.pop("table_INT"), table_int_offsets)
+    tables = [
+        {"NBT": n, "INT": i, "Ep": e, "f": v}
+        for n, i, e, v in zip(table_nbt, table_int, ep, f)
+    ]
+    bounds = list(zip(mu_offsets[:-1].tolist(), mu_offsets[1:].tolist()))
+    sub["mu"] = _loop(
+        (_loop(mu[start:stop].tolist(), 1, array_type) for start, stop in bounds),
+        1,
+        array_type,
+    )
+    sub["mu_interpol"] = _loop(
+        ({"NBT": n, "INT": i} for n, i in zip(nbt, laws)), 1, array_type
+    )
+    sub["table"] = _loop(
+        (_loop(tables[start:stop], 1, array_type) for start, stop in bounds),
+        1,
+        array_type,
+    )
+
+
+def _check_mf6_type(mf6_type):
+    """Check the ``mf6_type`` argument of the parser classes."""
+    if mf6_type not in ("nested", "ndarray"):
+        raise ValueError(f"mf6_type must be 'nested' or 'ndarray', not {mf6_type!r}")
+    if mf6_type == "ndarray":
+        _require_numpy()
+
+
+def _is_packed(sub):
+    marker = _PACKED_MARKER.get(sub.get("LAW"))
+    return marker is not None and marker in sub
+
+
+def pack_subsection(sub):
+    """Convert an MF6 subsection into the flat array representation.
+
+    The subsection is modified in place; see the module description
+    for the resulting keys. Subsections of laws without such arrays and
+    subsections that are packed already are left unchanged.
+
+    Parameters
+    ----------
+    sub : dict
+        A parsed MF6 subsection, with either array type.
+
+    Returns
+    -------
+    dict
+        The argument ``sub``.
+    """
+    _require_numpy()
+    law = sub.get("LAW")
+    if law not in _PACKED_MARKER or _is_packed(sub):
+        return sub
+    for name, dtype in _PER_ENERGY[law]:
+        sub[name] = _np.array(_values(sub[name]), dtype=dtype)
+    if law == 1:
+        _pack_law1(sub)
+    elif law == 7:
+        _pack_law7(sub)
+    else:
+        _pack_law25(sub, law)
+    return sub
+
+
+def unpack_subsection(sub, array_type="dict"):
+    """Restore the nested representation of a packed MF6 subsection.
+
+    Parameters
+    ----------
+    sub : dict
+        An MF6 subsection converted by :func:`pack_subsection`. Other
+        subsections are left unchanged.
+    array_type : str
+        ``"dict"`` or ``"list"``, the array type of the restored data.
+
+    Returns
+    -------
+    dict
+        The argument ``sub``, modified in place.
+    """
+    if not _is_packed(sub):
+        return sub
+    law = sub["LAW"]
+    if law == 1:
+        _unpack_law1(sub, array_type)
+    elif law == 7:
+        _unpack_law7(sub, array_type)
+    else:
+        _unpack_law25(sub, array_type)
+    for name, _ in _PER_ENERGY[law]:
+        sub[name] = _loop(sub[name].tolist(), 1, array_type)
+    return sub
+
+
+def pack_mf6(section):
+    """Convert the subsections of an MF6 section into flat arrays.
+
+    Applies :func:`pack_subsection` to all subsections of ``section``
+    in place.
+
+    Parameters
+    ----------
+    section : dict
+        A parsed MF6 section, e.g. ``endf_dict[6][5]``.
+
+    Returns
+    -------
+    dict
+        The argument ``section``.
+    """
+    for sub in _values(section.get("subsection", ())):
+        pack_subsection(sub)
+    return section
+
+
+def unpack_mf6(section, array_type="dict"):
+    """Restore the nested representation of the subsections of an MF6 section.
+
+    The inverse of :func:`pack_mf6`, applied in place.
+
+    Parameters
+    ----------
+    section : dict
+        An MF6 section converted by :func:`pack_mf6`.
+    array_type : str
+        ``"dict"`` or ``"list"``, the array type of the restored data.
+
+    Returns
+    -------
+    dict
+        The argument ``section``.
+    """
+    for sub in _values(section.get("subsection", ())):
+        unpack_subsection(sub, array_type)
+    return section
+
+
+def _without_packed_mf6(endf_dict, array_type):
+    """Return ``endf_dict`` with its packed MF6 sections unpacked.
+
+    Unlike :func:`unpack_mf6`, ``endf_dict`` is left unchanged; only
+    the packed sections and the dicts holding them are copied.
+    """
+    sections = endf_dict.get(6)
+    if not isinstance(sections, Mapping):
+        return endf_dict
+    replaced = {}
+    for mt, section in sections.items():
+        if not isinstance(section, Mapping):
+            continue
+        subsections = section.get("subsection", ())
+        if not any(_is_packed(sub) for sub in _values(subsections)):
+            continue
+        copies = [
+            unpack_subsection(dict(sub), array_type) for sub in _values(subsections)
+        ]
+        replaced[mt] = dict(section, subsection=_loop(copies, 1, array_type))
+    if not replaced:
+        return endf_dict
+    result = dict(endf_dict)
+    result[6] = dict(sections)
+    result[6].update(replaced)
+    return result
@@ -0,0 +1,373 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Vectorized evaluation of ENDF-6 interpolation tables.
+
+A TAB1 record holds the points ``(x[i], y[i])`` of a function together
+with the interpolation regions: region ``r`` ends at the one-based
+point index ``NBT[r]`` and uses the interpolation law ``INT[r]``:
+
+===  ==========================================
+INT  interpolation law
+===  ==========================================
+1    histogram (y is constant in an interval)
+2    linear-linear
+3    y linear in ln(x)
+4    ln(y) linear in x
+5    log-log
+===  ==========================================
+
+A repeated ``x`` value marks a discontinuity; at that ``x`` the value
+to its right is used unless the limit from the left is asked for. The functions of this module require NumPy.
+"""
+
+from collections.abc import Mapping, Sequence
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
+
+HISTOGRAM = 1
+LINLIN = 2
+LINLOG = 3
+LOGLIN = 4
+LOGLOG = 5
+
+
+def _require_numpy():
+    if _np is None:
+        raise ImportError("the interpolation utilities require NumPy")
+
+
+def _as_array(values, dtype=float):
+    """Return the values of a list, a dict indexed by counters or an array."""
+    if isinstance(values, Mapping):
+        values = [values[key] for key in sorted(values)]
+    return _np.asarray(values, dtype=dtype)
+
+
+def _is_sequence(value):
+    if isinstance(value, str):
+        return False
+    return isinstance(value, (Sequence, Mapping)) or (
+        _np is not None and isinstance(value, _np.ndarray)
+    )
+
+
+def _check_regions(npoints, nbt, laws):
+    if len(nbt) != len(laws) or len(nbt) == 0:
+        raise ValueError("NBT and INT must be non-empty and of equal length")
+    if _np.any(_np.diff(nbt) <= 0) or nbt[-1] != npoints:
+        raise ValueError(
+            f"NBT must increase and end at the number of points ({npoints})"
+        )
+    if _np.any((laws < HISTOGRAM) | (laws > LOGLOG)):
+        raise ValueError("only the interpolation laws INT=1 to INT=5 are supported")
+
+
+def _check_table(x, y, nbt, laws):
+    if x.ndim != 1 or x.shape != y.shape:
+        raise ValueError("x and y must be one-dimensional and of equal length")
+    if _np.any(_np.diff(x) < 0):
+        raise ValueError("the x values must be in non-decreasing order")
+    _check_regions(len(x), nbt, laws)
+
+
+def _interval_laws(nbt, laws, npoints):
+    """The interpolation law of each of the ``npoints - 1`` intervals."""
+    # the interval between the one-based points i and i+1 belongs to
+    # the first region whose last point NBT[r] is i+1 or beyond
+    upper = _np.arange(2, npoints + 1)
+    region = _np.searchsorted(nbt, upper, side="left")
+    return laws[_np.minimum(region, len(laws) - 1)]
+
+
+def _locate(x, xnew, side="right"):
+    """The interval ``i`` with ``x[i] <= xnew < x[i+1]`` of each point.
+
+    With ``side="left"``, the interval with ``x[i] < xnew <= x[i+1]``.
+    """
+    return _np.clip(_np.searchsorted(x, xnew, side=side) - 1, 0, len(x) - 2)
+
+
+def _interpolate_between(law, x1, x2, y1, y2, xnew, left=False):
+    """Interpolate between ``(x1, y1)`` and ``(x2, y2)`` elementwise.
+
+    ``left`` selects the limit from the left at ``xnew == x2`` for the
+    histogram law.
+    """
+    dx = x2 - x1
+    with _np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # the linear factor is the fallback for the logarithmic laws
+        # where a logarithm is undefined (a zero or negative value)
+        t = _np.where(dx > 0, (xnew - x1) / dx, 1.0)
+        logx = (law == LINLOG) | (law == LOGLOG)
+        logx &= (x1 > 0) & (xnew > 0) & (dx > 0)
+        if logx.any():
+            t = _np.where(logx, _np.log(xnew / x1) / _np.log(x2 / x1), t)
+        result = y1 + (y2 - y1) * t
+        logy = (law == LOGLIN) | (law == LOGLOG)
+        logy &= (y1 > 0) & (y2 > 0)
+        if logy.any():
+            result = _np.where(logy, y1 * _np.exp(_np.log(y2 / y1) * t), result)
+    step = (xnew <= x2) if left else (xnew < x2)
+    return _np.where((law == HISTOGRAM) & step, y1, result)
+
+
+class Tab1Interpolator:
+    """A tabulated function of a TAB1 record, evaluated with NumPy.
+
+    The table is checked and its interpolation regions are resolved to
+    one law per interval once, on construction; each call then
+    evaluates the function at an array of points with a fixed number of
+    vectorized operations, whatever the number of points::
+
+        xs = Tab1Interpolator.from_record(section["xstable"])
+        values = xs(energies)
+
+    Parameters
+    ----------
+    x, y : list, dict or array
+        The points of the table. The ``x`` values must be in
+        non-decreasing order; a repeated value marks a discontinuity.
+    nbt, interp : list, dict or array
+        The interpolation regions, ``NBT`` and ``INT`` of the record.
+    outside : float
+        The value of the function outside of the tabulated range.
+
+    Notes
+    -----
+    Where the logarithmic laws (INT=3 to INT=5) meet a zero or
+    negative value, the interval is interpolated linearly in that
+    coordinate instead.
+    """
+
+    def __init__(self, x, y, nbt, interp, *, outside=0.0):
+        _require_numpy()
+        self.x = _as_array(x)
+        self.y = _as_array(y)
+        nbt = _as_array(nbt, dtype=_np.int64)
+        laws = _as_array(interp, dtype=_np.int64)
+        _check_table(self.x, self.y, nbt, laws)
+        self.nbt = nbt
+        self.interp = laws
+        self.outside = outside
+        self._laws = _interval_laws(nbt, laws, len(self.x))
+
+    @classmethod
+    def from_record(cls, record, x=None, y=None, *, outside=0.0):
+        """Create the interpolator of a parsed TAB1 record.
+
+        Parameters
+        ----------
+        record : dict
+            The dict holding the ``NBT`` and ``INT`` fields of the
+            record and its two columns, e.g. ``section["xstable"]`` of
+            an MF3 section or an MF1/MT452 section with ``LNU=2``.
+        x, y : str, optional
+            The names of the columns, e.g. ``"E"`` and ``"xs"``. They
+            can be omitted if the record has no other list fields; the
+            columns are then taken in the order of the recipe.
+        outside : float
+            The value of the function outside of the tabulated range.
+        """
+        if x is None or y is None:
+            columns = [
+                key
+                for key, value in record.items()
+                if key not in ("NBT", "INT") and _is_sequence(value)
+            ]
+            if len(columns) != 2:
+                raise ValueError(
+                    "cannot tell the columns of the TAB1 record from the "
+                    f"fields {columns}; pass their names as x and y"
+                )
+            x, y = columns
+        return cls(record[x], record[y], record["NBT"], record["INT"], outside=outside)
+
+    def __call__(self, xnew, side="right"):
+        """Evaluate the function at ``xnew``.
+
+        Returns an array of the shape of ``xnew``. At a discontinuity,
+        the value to its right is returned, or the limit from the left
+        with ``side="left"``.
+        """
+        if side not in ("left", "right"):
+            raise ValueError(f"side must be 'left' or 'right', not {side!r}")
+        x = self.x
+        xnew = _np.asarray(xnew, dtype=float)
+        if len(x) == 1:
+            return _np.where(xnew == x[0], self.y[0], self.outside)
+        idx = _locate(x, xnew, side)
+        result = _interpolate_between(
+            self._laws[idx],
+            x[idx],
+            x[idx + 1],
+            self.y[idx],
+            self.y[idx + 1],
+            xnew,
+            left=side == "left",
+        )
+        inside = (xnew >= x[0]) & (xnew <= x[-1])
+        return _np.where(inside, result, self.outside)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __repr__(self):
+        return (
+            f"Tab1Interpolator({len(self.x)} points, "
+            f"INT={self.interp.tolist()}, NBT={self.nbt.tolist()})"
+        )
+
+
+class Tab2Interpolator:
+    """A function of two variables given by a TAB2 record, with NumPy.
+
+    A TAB2 record interpolates between functions of ``x`` tabulated at
+    the values ``z[i]`` of a second variable, e.g. between the angular
+    distributions of MF4 at the incident energies ``E[i]``. The value
+    at ``(z, x)`` is obtained by evaluating the two functions at the
+    neighbouring ``z[i] <= z < z[i+1]`` at ``x`` and interpolating
+    between them with the law of that interval::
+
+        angdist = Tab2Interpolator(
+            [section["E"][i] for i in section["angtable"]],
+            section["ang_int"]["NBT"],
+            section["ang_int"]["INT"],
+            section["angtable"],
+        )
+        values = angdist(energies, mu)
+
+    No unit-base transformation is applied, so the interpolated value
+    is the plain interpolation between the two functions at ``x``.
+
+    Parameters
+    ----------
+    z : list, dict or array
+        The values of the second variable, in non-decreasing order.
+    nbt, interp : list, dict or array
+        The interpolation regions of the TAB2 record.
+    functions : list or dict
+        The function at each ``z[i]``: a :class:`Tab1Interpolator`, a
+        parsed TAB1 record (see :meth:`Tab1Interpolator.from_record`)
+        or any callable that evaluates an array of ``x`` values. A dict
+        indexed by counters, as in ``array_type="dict"``, is taken in
+        the order of its keys.
+    outside : float
+        The value of the function for ``z`` outside of the range of the
+        ``z`` values.
+    """
+
+    def __init__(self, z, nbt, interp, functions, *, outside=0.0):
+        _require_numpy()
+        self.z = _as_array(z)
+        nbt = _as_array(nbt, dtype=_np.int64)
+        laws = _as_array(interp, dtype=_np.int64)
+        if isinstance(functions, Mapping):
+            functions = [functions[key] for key in sorted(functions)]
+        functions = [
+            Tab1Interpolator.from_record(f) if isinstance(f, Mapping) else f
+            for f in functions
+        ]
+        if self.z.ndim != 1 or len(self.z) != len(functions):
+            raise ValueError("z and functions must be of equal length")
+        if _np.any(_np.diff(self.z) < 0):
+            raise ValueError("the z values must be in non-decreasing order")
+        _check_regions(len(self.z), nbt, laws)
+        self.nbt = nbt
+        self.interp = laws
+        self.functions = functions
+        self.outside = outside
+        self._laws = _interval_laws(nbt, laws, len(self.z))
+
+    def __call__(self, z, x):
+        """Evaluate the function at the points ``(z, x)``.
+
+        ``z`` and ``x`` are broadcast against each other; the result
+        has the broadcast shape. Each tabulated function is evaluated
+        once, at the points that fall next to its ``z`` value.
+        """
+        z, x = _np.broadcast_arrays(
+            _np.asarray(z, dtype=float), _np.asarray(x, dtype=float)
+        )
+        zs = self.z
+        result = _np.full(z.shape, float(self.outside))
+        inside = (z >= zs[0]) & (z <= zs[-1])
+        if len(zs) == 1:
+            if inside.any():
+                result[inside] = self.functions[0](x[inside])
+            return result
+        # the points inside are sorted by their interval once, so that
+        # the points of the two intervals bounded by the function j are
+        # the contiguous slice bounds[j-1]:bounds[j+1]
+        order = _np.flatnonzero(inside)
+        idx = _locate(zs, z.ravel()[order])
+        sort = _np.argsort(idx, kind="stable")
+        order = order[sort]
+        idx = idx[sort]
+        zsorted = z.ravel()[order]
+        xsorted = x.ravel()[order]
+        bounds = _np.searchsorted(idx, _np.arange(len(zs) + 1))
+        lower = _np.empty(len(idx))
+        upper = _np.empty(len(idx))
+        for j, function in enumerate(self.functions):
+            start = bounds[j - 1] if j > 0 else 0
+            middle = bounds[j]
+            stop = bounds[j + 1]
+            if start == stop:
+                continue
+            values = function(xsorted[start:stop])
+            upper[start:middle] = values[: middle - start]
+            lower[middle:stop] = values[middle - start :]
+        values = _interpolate_between(
+            self._laws[idx], zs[idx], zs[idx + 1], lower, upper, zsorted
+        )
+        result.ravel()[order] = values
+        return result
+
+    def __len__(self):
+        return len(self.z)
+
+    def __repr__(self):
+        return (
+            f"Tab2Interpolator({len(self.z)} functions, "
+            f"INT={self.interp.tolist()}, NBT={self.nbt.tolist()})"
+        )
+
+
+def interpolate(x, y, nbt, interp, xnew, *, outside=0.0):
+    """Evaluate a tabulated function at many points at once.
+
+    Parameters
+    ----------
+    x, y : list, dict or array
+        The points of the table, e.g. ``xstable["E"]`` and
+        ``xstable["xs"]`` of a parsed MF3 section. The ``x`` values
+        must be in non-decreasing order.
+    nbt, interp : list, dict or array
+        The interpolation regions, ``NBT`` and ``INT`` of the record.
+    xnew : float or array_like
+        The points at which the function is evaluated.
+    outside : float
+        The value returned for points outside of the tabulated range.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values at ``xnew``, of the same shape as ``xnew``.
+
+    To evaluate the same table repeatedly, create a
+    :class:`Tab1Interpolator` once instead.
+    """
+    return Tab1Interpolator(x, y, nbt, interp, outside=outside)(xnew)
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/12/07
-# Last modified:   2024/12/07
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -216,6 +216,55 @@ def eval_tree_print(tree, endf_dict, opts=None):
     return retval
 
 
+def _referenced_paths(node, prefix=()):
+    if not isinstance(node, Tree):
+        return
+    if node.data == "endfpath":
+        yield prefix + tuple(str(c) for c in node.children)
+    elif node.data == "prefixed_logical_expr":
+        # the paths in the expression are relative to the prefix
+        new_prefix = next(_referenced_paths(node.children[0], prefix))
+        yield new_prefix
+        yield from _referenced_paths(node.children[1], new_prefix)
+    else:
+        for child in node.children:
+            yield from _referenced_paths(child, prefix)
+
+
+def referenced_sections(tree):
+    """Determine the MF/MT sections a match expression refers to.
+
+    Parameters
+    ----------
+    tree : lark.Tree
+        The match expression parsed by ``expr_parser``.
+
+    Returns
+    -------
+    Union[None, set[tuple[int, Optional[int]]]]
+        The ``(MF, MT)`` pairs of the sections referenced by the
+        paths in the expression. ``(MF, None)`` stands for all
+        sections of an MF number, e.g., for the path ``/3/*/QI``.
+        ``None`` is returned if a path has a wildcard in place of the
+        MF number, as the expression may then refer to any section.
+        The expression evaluates the same on a dictionary limited
+        to the referenced sections as on the full dictionary.
+    """
+    sections = set()
+    for path in _referenced_paths(tree):
+        if len(path) == 0 or path[0] == "*":
+            return None
+        if not path[0].isdigit():
+            # MF numbers are integers, so the path cannot exist
+            continue
+        mf = int(path[0])
+        if len(path) == 1 or path[1] == "*":
+            sections.add((mf, None))
+        elif path[1].isdigit():
+            sections.add((mf, int(path[1])))
+    return sections
+
+
 def eval_expr(expr, endf_dict, opts=None):
     opts = {} if opts is None else opts
     tree = expr_parser.parse(expr)
@@ -0,0 +1,519 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Two-dimensional ENDF-6 arrays backed by a single NumPy array.
+
+With ``array_type="dict"``, a recipe variable with two indices, such
+as ``F[k,kp]`` of an MF33 LB=5 block or ``COV[i,j]`` of an ERRORR
+covariance matrix, is parsed into a dict of dicts with one Python
+float per element. An :class:`EndfMatrix` stores the same elements in
+one two-dimensional :class:`numpy.ndarray` and keeps the first row and
+column index as well as the column range of each row, so that
+``matrix[k][kp]`` and paths such as ``F[3,7]`` address the same
+element as in the nested dicts::
+
+    parser = EndfParserPy(matrix_type="ndarray")
+    block = parser.parsefile("n_26-Fe-56.endf", include=[33])[33][102]
+    F = block["subsection"][1]["ni_subsection"][1]["F"]
+    F.array        # the elements as a 2-D array
+    F[3][7]        # the element F[3,7]
+
+Elements outside of the column range of a row, e.g. below the
+diagonal of a symmetric LB=5 block, are not part of the matrix and
+are zero in :attr:`EndfMatrix.array`. :func:`pack_matrices` and
+:func:`unpack_matrices` convert between both representations; the
+variables that are packed are those the recipe of a section indexes
+with two indices.
+An :class:`EndfVector` is the read-only counterpart for an array with
+one index, such as the arrays of a tape read from the columnar npz
+format. The classes and functions of this module require NumPy.
+"""
+
+import re
+from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
+
+from ..endf_recipes import get_recipe_dict
+from .user_tools import list_parsed_sections
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
+
+def _require_numpy():
+    if _np is None:
+        raise ImportError("EndfMatrix requires NumPy")
+
+
+def _is_index(key):
+    return isinstance(key, int) and not isinstance(key, bool)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class EndfMatrixRow(MutableMapping):
+    """The row of an :class:`EndfMatrix`, a mapping from column to value.
+
+    The row is a view; assigning to it modifies the matrix.
+    """
+
+    __slots__ = ("_matrix", "_row")
+
+    def __init__(self, matrix, row):
+        self._matrix = matrix
+        self._row = row
+
+    def __getitem__(self, col):
+        return self._matrix[self._row, col]
+
+    def __setitem__(self, col, value):
+        self._matrix[self._row, col] = value
+
+    def __delitem__(self, col):
+        raise TypeError("elements of an EndfMatrix cannot be deleted")
+
+    def __contains__(self, col):
+        if not _is_index(col):
+            return False
+        start, stop = self._matrix._col_range(self._row)
+        return start <= col < stop
+
+    def __iter__(self):
+        start, stop = self._matrix._col_range(self._row)
+        return iter(range(start, stop))
+
+    def __len__(self):
+        start, stop = self._matrix._col_range(self._row)
+        return stop - start
+
+    def __repr__(self):
+        return f"EndfMatrixRow({dict(self.items())})"
+
+
+class EndfMatrix(MutableMapping):
+    """A two-dimensional ENDF-6 array stored in a NumPy array.
+
+    The matrix is a mapping from the row index to an
+    :class:`EndfMatrixRow`, which maps the column index to the element,
+    like the nested dicts of ``array_type="dict"``. Elements can also
+    be addressed with a tuple, ``matrix[k, kp]``.
+
+    Parameters
+    ----------
+    array : array_like
+        The two-dimensional array of the elements.
+    row_start, col_start : int
+        The row and column index of ``array[0, 0]``.
+    col_ranges : array_like, optional
+        The first and one past the last column index of each row, of
+        shape ``(nrows, 2)``. Defaults to all columns of ``array``.
+
+    Attributes
+    ----------
+    array : numpy.ndarray
+        The elements; entries outside of the column range of a row
+        are zero.
+    row_start, col_start : int
+        The index offsets of :attr:`array`.
+    col_ranges : numpy.ndarray
+        The column ranges of the rows.
+    """
+
+    def __init__(self, array, row_start=1, col_start=1, col_ranges=None):
+        _require_numpy()
+        array = _np.asanyarray(array)
+        if array.ndim != 2:
+            raise ValueError("the array of an EndfMatrix must be two-dimensional")
+        nrows, ncols = array.shape
+        if col_ranges is None:
+            col_ranges = [(col_start, col_start + ncols)] * nrows
+        col_ranges = _np.array(col_ranges, dtype=_np.int64).reshape(nrows, 2)
+        if nrows > 0 and (
+            _np.any(col_ranges[:, 0] < col_start)
+            or _np.any(col_ranges[:, 1] > col_start + ncols)
+            or _np.any(col_ranges[:, 1] < col_ranges[:, 0])
+        ):
+            raise ValueError("the column ranges exceed the columns of the array")
+        self.array = array
+        self.row_start = int(row_start)
+        self.col_start = int(col_start)
+        self.col_ranges = col_ranges
+
+    @classmethod
+    def from_dict(cls, nested):
+        """Create the matrix of a dict of dicts ``{k: {kp: value}}``.
+
+        The row indices and, within each row, the column indices must
+        be consecutive integers and the values numbers. The array is
+        of integer type if all values are integers.
+        """
+        _require_numpy()
+        rows = sorted(nested)
+        if not rows or rows != list(range(rows[0], rows[0] + len(rows))):
+            raise ValueError("the row indices must be consecutive integers")
+        ranges = []
+        for k in rows:
+            cols = sorted(nested[k])
+            if not cols or cols != list(range(cols[0], cols[0] + len(cols))):
+                raise ValueError(f"the column indices of row {k} are not consecutive")
+            ranges.append((cols[0], cols[-1] + 1))
+        ranges = _np.array(ranges, dtype=_np.int64)
+        col_start = int(ranges[:, 0].min())
+        ncols = int(ranges[:, 1].max()) - col_start
+        values = [nested[k][kp] for k in rows for kp in sorted(nested[k])]
+        is_int = all(isinstance(v, int) for v in values)
+        dtype = _np.int64 if is_int else float
+        array = _np.zeros((len(rows), ncols), dtype=dtype)
+        # the flat positions of the elements, row by row
+        lengths = ranges[:, 1] - ranges[:, 0]
+        row_idx = _np.repeat(_np.arange(len(rows)), lengths)
+        starts = _np.cumsum(lengths) - lengths
+        offsets = _np.arange(len(values)) - _np.repeat(starts, lengths)
+        col_idx = _np.repeat(ranges[:, 0] - col_start, lengths) + offsets
+        array[row_idx, col_idx] = _np.array(values, dtype=dtype)
+        return cls(array, rows[0], col_start, ranges)
+
+    def to_dict(self):
+        """Return the elements as a dict of dicts of Python numbers."""
+        result = {}
+        for i, (start, stop) in enumerate(self.col_ranges.tolist()):
+            first = start - self.col_start
+            values = self.array[i, first : first + stop - start].tolist()
+            result[self.row_start + i] = dict(zip(range(start, stop), values))
+        return result
+
+    @property
+    def shape(self):
+        """The shape of :attr:`array`."""
+        return self.array.shape
+
+    def _row_position(self, row):
+        if not _is_index(row):
+            raise KeyError(row)
+        i = row - self.row_start
+        if i < 0 or i >= len(self.col_ranges):
+            raise KeyError(row)
+        return i
+
+    def _col_range(self, row):
+        start, stop = self.col_ranges[self._row_position(row)]
+        return int(start), int(stop)
+
+    def _position(self, row, col):
+        i = self._row_position(row)
+        start, stop = self.col_ranges[i]
+        if not _is_index(col) or col < start or col >= stop:
+            raise KeyError((row, col))
+        return i, col - self.col_start
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return self.array[self._position(*key)].item()
+        self._row_position(key)
+        return EndfMatrixRow(self, key)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple):
+            row, col = key
+            i = self._row_position(row)
+            start, stop = self.col_ranges[i]
+            # a row can grow by one element at either end as long as
+            # the element lies within the columns of the array
+            j = col - self.col_start if _is_index(col) else -1
+            if j < 0 or j >= self.array.shape[1] or col < start - 1 or col > stop:
+                raise KeyError(key)
+            self._accommodate([value])
+            self.array[i, j] = value
+            self.col_ranges[i] = (min(start, col), max(stop, col + 1))
+            return
+        i = self._row_position(key)
+        if not isinstance(value, Mapping):
+            raise TypeError("a row of an EndfMatrix must be set to a mapping")
+        cols = sorted(value)
+        if cols and cols != list(range(cols[0], cols[0] + len(cols))):
+            raise ValueError(f"the column indices of row {key} are not consecutive")
+        col_stop = self.col_start + self.array.shape[1]
+        if cols and (cols[0] < self.col_start or cols[-1] >= col_stop):
+            raise KeyError(f"the columns of row {key} exceed the array")
+        values = [value[col] for col in cols]
+        self._accommodate(values)
+        self.array[i] = 0
+        if cols:
+            first = cols[0] - self.col_start
+            self.array[i, first : first + len(cols)] = values
+            self.col_ranges[i] = (cols[0], cols[-1] + 1)
+        else:
+            self.col_ranges[i] = (self.col_start, self.col_start)
+
+    def _accommodate(self, values):
+        # an integer array becomes a float array on the first float
+        if self.array.dtype.kind in "iu" and not all(
+            isinstance(v, (int, _np.integer)) for v in values
+        ):
+            self.array = self.array.astype(float)
+
+    def __delitem__(self, key):
+        raise TypeError("rows of an EndfMatrix cannot be deleted")
+
+    def __contains__(self, key):
+        if isinstance(key, tuple):
+            try:
+                self._position(*key)
+            except KeyError:
+                return False
+            return True
+        return _is_index(key) and 0 <= key - self.row_start < len(self.col_ranges)
+
+    def __iter__(self):
+        return iter(range(self.row_start, self.row_start + len(self.col_ranges)))
+
+    def __len__(self):
+        return len(self.col_ranges)
+
+    def __reduce__(self):
+        return (
+            type(self),
+            (self.array, self.row_start, self.col_start, self.col_ranges),
+        )
+
+    def __repr__(self):
+        nrows, ncols = self.array.shape
+        return (
+            f"EndfMatrix({nrows}x{ncols}, dtype={self.array.dtype}, "
+            f"first index=({self.row_start}, {self.col_start}))"
+        )
+
+
+class EndfVector(Mapping):
+    """A read-only one-dimensional ENDF-6 array stored in a NumPy array.
+
+    The vector is a mapping from the index to the element, like the
+    dict ``{start: array[0], start + 1: array[1], ...}`` of
+    ``array_type="dict"``, but the elements stay in ``array``, which
+    may be a read-only :class:`numpy.memmap`.
+
+    Parameters
+    ----------
+    array : array_like
+        The one-dimensional array of the elements.
+    start : int
+        The index of ``array[0]``.
+
+    Attributes
+    ----------
+    array : numpy.ndarray
+        The elements.
+    start : int
+        The index offset of :attr:`array`.
+    """
+
+    def __init__(self, array, start=1):
+        _require_numpy()
+        array = _np.asanyarray(array)
+        if array.ndim != 1:
+            raise ValueError("the array of an EndfVector must be one-dimensional")
+        self.array = array
+        self.start = int(start)
+
+    def to_dict(self):
+        """Return the elements as a dict of Python numbers."""
+        return dict(
+            zip(range(self.start, self.start + len(self.array)), self.array.tolist())
+        )
+
+    def __getitem__(self, key):
+        i = key - self.start if _is_index(key) else -1
+        if i < 0 or i >= len(self.array):
+            raise KeyError(key)
+        return self.array[i].item()
+
+    def __contains__(self, key):
+        return _is_index(key) and 0 <= key - self.start < len(self.array)
+
+    def __iter__(self):
+        return iter(range(self.start, self.start + len(self.array)))
+
+    def __len__(self):
+        return len(self.array)
+
+    def __reduce__(self):
+        return (type(self), (self.array, self.start))
+
+    def __repr__(self):
+        return (
+            f"EndfVector({len(self.array)}, dtype={self.array.dtype}, "
+            f"first index={self.start})"
+        )
+
+
+def _check_matrix_type(matrix_type, array_type):
+    """Check the ``matrix_type`` argument of the parser classes."""
+    if matrix_type not in ("nested", "ndarray"):
+        raise ValueError(
+            f"matrix_type must be 'nested' or 'ndarray', not {matrix_type!r}"
+        )
+    if matrix_type == "ndarray":
+        if array_type != "dict":
+            raise ValueError('matrix_type="ndarray" requires array_type="dict"')
+        _require_numpy()
+
+
+def _as_matrix(obj):
+    """Return the :class:`EndfMatrix` of a nested dict, or ``None``."""
+    if len(obj) == 0:
+        return None
+    for key, row in obj.items():
+        if not _is_index(key) or not isinstance(row, Mapping) or len(row) == 0:
+            return None
+        for col, value in row.items():
+            if not _is_index(col) or not _is_number(value):
+                return None
+    try:
+        return EndfMatrix.from_dict(obj)
+    except ValueError:
+        return None
+
+
+_VARIABLE = re.compile(r"([A-Za-z_]\w*)\s*\[")
+
+
+@lru_cache(maxsize=None)
+def _two_index_variables(recipe):
+    """The names of the variables a recipe indexes with two indices.
+
+    A name can also be used with one index in another branch of the
+    recipe, e.g. ``F[k]`` of an MF33 LB=8 block next to ``F[k,kp]``;
+    such an array is not a dict of dicts and stays as it is.
+    """
+    recipe = "\n".join(line.split("#", 1)[0] for line in recipe.splitlines())
+    names = set()
+    for match in _VARIABLE.finditer(recipe):
+        depth = 0
+        commas = 0
+        for char in recipe[match.end() :]:
+            if char == "[":
+                depth += 1
+            elif char == "]":
+                if depth == 0:
+                    break
+                depth -= 1
+            elif char == "," and depth == 0:
+                commas += 1
+        if commas == 1:
+            names.add(match.group(1))
+    return frozenset(names)
+
+
+def _matrix_variables(recipes, mf, mt):
+    """The two-index variables of the recipe for ``MF/MT``."""
+    if isinstance(recipes, str):
+        recipes = get_recipe_dict(recipes)
+    recipe = recipes.get(mf)
+    if isinstance(recipe, Mapping):
+        recipe = recipe.get(mt, recipe.get(-1))
+    if not isinstance(recipe, str):
+        return frozenset()
+    return _two_index_variables(recipe)
+
+
+def _pack(dic, names):
+    for key, obj in tuple(dic.items()):
+        if not isinstance(obj, MutableMapping) or isinstance(obj, EndfMatrix):
+            continue
+        if key not in names:
+            _pack(obj, names)
+            continue
+        matrix = _as_matrix(obj)
+        if matrix is not None:
+            dic[key] = matrix
+
+
+def pack_matrices(dic, recipes="endf6-ext"):
+    """Replace the two-dimensional arrays in a nested dict by matrices.
+
+    Every variable that the recipe of a section indexes with two
+    indices, such as ``F[k,kp]`` of an MF33 block, is a dict of dicts
+    in ``array_type="dict"`` and is replaced in place by an
+    :class:`EndfMatrix`. Other arrays are left as they are, as are
+    those with non-consecutive indices or values other than numbers,
+    e.g. :class:`~endf_parserpy.EndfFloat` objects with
+    ``preserve_value_strings=True``.
+
+    Parameters
+    ----------
+    dic : dict
+        A parsed section or a dict of parsed sections, whose recipe is
+        chosen by the fields ``MF`` and ``MT`` or the keys.
+    recipes : str or dict
+        The name of the ENDF format flavor, such as ``"errorr"``, or a
+        dict of recipes, as the ``endf_format`` and ``recipes``
+        arguments of the parser.
+
+    Returns
+    -------
+    dict
+        The argument ``dic``.
+    """
+    _require_numpy()
+    if "MF" in dic and "MT" in dic:
+        _pack(dic, _matrix_variables(recipes, dic["MF"], dic["MT"]))
+    else:
+        for mf, mt in list_parsed_sections(dic):
+            _pack(dic[mf][mt], _matrix_variables(recipes, mf, mt))
+    return dic
+
+
+def unpack_matrices(dic):
+    """Replace the matrices in a nested dict by dicts of dicts.
+
+    The inverse of :func:`pack_matrices`, applied in place. Vectors
+    are replaced by dicts as well.
+
+    Parameters
+    ----------
+    dic : dict
+        A parsed section or a dict of parsed sections.
+
+    Returns
+    -------
+    dict
+        The argument ``dic``.
+    """
+    for key, obj in tuple(dic.items()):
+        if isinstance(obj, (EndfMatrix, EndfVector)):
+            dic[key] = obj.to_dict()
+        elif isinstance(obj, MutableMapping):
+            unpack_matrices(obj)
+    return dic
+
+
+def _without_matrices(obj):
+    """Return ``obj`` with its matrices and vectors converted to dicts.
+
+    Unlike :func:`unpack_matrices`, ``obj`` is left unchanged; only the
+    dicts on the path to a matrix are copied.
+    """
+    if isinstance(obj, (EndfMatrix, EndfVector)):
+        return obj.to_dict()
+    if not isinstance(obj, Mapping):
+        return obj
+    result = None
+    for key, value in obj.items():
+        converted = _without_matrices(value)
+        if converted is not value:
+            if result is None:
+                result = dict(obj)
+            result[key] = converted
+    return obj if result is None else result
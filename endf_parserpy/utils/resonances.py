@@ -0,0 +1,390 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Cross sections from resolved resonance parameters of MF2/MT151.
+
+:func:`resonance_cross_sections` evaluates the elastic, capture,
+fission and total cross sections given by the resolved resonance
+ranges of a parsed MF2/MT151 section on an energy grid::
+
+    xs = resonance_cross_sections(endf_dict[2][151], energies)
+    capture = xs[102]
+
+The single-level Breit-Wigner (``LRF=1``), multi-level Breit-Wigner
+(``LRF=2``) and Reich-Moore (``LRF=3``) formalisms are supported, with
+the formulas of Appendix D of the ENDF-6 formats manual. The result is
+the resonance contribution at zero kelvin; the background cross
+sections of MF3 have to be added to obtain the cross sections of the
+material. Energies outside of the resolved ranges, including the
+unresolved range, get no contribution.
+
+The computation is vectorized over energies and resonances. The
+arrays of one batch have one element per pair of an energy and a
+resonance of a spin group; the ``chunk_size`` argument bounds the
+number of these pairs and thereby the memory used. The functions of
+this module require NumPy.
+"""
+
+from collections.abc import Mapping
+
+from .interpolation import Tab1Interpolator, _as_array, _require_numpy
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
+
+# the wave number is K_NEUTRON * AWRI / (AWRI + 1) * sqrt(E) in units
+# of 1/(10^-12 cm) for the energy E in eV, so that pi/k^2 is in barn
+K_NEUTRON = 2.196807122623e-3
+
+MT_TOTAL = 1
+MT_ELASTIC = 2
+MT_FISSION = 18
+MT_CAPTURE = 102
+
+_FORMALISMS = {1: "SLBW", 2: "MLBW", 3: "Reich-Moore"}
+
+
+def _entries(loop):
+    """Return the elements of a loop, a list or a dict indexed by counters."""
+    if isinstance(loop, Mapping):
+        return [loop[key] for key in sorted(loop)]
+    return list(loop)
+
+
+def _wave_number(awri, energies):
+    return K_NEUTRON * awri / (awri + 1.0) * _np.sqrt(_np.abs(energies))
+
+
+def _hard_sphere(l, rho, rhohat=None):
+    """Penetrability, shift factor and phase shift of angular momentum ``l``.
+
+    The functions are obtained by the recursion relations of the
+    spherical Hankel functions, starting from ``P_0 = rho``,
+    ``S_0 = 0`` and ``phi_0 = rhohat``. The phase shift is only
+    computed if ``rhohat`` is given.
+    """
+    pen = rho
+    shift = _np.zeros_like(rho)
+    phi = rhohat
+    rho2 = rho * rho
+    if phi is not None:
+        rhohat2 = rhohat * rhohat
+        pen_hat = rhohat
+        shift_hat = _np.zeros_like(rhohat)
+    for n in range(1, l + 1):
+        denom = (n - shift) ** 2 + pen**2
+        pen, shift = rho2 * pen / denom, rho2 * (n - shift) / denom - n
+        if phi is not None:
+            phi = phi - _np.arctan2(pen_hat, n - shift_hat)
+            denom = (n - shift_hat) ** 2 + pen_hat**2
+            pen_hat, shift_hat = (
+                rhohat2 * pen_hat / denom,
+                rhohat2 * (n - shift_hat) / denom - n,
+            )
+    return pen, shift, phi
+
+
+class _Range:
+    """The radii and spin groups of a resolved resonance range."""
+
+    def __init__(self, rng, abundance):
+        self.el = rng["EL"]
+        self.eh = rng["EH"]
+        self.lrf = rng["LRF"]
+        self.naps = rng["NAPS"]
+        self.spi = rng["SPI"]
+        self.abundance = abundance
+        if rng["NRO"] != 0:
+            table = rng["AP_table"]
+            self._ap_table = Tab1Interpolator(
+                table["Eint"], table["AP"], table["NBT"], table["INT"]
+            )
+        else:
+            self._ap_table = None
+        self.ap = rng.get("AP", 0.0)
+        groups = _entries(rng["l_group"])
+        self.l_groups = [self._l_group(group) for group in groups]
+
+    def _l_group(self, group):
+        lrf = self.lrf
+        er = _as_array(group["ER"])
+        aj = _as_array(group["AJ"])
+        gn = _as_array(group["GN"])
+        gg = _as_array(group["GG"])
+        if lrf == 3:
+            widths = {key: _as_array(group[key]) for key in ("GFA", "GFB")}
+        else:
+            gf = _as_array(group["GF"])
+            gt = _as_array(group["GT"])
+            gx = gt - gn - gg - gf if group.get("LRX", 0) else _np.zeros_like(gt)
+            widths = {"GF": gf, "GX": _np.maximum(gx, 0.0)}
+        # resonances with a negative AJ of the Reich-Moore formalism
+        # belong to the second channel spin of the same J
+        spins = aj if lrf == 3 else _np.abs(aj)
+        groups = []
+        for spin in _np.unique(spins):
+            sel = spins == spin
+            groups.append(
+                {
+                    "AJ": abs(float(spin)),
+                    "ER": er[sel],
+                    "GN": gn[sel],
+                    "GG": gg[sel],
+                    **{key: value[sel] for key, value in widths.items()},
+                }
+            )
+        apl = group.get("APL", 0.0) if lrf == 3 else 0.0
+        return {
+            "L": int(group["L"]),
+            "AWRI": float(group["AWRI"]),
+            "APL": float(apl),
+            "spin_groups": groups,
+        }
+
+    def radii(self, group, energies):
+        """The radii of the penetrability and of the phase shift."""
+        if self._ap_table is not None:
+            ap = self._ap_table(energies)
+        else:
+            ap = _np.full(energies.shape, float(self.ap))
+        if group["APL"] != 0.0:
+            ap = _np.full(energies.shape, group["APL"])
+        if self.naps == 0:
+            awri = group["AWRI"]
+            channel = 0.123 * awri ** (1.0 / 3.0) + 0.08
+            return _np.full(energies.shape, channel), ap
+        if self.naps == 2:
+            return _np.full(energies.shape, float(self.ap)), ap
+        return ap, ap
+
+
+def _resonance_factors(rng, group, spin_group):
+    """Penetrability and shift factor at the resonance energies."""
+    er = spin_group["ER"]
+    rho_r = _wave_number(group["AWRI"], er) * rng.radii(group, _np.abs(er))[0]
+    pen_r, shift_r, _ = _hard_sphere(group["L"], rho_r)
+    return pen_r, shift_r
+
+
+def _breit_wigner(rng, group, spin_group, factors, energies, chunk_size, out):
+    """Add the SLBW or MLBW cross sections of a spin group to ``out``."""
+    k = _wave_number(group["AWRI"], energies)
+    pen_radius, phase_radius = rng.radii(group, energies)
+    pen, shift, phi = _hard_sphere(group["L"], k * pen_radius, k * phase_radius)
+    pen_r, shift_r = factors
+    gj = (2.0 * spin_group["AJ"] + 1.0) / (2.0 * (2.0 * rng.spi + 1.0))
+    scale = _np.pi / k**2 * gj
+    gn_r = spin_group["GN"]
+    nres = len(gn_r)
+    step = max(1, min(nres, chunk_size))
+    multi = rng.lrf == 2
+    fissile = bool(_np.any(spin_group["GF"] != 0.0))
+    elastic = _np.zeros(energies.shape)
+    capture = _np.zeros(energies.shape)
+    fission = _np.zeros(energies.shape)
+    # the sums over resonances of w * Gamma and w * (E - E'), with
+    # the weight w = Gamma_n / ((E - E')^2 + Gamma^2 / 4)
+    width_sum = _np.zeros(energies.shape)
+    offset_sum = _np.zeros(energies.shape)
+    for start in range(0, nres, step):
+        sl = slice(start, start + step)
+        gn = gn_r[sl] * pen[:, None] / pen_r[sl]
+        # the resonance energy shifted by the level shift
+        level_shift = (shift_r[sl] - shift[:, None]) * gn_r[sl] / (2.0 * pen_r[sl])
+        delta = energies[:, None] - (spin_group["ER"][sl] + level_shift)
+        gg = spin_group["GG"][sl]
+        gf = spin_group["GF"][sl]
+        gamma = gn + gg + gf + spin_group["GX"][sl]
+        weight = gn / (delta**2 + 0.25 * gamma**2)
+        capture += weight @ gg
+        if fissile:
+            fission += weight @ gf
+        width_sum += (weight * gamma).sum(axis=1)
+        offset_sum += (weight * delta).sum(axis=1)
+        if not multi:
+            elastic += (weight * gn).sum(axis=1)
+    if multi:
+        # U = exp(-2i phi) (1 + sum of i Gamma_n / (E' - E - i Gamma / 2)),
+        # and |1 - U|^2 without its potential scattering part 4 sin^2(phi)
+        amplitude = -0.5 * width_sum - 1j * offset_sum
+        u = _np.exp(-2j * phi) * (1.0 + amplitude)
+        elastic = _np.abs(1.0 - u) ** 2 - 4.0 * _np.sin(phi) ** 2
+    else:
+        elastic -= 2.0 * _np.sin(phi) ** 2 * width_sum
+        elastic += 2.0 * _np.sin(2.0 * phi) * offset_sum
+    out[MT_ELASTIC] += scale * elastic
+    out[MT_CAPTURE] += scale * capture
+    out[MT_FISSION] += scale * fission
+
+
+def _reich_moore(rng, group, spin_group, factors, energies, chunk_size, out):
+    """Add the Reich-Moore cross sections of a spin group to ``out``."""
+    k = _wave_number(group["AWRI"], energies)
+    pen_radius, phase_radius = rng.radii(group, energies)
+    pen, _, phi = _hard_sphere(group["L"], k * pen_radius, k * phase_radius)
+    # the Reich-Moore formalism has no level shift
+    pen_r = factors[0]
+    gj = (2.0 * spin_group["AJ"] + 1.0) / (2.0 * (2.0 * rng.spi + 1.0))
+    scale = _np.pi / k**2 * gj
+    gfa = spin_group["GFA"]
+    gfb = spin_group["GFB"]
+    fissile = bool(_np.any(gfa != 0.0) or _np.any(gfb != 0.0))
+    # the neutron amplitudes are sqrt(P(E)) times energy-independent
+    # reduced amplitudes, so that each element of K is sqrt(P(E)) to
+    # the power of the number of neutron channels times the matrix
+    # product of 1 / (E_r - E - i GG / 2) with a vector over the
+    # resonances; the sign of a fission width is that of its amplitude
+    amplitudes = [_np.sqrt(_np.abs(spin_group["GN"]) / pen_r)]
+    if fissile:
+        for gf in (gfa, gfb):
+            amplitudes.append(_np.sign(gf) * _np.sqrt(_np.abs(gf)))
+    nchan = len(amplitudes)
+    nres = len(pen_r)
+    step = max(1, min(nres, chunk_size))
+    # the channel matrix K without the factor i/2, one per energy
+    kmat = _np.zeros(energies.shape + (nchan, nchan), dtype=complex)
+    for start in range(0, nres, step):
+        sl = slice(start, start + step)
+        offset = spin_group["ER"][sl] - energies[:, None]
+        half_width = 0.5 * spin_group["GG"][sl]
+        denom = offset**2 + half_width**2
+        inv_real = offset / denom
+        inv_imag = half_width / denom
+        for c in range(nchan):
+            for cp in range(c, nchan):
+                vector = amplitudes[c][sl] * amplitudes[cp][sl]
+                value = inv_real @ vector + 1j * (inv_imag @ vector)
+                kmat[:, c, cp] += value
+                if cp != c:
+                    kmat[:, cp, c] += value
+    root = _np.sqrt(pen)
+    kmat[:, 0, 0] *= pen
+    kmat[:, 0, 1:] *= root[:, None]
+    kmat[:, 1:, 0] *= root[:, None]
+    if nchan == 1:
+        row = 1.0 / (1.0 - 0.5j * kmat[:, 0, 0])
+        fission = _np.zeros(energies.shape)
+    else:
+        system = _np.eye(nchan) - 0.5j * kmat
+        unit = _np.zeros(energies.shape + (nchan, 1))
+        unit[:, 0, 0] = 1.0
+        # the inverse is symmetric, so its first row is a solution
+        row = _np.linalg.solve(system, unit)[:, :, 0]
+        fission = 4.0 * (_np.abs(row[:, 1]) ** 2 + _np.abs(row[:, 2]) ** 2)
+        row = row[:, 0]
+    u = _np.exp(-2j * phi) * (2.0 * row - 1.0)
+    elastic = _np.abs(1.0 - u) ** 2 - 4.0 * _np.sin(phi) ** 2
+    absorption = 1.0 - _np.abs(u) ** 2
+    out[MT_ELASTIC] += scale * elastic
+    out[MT_FISSION] += scale * fission
+    out[MT_CAPTURE] += scale * (absorption - fission)
+
+
+def _add_range(rng, energies, chunk_size, out):
+    """Add the cross sections of a resolved range at ``energies``."""
+    for group in rng.l_groups:
+        l = group["L"]
+        pen_radius, phase_radius = rng.radii(group, energies)
+        k = _wave_number(group["AWRI"], energies)
+        _, _, phi = _hard_sphere(l, k * pen_radius, k * phase_radius)
+        # the potential scattering of all spin groups of the l-value
+        out[MT_ELASTIC] += 4.0 * _np.pi / k**2 * (2 * l + 1) * _np.sin(phi) ** 2
+        add = _reich_moore if rng.lrf == 3 else _breit_wigner
+        for spin_group in group["spin_groups"]:
+            nres = len(spin_group["ER"])
+            factors = _resonance_factors(rng, group, spin_group)
+            # the number of energies of a batch
+            batch = max(1, chunk_size // nres)
+            for start in range(0, len(energies), batch):
+                sl = slice(start, start + batch)
+                # views, so that the contributions are added to out
+                part = {mt: value[sl] for mt, value in out.items()}
+                add(rng, group, spin_group, factors, energies[sl], chunk_size, part)
+
+
+def _resolved_ranges(section):
+    ranges = []
+    for isotope in _entries(section["isotope"]):
+        isotope_ranges = []
+        for rng in _entries(isotope["range"]):
+            if rng["LRU"] != 1:
+                continue
+            if rng["LRF"] not in _FORMALISMS:
+                raise NotImplementedError(
+                    f"the resolved resonance formalism LRF={rng['LRF']} "
+                    "is not supported, only SLBW (1), MLBW (2) and "
+                    "Reich-Moore (3)"
+                )
+            isotope_ranges.append(_Range(rng, isotope["ABN"]))
+        ranges.append(isotope_ranges)
+    return ranges
+
+
+def resonance_cross_sections(section, energies, *, chunk_size=2**18):
+    """Evaluate the cross sections of the resolved resonance ranges.
+
+    Parameters
+    ----------
+    section : dict
+        A parsed MF2/MT151 section, e.g. ``endf_dict[2][151]``, parsed
+        with either array type.
+    energies : array_like
+        The incident neutron energies (eV), all positive.
+    chunk_size : int
+        The maximum number of energy-resonance pairs evaluated at once.
+        Smaller values need less memory, larger values fewer
+        iterations in Python.
+
+    Returns
+    -------
+    dict[int, numpy.ndarray]
+        The total (MT=1), elastic (MT=2), fission (MT=18) and capture
+        (MT=102) cross sections (barn) at ``energies``, the sum of the
+        contributions of the isotopes weighted by their abundance.
+
+    Raises
+    ------
+    NotImplementedError
+        If a resolved range uses another formalism than SLBW, MLBW or
+        Reich-Moore.
+    """
+    _require_numpy()
+    energies = _np.asarray(energies, dtype=float)
+    if energies.ndim != 1:
+        raise ValueError("energies must be one-dimensional")
+    if _np.any(energies <= 0.0):
+        raise ValueError("energies must be positive")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    total = {
+        mt: _np.zeros(energies.shape) for mt in (MT_ELASTIC, MT_FISSION, MT_CAPTURE)
+    }
+    for isotope_ranges in _resolved_ranges(section):
+        upper = max((rng.eh for rng in isotope_ranges), default=None)
+        for rng in isotope_ranges:
+            # adjacent ranges share their boundary, which is assigned to
+            # the upper one, apart from the end of the last range
+            inside = (energies >= rng.el) & (
+                (energies < rng.eh) | ((energies == rng.eh) & (rng.eh == upper))
+            )
+            if not inside.any():
+                continue
+            selected = energies[inside]
+            out = {mt: _np.zeros(selected.shape) for mt in total}
+            _add_range(rng, selected, chunk_size, out)
+            for mt, values in out.items():
+                total[mt][inside] += rng.abundance * values
+    result = {MT_TOTAL: total[MT_ELASTIC] + total[MT_FISSION] + total[MT_CAPTURE]}
+    result.update(total)
+    return result
@@ -16,6 +16,7 @@ import pytest
 from endf_parserpy import EndfParserCpp, parse_tape_file, write_tape_file
 from endf_parserpy.cli.cmd_utils import (
     open_endf_file,
+    parsed_material_dict,
     resolve_material_path,
     format_material_table,
 )
@@ -125,6 +126,17 @@ def test_format_material_table(two_material_tape, parser):
     assert "MAT=2925" in table and "MAT=3025" in table
 
 
+def test_parsed_material_dict_sections(tape_with_bad_material, parser):
+    material = open_endf_file(tape_with_bad_material, parser)[1]
+    endf_dict = parsed_material_dict(material, [1, (3, 2)])
+    assert sorted(endf_dict) == [1, 3]
+    assert list(endf_dict[3]) == [2]
+    assert endf_dict[1][451]["ZA"] == 30064
+    # the corrupted MF3/MT1 section is not parsed unless selected
+    with pytest.raises(Exception):
+        parsed_material_dict(material, [3])
+
+
 # --- Phase 3: the list subcommand ------------------------------------------
 
 
@@ -176,6 +188,60 @@ def test_validate_missing_file_among_good_ones_fails(tmp_path):
     assert "ok - " in result.stdout and "failed - " in result.stdout
 
 
+def test_validate_reports_all_failures(two_material_tape, tmp_path):
+    """Every failing section is reported, not only the first one."""
+    lines = Path(two_material_tape).read_text().splitlines(keepends=True)
+    targets = {("2925", " 3", "  1"), ("3025", " 3", "  2")}
+    corrupted = set()
+    for i, line in enumerate(lines):
+        key = (line[66:70], line[70:72], line[72:75])
+        if key in targets and key not in corrupted:
+            lines[i] = "BADBADBAD!!" + line[11:]
+            corrupted.add(key)
+    path = tmp_path / "bad.endf"
+    path.write_bytes("".join(lines).encode("latin-1"))
+    result = run_cli(["validate", str(path)])
+    assert result.returncode == 1
+    assert "material #0 (MAT 2925), section MF=3/MT=1" in result.stdout
+    assert "material #1 (MAT 3025), section MF=3/MT=2" in result.stdout
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_validate_parallel(tape_with_bad_material, tmp_path, jobs):
+    files = [str(CU), str(tape_with_bad_material), str(tmp_path / "nope.endf")]
+    result = run_cli(["validate", "-j", jobs, *files])
+    assert result.returncode == 1
+    assert "MAT 3025" in result.stdout
+    # the summary lists the files in the order given
+    summary = result.stdout.split("VALIDATION SUMMARY")[1].split()
+    assert summary[1::3] == ["ok", "failed", "failed"]
+    assert summary[3::3] == files
+
+
+def test_validate_submits_tasks_lazily(parser):
+    from endf_parserpy.cli.actions.validate import _iter_results, _material_tasks
+
+    consumed = []
+
+    def tasks():
+        for i in range(12):
+            for args in _material_tasks(str(CU)):
+                consumed.append(i)
+                yield i, args
+
+    results = _iter_results(parser, tasks(), 2)
+    next(results)
+    # no more than twice the number of jobs are pending, plus the tasks
+    # submitted in place of those completed
+    assert len(consumed) <= 8
+    assert len(list(results)) == 11 and len(consumed) == 12
+
+
+def test_validate_invalid_jobs():
+    result = run_cli(["validate", "-j", "0", str(CU)])
+    assert result.returncode == 2
+
+
 # --- Phase 5: the explain subcommand ---------------------------------------
 
 EXPLAIN_AWR = "ratio of the mass of the material to that of the neutron"
@@ -224,12 +290,36 @@ def test_match_multi_material_selective(two_material_tape):
 
 def test_match_parse_failure_reported_on_stderr(tape_with_bad_material):
     """A material that fails to parse is reported on stderr, exit code 2."""
-    result = run_cli(["match", str(tape_with_bad_material), "--query", "exists(/3/2)"])
+    result = run_cli(["match", str(tape_with_bad_material), "--query", "exists(/3/1)"])
     assert result.returncode == 2
     assert "parsing failed" in result.stderr
     assert "parsing failed" not in result.stdout
 
 
+def test_match_parses_only_referenced_sections(tape_with_bad_material):
+    """The corrupted MF3/MT1 section is not parsed if not referenced."""
+    result = run_cli(["match", str(tape_with_bad_material), "--query", "exists(/3/2)"])
+    assert result.returncode == 0
+    assert "material #1, MAT 3025" in result.stdout
+    assert result.stderr == ""
+
+
+@pytest.mark.parametrize("jobs", ["1", "3"])
+def test_match_parallel(two_material_tape, tmp_path, jobs):
+    files = [str(ZN), str(tmp_path / "nope.endf"), str(two_material_tape), str(CU)]
+    result = run_cli(["match", "-j", jobs, *files, "--query", "/1/451/ZA > 0"])
+    assert result.returncode == 2
+    assert "parsing failed: " + files[1] in result.stderr
+    # the matches are reported in the order of the files
+    matches = [line for line in result.stdout.splitlines() if "match: " in line]
+    assert matches == [
+        f"match: {files[0]}",
+        f"match: {files[2]} (material #0, MAT 2925)",
+        f"match: {files[2]} (material #1, MAT 3025)",
+        f"match: {files[3]}",
+    ]
+
+
 def test_match_exit_code_zero_on_hit(two_material_tape):
     """match exits 0 when at least one material matches."""
     result = run_cli(["match", str(two_material_tape), "--query", "exists(/3/2)"])
@@ -361,6 +451,36 @@ def test_convert_multi_material_roundtrip(two_material_tape, parser, tmp_path):
     assert [m[1][451]["MAT"] for m in materials] == [2925, 3025]
 
 
+def test_convert_json_lines_roundtrip(two_material_tape, parser, tmp_path):
+    """endf -> jsonl -> endf writes one line per material and preserves both."""
+    js = tmp_path / "tape.jsonl"
+    rt = tmp_path / "roundtrip.endf"
+    assert (
+        run_cli(
+            ["convert", str(two_material_tape), str(js), "--to", "jsonl"]
+        ).returncode
+        == 0
+    )
+    assert len(js.read_text().splitlines()) == 2
+    assert run_cli(["convert", str(js), str(rt), "--to", "endf"]).returncode == 0
+    materials = parse_tape_file(rt, parser=parser)
+    assert [m[1][451]["MAT"] for m in materials] == [2925, 3025]
+
+
+def test_convert_npz_roundtrip(two_material_tape, parser, tmp_path):
+    """endf -> npz -> endf preserves both materials."""
+    pytest.importorskip("numpy")
+    npz = tmp_path / "tape.npz"
+    rt = tmp_path / "roundtrip.endf"
+    assert (
+        run_cli(["convert", str(two_material_tape), str(npz), "--to", "npz"]).returncode
+        == 0
+    )
+    assert run_cli(["convert", str(npz), str(rt), "--to", "endf"]).returncode == 0
+    materials = parse_tape_file(rt, parser=parser)
+    assert [m[1][451]["MAT"] for m in materials] == [2925, 3025]
+
+
 # --- Phase 10: the insert-text subcommand ----------------------------------
 
 MARKER = "INSERTED MARKER LINE"
@@ -456,6 +576,71 @@ def test_compare_multi_vs_single_partial(two_material_tape):
     assert "MAT 3025" in result.stdout
 
 
+def test_compare_include(modified_cu):
+    """Only the sections given by --include are compared."""
+    result = run_cli(["compare", "--include", "3", str(CU), str(modified_cu)])
+    assert result.returncode == 0
+    argv = ["compare", "--include", "3/1", "--include", "1/451"]
+    result = run_cli([*argv, str(CU), str(modified_cu)])
+    assert result.returncode == 1
+    assert "AWR" in result.stdout
+    result = run_cli(["compare", "--include", "3/x", str(CU), str(CU)])
+    assert result.returncode == 2
+
+
+@pytest.fixture(scope="module")
+def modified_tape(tmp_path_factory, parser, two_material_tape):
+    """The 2-material tape with a field changed in two sections of each
+    material."""
+    materials = parse_tape_file(two_material_tape, parser=parser)
+    for mat_dict in materials:
+        mat_dict[1][451]["AWR"] = mat_dict[1][451]["AWR"] + 1.0
+        mat_dict[3][1]["QM"] = mat_dict[3][1]["QM"] + 1.0
+    path = tmp_path_factory.mktemp("modtape") / "tape_mod.endf"
+    write_tape_file(materials, path, parser=parser, overwrite=True)
+    return path
+
+
+def test_compare_quick(modified_tape, two_material_tape):
+    """With --quick, only the first difference is reported."""
+    argv = ["compare", str(two_material_tape), str(modified_tape)]
+    result = run_cli(argv)
+    assert result.returncode == 1
+    assert result.stdout.count("AWR") == 2 and result.stdout.count("QM") == 2
+    result = run_cli([*argv, "--quick"])
+    assert result.returncode == 1
+    lines = result.stdout.splitlines()
+    assert len(lines) == 2
+    assert "MAT 2925" in lines[0] and "AWR" in lines[1]
+
+
+def test_compare_quick_reports_unpaired_first(two_material_tape):
+    """With --quick, unpaired materials are reported without comparing data."""
+    result = run_cli(["compare", "--quick", str(two_material_tape), str(CU)])
+    assert result.returncode == 1
+    assert result.stdout.startswith("unpaired")
+    assert "===" not in result.stdout
+
+
+def test_compare_identical_sections_not_parsed(tape_with_bad_material):
+    """Byte-identical materials compare equal without being parsed."""
+    bad = str(tape_with_bad_material)
+    result = run_cli(["compare", bad, bad])
+    assert result.returncode == 0
+    assert "Traceback" not in result.stderr
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_compare_parallel(modified_tape, two_material_tape, jobs):
+    """The output does not depend on the number of jobs."""
+    argv = ["compare", str(two_material_tape), str(modified_tape)]
+    expected = run_cli(argv)
+    result = run_cli([*argv, "-j", str(jobs)])
+    assert result.returncode == expected.returncode == 1
+    assert result.stdout == expected.stdout
+    assert result.stdout.index("MAT 2925") < result.stdout.index("MAT 3025")
+
+
 def test_compare_missing_file_clean_error(tmp_path):
     """An unreadable file is reported cleanly (exit code 2, no traceback)."""
     result = run_cli(["compare", str(CU), str(tmp_path / "nope.endf")])
@@ -0,0 +1,84 @@
+import math
+import pytest
+
+from endf_parserpy.utils import debugging_utils
+from endf_parserpy.utils.debugging_utils import compare_objects
+from endf_parserpy.utils.math_utils import EndfFloat
+
+np = pytest.importorskip("numpy")
+
+
+def _floats(n, offset=0.0):
+    return [1e-5 * 1.1**i + offset for i in range(n)]
+
+
+def _cases():
+    x = _floats(50)
+    y = list(x)
+    y[3] *= 1.5
+    y[17] = x[17] + 1e-12
+    y[40] = -x[40]
+    yield "float_list", {"xs": x}, {"xs": y}
+    yield "float_dict", {"xs": dict(enumerate(x, 1))}, {"xs": dict(enumerate(y, 1))}
+    yield "ndarray", {"xs": np.array(x)}, {"xs": np.array(y)}
+    yield "ndarray_2d", {"xs": np.reshape(x, (10, 5))}, {"xs": np.reshape(y, (10, 5))}
+    yield "float32_array", {"xs": np.array(x, dtype=np.float32)}, {
+        "xs": np.array(y, dtype=np.float32)
+    }
+    ints = list(range(30))
+    yield "int_list", {"n": ints}, {"n": ints[:5] + [99] + ints[6:]}
+    yield "big_ints", {"n": [2**70] * 20}, {"n": [2**70] * 19 + [1]}
+    yield "mixed_types", {"xs": x[:20] + [1]}, {"xs": y[:20] + [1.0]}
+    yield "endf_floats", {"xs": [EndfFloat(v, str(v)) for v in x]}, {"xs": y}
+    special = [math.nan, math.inf, -math.inf] + x[:20]
+    yield "nan_inf", {"xs": special}, {"xs": list(special)}
+    yield "dict_keys_differ", {"xs": dict(enumerate(x))}, {"xs": dict(enumerate(y, 1))}
+    yield "length_differs", {"xs": x}, {"xs": y[:-1]}
+    yield "equal", {"xs": x, "ys": dict(enumerate(y))}, {
+        "xs": list(x),
+        "ys": dict(enumerate(y)),
+    }
+
+
+CASES = list(_cases())
+
+
+def _diff_log(obj1, obj2):
+    diff_log = []
+    is_equal = compare_objects(obj1, obj2, fail_on_diff=False, diff_log=diff_log)
+    return is_equal, diff_log
+
+
+@pytest.mark.parametrize("name,obj1,obj2", CASES, ids=[c[0] for c in CASES])
+def test_vectorized_comparison_matches_elementwise(name, obj1, obj2, monkeypatch):
+    result = _diff_log(obj1, obj2)
+    monkeypatch.setattr(debugging_utils, "_VECTORIZE_MIN_SIZE", math.inf)
+    expected = _diff_log(obj1, obj2)
+    assert result == expected
+    assert result[0] == (name == "equal")
+
+
+def test_vectorized_comparison_raises_first_difference(monkeypatch):
+    x = _floats(40)
+    y = list(x)
+    y[7] += 1.0
+    y[30] += 1.0
+    with pytest.raises(ValueError) as vectorized:
+        compare_objects(x, y)
+    monkeypatch.setattr(debugging_utils, "_VECTORIZE_MIN_SIZE", math.inf)
+    with pytest.raises(ValueError) as elementwise:
+        compare_objects(x, y)
+    assert str(vectorized.value) == str(elementwise.value)
+    assert "[7]" in str(vectorized.value)
+
+
+def test_mismatch_positions():
+    x = np.array(_floats(20))
+    y = x.copy()
+    y[[2, 11]] += 1.0
+    positions = debugging_utils._mismatch_positions
+    assert positions(x, y, atol=1e-8, rtol=1e-6) == [2, 11]
+    assert positions(x.tolist(), y.tolist(), atol=1e-8, rtol=1e-6) == [2, 11]
+    # short sequences and sequences of other objects are not vectorized
+    assert positions(x[:5].tolist(), y[:5].tolist(), atol=1e-8, rtol=1e-6) is None
+    assert positions(["a"] * 20, ["a"] * 20, atol=1e-8, rtol=1e-6) is None
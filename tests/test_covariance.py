@@ -0,0 +1,232 @@
+import pytest
+
+from endf_parserpy import EndfParserFactory
+
+np = pytest.importorskip("numpy")
+
+from endf_parserpy.utils.covariance import (
+    CooMatrix,
+    covariance_matrix,
+    errorr_covariance_matrix,
+    errorr_subsection,
+    lb5_subsection,
+)
+
+
+TPID = " " * 66 + "   1 0  0    0"
+
+
+def _mf33_section():
+    energies = {1: 1.0, 2: 2.0, 3: 3.0, 4: 4.0}
+    symmetric = {k: {kp: float(10 * k + kp) for kp in range(k, 4)} for k in (1, 2, 3)}
+    asymmetric = {k: {kp: float(10 * k + kp) for kp in (1, 2, 3)} for k in (1, 2, 3)}
+    self_covariance = {
+        "XMF1": 0.0,
+        "XLFS1": 0.0,
+        "MAT1": 0,
+        "MT1": 1,
+        "NC": 0,
+        "NI": 4,
+        "ni_subsection": {
+            1: {"LB": 5, "LS": 1, "NE": 4, "E": energies, "F": symmetric},
+            2: {
+                "LB": 1,
+                "LT": 0,
+                "NP": 3,
+                "Ek": {1: 1.0, 2: 2.5, 3: 4.0},
+                "Fk": {1: 0.1, 2: 0.2, 3: 0.0},
+            },
+            3: {"LB": 5, "LS": 0, "NE": 4, "E": energies, "F": asymmetric},
+            4: {
+                "LB": 0,
+                "LT": 0,
+                "NP": 2,
+                "Ek": {1: 1.0, 2: 4.0},
+                "Fk": {1: 7.0, 2: 0.0},
+            },
+        },
+    }
+    cross_covariance = {
+        "XMF1": 0.0,
+        "XLFS1": 0.0,
+        "MAT1": 0,
+        "MT1": 102,
+        "NC": 0,
+        "NI": 1,
+        "ni_subsection": {
+            1: {
+                "LB": 6,
+                "NER": 3,
+                "NEC": 2,
+                "ER": {1: 1.0, 2: 2.0, 3: 3.0},
+                "EC": {1: 1.0, 2: 4.0},
+                "F": {1: {1: 0.5}, 2: {1: 0.6}},
+            }
+        },
+    }
+    return {
+        "MAT": 2925,
+        "MF": 33,
+        "MT": 1,
+        "ZA": 29063.0,
+        "AWR": 62.4,
+        "MTL": 0,
+        "NL": 2,
+        "subsection": {1: self_covariance, 2: cross_covariance},
+    }
+
+
+@pytest.fixture(scope="module", params=["dict", "list"])
+def subsections(request):
+    # the section as either parser array type returns it
+    writer = EndfParserFactory.create(select="python", print_cache_info=False)
+    lines = writer.write({33: {1: _mf33_section()}})
+    parser = EndfParserFactory.create(
+        select="python", array_type=request.param, print_cache_info=False
+    )
+    subsection = parser.parse([TPID] + lines)[33][1]["subsection"]
+    if request.param == "dict":
+        return subsection[1], subsection[2]
+    return tuple(subsection)
+
+
+def test_covariance_matrix_on_union_grid(subsections):
+    energies, matrix = covariance_matrix(subsections[0])
+    assert energies.tolist() == [1.0, 2.0, 2.5, 3.0, 4.0]
+    # the LB=5 blocks on the intervals [0, 1, 1, 2] of their grid plus
+    # the LB=1 block with the intervals [0, 0, 1, 1]
+    expected = [
+        [22.1, 24.1, 24.0, 26.0],
+        [33.1, 44.1, 44.0, 46.0],
+        [33.0, 44.0, 44.2, 46.2],
+        [44.0, 55.0, 55.2, 66.2],
+    ]
+    assert np.allclose(matrix, expected)
+    # the LB=0 block is absolute
+    _, absolute = covariance_matrix(subsections[0], absolute=True)
+    assert absolute.tolist() == [[7.0] * 4] * 4
+    # the rows and columns of an LB=6 block follow their own grids
+    energies, matrix = covariance_matrix(subsections[1])
+    assert energies.tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert matrix.tolist() == [[0.5] * 3, [0.6] * 3, [0.0] * 3]
+
+
+def test_covariance_matrix_on_given_grid(subsections):
+    _, matrix = covariance_matrix(subsections[0], energies=[0.5, 1.0, 1.5, 3.5, 5.0])
+    # groups are assigned by their midpoint; groups outside are zero
+    assert matrix[0].tolist() == [0.0] * 4
+    assert np.allclose(
+        matrix[1:, 1:],
+        [[22.1, 24.0, 0.0], [33.0, 44.2, 0.0], [0.0, 0.0, 0.0]],
+    )
+    _, sparse = covariance_matrix(subsections[0], energies=[1.0, 2.0, 4.0], sparse=True)
+    assert isinstance(sparse, CooMatrix)
+    assert np.allclose(sparse.toarray(), [[22.1, 26.0], [44.0, 66.2]])
+    with pytest.raises(ValueError):
+        covariance_matrix(subsections[0], energies=[2.0, 1.0])
+
+
+def test_covariance_matrix_of_correlated_blocks():
+    lb2 = {"LB": 2, "LT": 0, "NP": 3, "Ek": [1.0, 2.0, 3.0], "Fk": [0.1, 0.2, 0.0]}
+    _, matrix = covariance_matrix(lb2)
+    assert np.allclose(matrix, [[0.01, 0.02], [0.02, 0.04]])
+    lb3 = {
+        "LB": 3,
+        "LT": 2,
+        "NP": 4,
+        "Ek": [1.0, 3.0],
+        "Fk": [0.1, 0.0],
+        "El": [1.0, 2.0],
+        "Fl": [0.3, 0.0],
+    }
+    _, matrix = covariance_matrix(lb3, energies=[1.0, 2.0, 3.0])
+    assert np.allclose(matrix, [[0.03, 0.0], [0.03, 0.0]])
+    # LB=8 variances scale with the inverse width of a group
+    lb8 = {"LB": 8, "LT": 0, "NP": 2, "E": [1.0, 3.0], "F": [0.4, 0.0]}
+    _, matrix = covariance_matrix(lb8, energies=[1.0, 2.0, 3.0], absolute=True)
+    assert np.allclose(matrix, [[0.8, 0.0], [0.0, 0.8]])
+    with pytest.raises(ValueError):
+        covariance_matrix({"LB": 9, "E": [1.0, 2.0], "F": [1.0, 0.0]})
+
+
+def test_covariance_matrix_warns_of_nc_subsections():
+    lb1 = {"LB": 1, "LT": 0, "NP": 2, "Ek": [1.0, 2.0], "Fk": [0.1, 0.0]}
+    derived = {"LTY": 0, "E1": 2.0, "E2": 3.0, "NCI": 1, "C": [1.0], "XMT": [4]}
+    subsection = {"NC": 1, "NI": 1, "nc_subsection": [derived], "ni_subsection": [lb1]}
+    with pytest.warns(UserWarning, match="LTY=0 from 2.0 to 3.0 eV"):
+        energies, matrix = covariance_matrix(subsection)
+    assert energies.tolist() == [1.0, 2.0]
+    assert np.allclose(matrix, [[0.1]])
+
+
+@pytest.mark.parametrize("layout", ["dict", "list"])
+def test_lb5_subsection_roundtrip(layout):
+    parser = EndfParserFactory.create(
+        select="python", array_type=layout, print_cache_info=False
+    )
+    energies = np.linspace(1.0, 2.0, 6)
+    matrix = np.arange(25.0).reshape(5, 5)
+    for block in (
+        lb5_subsection(energies, matrix + matrix.T, array_type=layout),
+        lb5_subsection(energies, matrix, array_type=layout),
+    ):
+        section = _mf33_section()
+        section["NL"] = 1
+        del section["subsection"][2]
+        section["subsection"][1]["NI"] = 1
+        section["subsection"][1]["ni_subsection"] = {1: block}
+        if layout == "list":
+            section["subsection"] = [section["subsection"][1]]
+            section["subsection"][0]["ni_subsection"] = [block]
+        parsed = parser.parse([TPID] + parser.write({33: {1: section}}))
+        subsection = parsed[33][1]["subsection"]
+        subsection = subsection[1] if layout == "dict" else subsection[0]
+        grid, restored = covariance_matrix(subsection)
+        assert grid.tolist() == energies.tolist()
+        expected = matrix + matrix.T if block["LS"] == 1 else matrix
+        assert restored.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("layout", ["dict", "list"])
+def test_errorr_roundtrip(layout):
+    parser = EndfParserFactory.create(
+        select="python",
+        endf_format="errorr",
+        array_type=layout,
+        print_cache_info=False,
+    )
+    rng = np.random.default_rng(1)
+    matrix = np.round(rng.random((30, 30)), 3)
+    matrix[matrix < 0.7] = 0.0
+    matrix[-5:] = 0.0
+    subsection = errorr_subsection(matrix, mt1=102, array_type=layout)
+    section = {
+        "MAT": 2925,
+        "MF": 33,
+        "MT": 1,
+        "ZA": 29063.0,
+        "AWR": 62.4,
+        "MTL": 0,
+        "NK": 1,
+        "subsection": [subsection] if layout == "list" else {1: subsection},
+    }
+    parsed = parser.parse([TPID] + parser.write({33: {1: section}}))
+    subsection = parsed[33][1]["subsection"]
+    subsection = subsection[1] if layout == "dict" else subsection[0]
+    assert subsection["MT1"] == 102
+    assert np.array_equal(errorr_covariance_matrix(subsection), matrix)
+    sparse = errorr_covariance_matrix(subsection, sparse=True)
+    assert np.array_equal(sparse.toarray(), matrix)
+    csr = sparse.tocsr()
+    assert np.array_equal(csr.toarray(), matrix)
+    vector = rng.random(30)
+    assert np.allclose(csr.dot(vector), matrix @ vector)
+
+
+def test_errorr_matrix_of_many_groups():
+    ng = 1000
+    matrix = np.eye(ng) + np.diag(np.full(ng - 1, 0.5), 1)
+    subsection = errorr_subsection(matrix, mt1=1)
+    assert len(subsection["COV"]) == ng
+    assert np.array_equal(errorr_covariance_matrix(subsection), matrix)
+    assert errorr_covariance_matrix(subsection, sparse=True).nnz == 2 * ng - 1
@@ -0,0 +1,145 @@
+import copy
+import pytest
+from pathlib import Path
+
+from endf_parserpy import EndfFile, EndfParserFactory, EndfParserPy, compare_objects
+
+np = pytest.importorskip("numpy")
+
+from endf_parserpy.utils.distributions import (
+    pack_mf6,
+    pack_subsection,
+    unpack_mf6,
+    unpack_subsection,
+)
+
+
+TESTDATA = Path(__file__).parent / "testdata"
+
+
+def _law7_subsection():
+    # the tables are TAB1 records, whose arrays are stored as lists
+    def table(ep, f):
+        return {"NBT": [len(ep)], "INT": [2], "Ep": ep, "f": f}
+
+    return {
+        "ZAP": 1.0,
+        "AWP": 1.0,
+        "LIP": 0,
+        "LAW": 7,
+        "E_interpol": {"NBT": [2], "INT": [2]},
+        "E": {1: 1e5, 2: 2e6},
+        "NMU": {1: 2, 2: 3},
+        "mu": {1: {1: -1.0, 2: 1.0}, 2: {1: -1.0, 2: 0.0, 3: 1.0}},
+        "mu_interpol": {1: {"NBT": [2], "INT": [2]}, 2: {"NBT": [3], "INT": [1]}},
+        "table": {
+            1: {1: table([0.0, 1e5], [1.0, 0.0]), 2: table([0.0], [2.0])},
+            2: {
+                1: table([0.0, 1e6, 2e6], [0.5, 1.0, 0.0]),
+                2: table([0.0, 2e6], [1.0, 0.0]),
+                3: table([0.0, 2e6], [3.0, 0.0]),
+            },
+        },
+    }
+
+
+def _law5_subsection():
+    return {
+        "LAW": 5,
+        "SPI": 0.5,
+        "LIDP": 1,
+        "E": {1: 1e6, 2: 2e6},
+        "LTP": {1: 12, 2: 12},
+        "NW": {1: 4, 2: 2},
+        "NL": {1: 2, 2: 1},
+        "A": {1: {1: -1.0, 2: 1.0, 3: 0.0, 4: 2.0}, 2: {1: 0.0, 2: 1.0}},
+    }
+
+
+@pytest.fixture(scope="module")
+def lines():
+    with open(TESTDATA / "n_2925_29-Cu-63.endf") as fh:
+        return fh.read().splitlines()
+
+
+@pytest.mark.parametrize("layout", ["dict", "list"])
+def test_mf6_roundtrip(lines, layout):
+    parser = EndfParserPy(array_type=layout, print_cache_info=False)
+    parsed = parser.parse(lines, include=[6])
+    for mt, section in parsed[6].items():
+        original = copy.deepcopy(section)
+        pack_mf6(section)
+        subsections = section["subsection"]
+        subsections = subsections.values() if layout == "dict" else subsections
+        for sub in subsections:
+            if sub["LAW"] == 1:
+                assert sub["Ep"].ndim == 1 and sub["b"].ndim == 1
+                assert np.array_equal(np.diff(sub["Ep_offsets"]), sub["NEP"])
+                width = sub["NEP"] * (sub["NA"] + 1)
+                assert np.array_equal(np.diff(sub["b_offsets"]), width)
+            elif sub["LAW"] == 2:
+                assert np.array_equal(np.diff(sub["A_offsets"]), sub["NLW"])
+        # packing twice does nothing
+        pack_mf6(section)
+        unpack_mf6(section, layout)
+        assert section == original
+
+
+def test_law5_and_law7():
+    for sub in (_law5_subsection(), _law7_subsection()):
+        original = copy.deepcopy(sub)
+        pack_subsection(sub)
+        if sub["LAW"] == 7:
+            assert sub["mu"].tolist() == [-1.0, 1.0, -1.0, 0.0, 1.0]
+            assert sub["table_offsets"].tolist() == [0, 2, 3, 6, 8, 10]
+            assert sub["f"][sub["table_offsets"][3]] == 1.0
+            assert sub["mu_INT"].tolist() == [2, 1]
+        else:
+            assert sub["A"].tolist() == [-1.0, 1.0, 0.0, 2.0, 0.0, 1.0]
+            assert sub["A_offsets"].tolist() == [0, 4, 6]
+        compare_objects(original, unpack_subsection(copy.deepcopy(sub)))
+        listed = unpack_subsection(sub, "list")
+        assert listed["E"] == [original["E"][1], original["E"][2]]
+
+
+def test_inconsistent_counts():
+    sub = _law5_subsection()
+    sub["NW"][2] = 3
+    with pytest.raises(ValueError):
+        pack_subsection(sub)
+    sub = _law7_subsection()
+    del sub["table"][2][3]
+    with pytest.raises(ValueError):
+        pack_subsection(sub)
+
+
+@pytest.mark.parametrize("layout", ["dict", "list"])
+def test_parser_with_packed_mf6(lines, layout):
+    parser = EndfParserFactory.create(
+        select="python", array_type=layout, mf6_type="ndarray", print_cache_info=False
+    )
+    parsed = parser.parse(lines)
+    section = parsed[6][16]
+    sub = section["subsection"][1] if layout == "dict" else section["subsection"][0]
+    assert isinstance(sub["Ep"], np.ndarray)
+    # the sections are unpacked for writing and left as they are
+    assert parser.write(parsed) == lines
+    assert isinstance(sub["Ep"], np.ndarray)
+    nested = EndfParserPy(array_type=layout, print_cache_info=False).parse(lines)
+    assert unpack_mf6(section, layout) == nested[6][16]
+
+
+def test_endf_file_with_packed_mf6(lines):
+    parser = EndfParserFactory.create(
+        select="python", mf6_type="ndarray", print_cache_info=False
+    )
+    with EndfFile(TESTDATA / "n_2925_29-Cu-63.endf", parser=parser) as endf_file:
+        section = endf_file[0][6, 16]
+        assert isinstance(section["subsection"][1]["b"], np.ndarray)
+        endf_file[0][6, 16] = section
+        assert endf_file.to_string().splitlines() == lines
+
+
+def test_invalid_mf6_type():
+    with pytest.raises(ValueError):
+        EndfParserPy(mf6_type="numpy", print_cache_info=False)
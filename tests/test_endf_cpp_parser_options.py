@@ -123,3 +123,12 @@ def test_list_mode_reading():
     endf_dict1 = parser_py.parsefile(endf_file)
     endf_dict2 = parser_cpp.parsefile(endf_file)
     compare_objects(endf_dict1, endf_dict2)
+
+
+def test_max_records_option():
+    parser_py = EndfParserPy()
+    parser_cpp = EndfParserCpp()
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    endf_dict1 = parser_py.parsefile(endf_file, max_records=2)
+    endf_dict2 = parser_cpp.parsefile(endf_file, max_records=2)
+    compare_objects(endf_dict1, endf_dict2)
@@ -1,5 +1,6 @@
 import gc
 import pickle
+import threading
 import time
 import pytest
 from pathlib import Path
@@ -186,6 +187,37 @@ def test_mode_parse_all(tape_file, parser):
     assert endf_file.cache_nbytes[1] > 0
 
 
+def test_parallel_parse_all_matches_serial(tape_file, parser):
+    serial = EndfFile(tape_file, parser=parser, mode="parse_all")
+    parallel = EndfFile(tape_file, parser=parser, mode="parse_all", workers=2)
+    assert parallel.cache_nbytes == serial.cache_nbytes
+    assert list(parallel._section_cache._strong) == list(serial._section_cache._strong)
+    for key, (section, _) in serial._section_cache._strong.items():
+        assert parallel._section_cache.get(key) == section
+
+
+def test_parallel_load_raw_matches_serial(tape_file, parser):
+    serial = EndfFile(tape_file, parser=parser, mode="load_raw")
+    parallel = EndfFile(tape_file, parser=parser, mode="load_raw", workers=3)
+    assert parallel.cache_nbytes == serial.cache_nbytes
+    assert parallel._raw_cache._od == serial._raw_cache._od
+
+
+def test_parallel_parse_all_marks_failed_sections(multi_lines, tmp_path, parser):
+    path = _corrupt_tape(multi_lines, tmp_path)
+    endf_file = EndfFile(path, parser=parser, mode="parse_all", workers=2)
+    with pytest.raises(SectionParseError, match="MF=1/MT=451"):
+        endf_file[0][1, 451]
+    assert endf_file[1][1, 451]["AWR"] is not None
+    with pytest.raises(SectionParseError, match="MF=1/MT=451"):
+        EndfFile(path, parser=parser, mode="parse_all", workers=2, on_error="raise")
+
+
+def test_invalid_workers(tape_file, parser):
+    with pytest.raises(ValueError, match="workers"):
+        EndfFile(tape_file, parser=parser, mode="parse_all", workers=0)
+
+
 def test_open_a_valid_empty_tape(tmp_path, parser):
     path = tmp_path / "empty.endf"
     path.write_bytes((DEFAULT_TPID_LINE + "\n" + TEND_LINE + "\n").encode("latin-1"))
@@ -285,6 +317,87 @@ def test_verify_source_detects_change(tape_file, parser):
         endf_file[0][1, 451]
 
 
+# --------------------------------------------------------------------------
+# thread-safe mode
+# --------------------------------------------------------------------------
+
+
+def _run_threads(target, count):
+    errors = []
+
+    def runner(i):
+        try:
+            target(i)
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=runner, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_thread_safe_concurrent_reads(tape_file, parser):
+    serial = EndfFile(tape_file, parser=parser)
+    keys = [
+        (position, key)
+        for position in range(len(serial))
+        for key in serial[position].sections()
+    ]
+    expected = {k: dict(serial[k[0]][k[1]]) for k in keys}
+
+    endf_file = EndfFile(tape_file, parser=parser, thread_safe=True)
+    results = [{} for _ in range(8)]
+
+    def read_all(i):
+        # every thread walks the sections in a different order
+        for position, key in keys[i:] + keys[:i]:
+            results[i][position, key] = dict(endf_file[position][key])
+
+    _run_threads(read_all, 8)
+    assert all(result == expected for result in results)
+    endf_file.close()
+
+
+def test_thread_safe_coalesces_concurrent_misses(tape_file, parser):
+    endf_file = EndfFile(tape_file, parser=parser, thread_safe=True)
+    calls = []
+    original_parse = endf_file.parser.parse
+
+    def slow_parse(*args, **kwargs):
+        calls.append(1)
+        time.sleep(0.05)  # keep the miss open while the others arrive
+        return original_parse(*args, **kwargs)
+
+    endf_file.parser.parse = slow_parse
+    barrier = threading.Barrier(6)
+    sections = [None] * 6
+
+    def read(i):
+        barrier.wait()
+        sections[i] = endf_file[0][1, 451]._target
+
+    _run_threads(read, 6)
+    assert len(calls) == 1
+    assert all(section is sections[0] for section in sections)
+
+
+def test_thread_safe_close_and_pickle(tape_file, parser):
+    with EndfFile(tape_file, parser=parser, thread_safe=True) as endf_file:
+        expected = dict(endf_file[0][1, 451])
+    # a closed object reopens its shared descriptor on the next read
+    endf_file.unload()
+    assert dict(endf_file[0][1, 451]) == expected
+    endf_file.close()
+    restored = pickle.loads(pickle.dumps(endf_file))
+    assert restored.thread_safe
+    assert dict(restored[1][1, 451]) == expected
+    restored.close()
+    assert not EndfFile(tape_file, parser=parser).thread_safe
+
+
 # --------------------------------------------------------------------------
 # pickling
 # --------------------------------------------------------------------------
@@ -3,7 +3,10 @@ from pathlib import Path
 from endf_parserpy.interpreter import EndfParserPy
 from endf_parserpy.utils.debugging_utils import compare_objects
 from endf_parserpy.utils.user_tools import list_parsed_sections
-from endf_parserpy.interpreter.custom_exceptions import UnexpectedControlRecordError
+from endf_parserpy.interpreter.custom_exceptions import (
+    UnexpectedControlRecordError,
+    UnexpectedEndOfInputError,
+)
 
 
 def test_parsefile_include_single_mf_option():
@@ -210,3 +213,44 @@ def test_array_type_list_and_list_slow_equivalent():
     endf_dict1 = parser1.parsefile(endf_file)
     endf_dict2 = parser2.parsefile(endf_file)
     compare_objects(endf_dict1, endf_dict2)
+
+
+def test_max_records_option():
+    parser = EndfParserPy()
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    full_dict = parser.parsefile(endf_file)
+    head_dict = parser.parsefile(endf_file, max_records=1)
+    mf1 = head_dict[1][451]
+    assert set(mf1) == {"MAT", "MF", "MT", "ZA", "AWR", "LRP", "LFI", "NLIB", "NMOD"}
+    assert all(mf1[k] == full_dict[1][451][k] for k in mf1)
+    # a TAB1 record counts as one record, however many lines it spans
+    mf3 = parser.parsefile(endf_file, include=[3], max_records=2)[3][1]
+    compare_objects(mf3, full_dict[3][1])
+    # the records read within a lookahead are not counted
+    assert head_dict[4][2]["LTT"] == full_dict[4][2]["LTT"]
+    # with a limit above the number of records sections are parsed in full
+    compare_objects(parser.parsefile(endf_file, max_records=10**6), full_dict)
+
+
+def test_max_records_option_with_truncated_section():
+    parser = EndfParserPy()
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    with open(endf_file) as fh:
+        lines = fh.read().splitlines()
+    mf3_lines = [i for i, line in enumerate(lines) if line[70:75] == " 3  1"]
+    start = mf3_lines[0]
+    tpid = lines[0]
+    end_lines = [
+        " " * 66 + "2925 3  0",
+        " " * 66 + "2925 0  0",
+        " " * 66 + "   0 0  0",
+        " " * 66 + "  -1 0  0",
+    ]
+    head = [tpid] + lines[start : start + 2] + end_lines
+    mf3 = parser.parse(head, max_records=1)[3][1]
+    assert mf3["ZA"] == 29063.0
+    # the TAB1 record does not fit into the lines given
+    with pytest.raises(UnexpectedEndOfInputError):
+        parser.parse(head, max_records=2)
+    with pytest.raises(ValueError):
+        parser.parse(head, max_records=-1)
@@ -0,0 +1,245 @@
+import pytest
+from pathlib import Path
+
+from endf_parserpy import EndfParserFactory, EndfFile, parse_tape_file
+
+np = pytest.importorskip("numpy")
+
+from endf_parserpy.utils.interpolation import (
+    Tab1Interpolator,
+    Tab2Interpolator,
+    interpolate,
+)
+from endf_parserpy.utils.cross_sections import (
+    cross_section_table,
+    unionized_energy_grid,
+)
+
+
+TESTDATA = Path(__file__).parent / "testdata"
+CU = TESTDATA / "n_2925_29-Cu-63.endf"  # MAT 2925
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return EndfParserFactory.create(select="python", print_cache_info=False)
+
+
+@pytest.fixture(scope="module")
+def cu(parser):
+    return parse_tape_file(CU, parser=parser, include=[3])[0]
+
+
+@pytest.mark.parametrize(
+    "law, expected",
+    [
+        (1, 2.0),
+        (2, 5.0),
+        (3, 2.0 + 6.0 * np.log(2.5) / np.log(4.0)),
+        (4, 2.0 * np.exp(np.log(4.0) * 0.5)),
+        (5, 2.0 * np.exp(np.log(4.0) * np.log(2.5) / np.log(4.0))),
+    ],
+)
+def test_interpolation_laws(law, expected):
+    value = interpolate([1.0, 4.0], [2.0, 8.0], [2], [law], 2.5)
+    assert value == pytest.approx(expected)
+    # the end points are reproduced by every law
+    ends = interpolate([1.0, 4.0], [2.0, 8.0], [2], [law], [1.0, 4.0])
+    assert ends.tolist() == pytest.approx([2.0, 8.0])
+
+
+def test_interpolation_regions_and_discontinuities():
+    x = [1.0, 2.0, 2.0, 3.0, 4.0]
+    y = [1.0, 1.0, 5.0, 7.0, 8.0]
+    # histogram up to the third point, lin-lin beyond
+    xnew = [0.5, 1.5, 2.0, 2.5, 3.5, 4.0, 4.5]
+    values = interpolate(x, y, [3, 5], [1, 2], xnew, outside=-1.0)
+    assert values.tolist() == pytest.approx([-1.0, 1.0, 5.0, 6.0, 7.5, 8.0, -1.0])
+    # counter-indexed dicts, as in array_type="dict", work as well
+    as_dict = {i + 1: v for i, v in enumerate(y)}
+    again = interpolate(x, as_dict, {1: 3, 2: 5}, {1: 1, 2: 2}, xnew, outside=-1.0)
+    assert again.tolist() == values.tolist()
+
+
+def test_logarithmic_laws_fall_back_to_linear():
+    values = interpolate([0.0, 2.0], [0.0, 4.0], [2], [5], [1.0])
+    assert values.tolist() == pytest.approx([2.0])
+
+
+@pytest.mark.parametrize(
+    "x, y, nbt, laws",
+    [
+        ([1.0, 2.0], [1.0], [2], [2]),
+        ([2.0, 1.0], [1.0, 1.0], [2], [2]),
+        ([1.0, 2.0], [1.0, 1.0], [1], [2]),
+        ([1.0, 2.0], [1.0, 1.0], [2], [6]),
+    ],
+)
+def test_interpolation_rejects_malformed_tables(x, y, nbt, laws):
+    with pytest.raises(ValueError):
+        interpolate(x, y, nbt, laws, [1.5])
+
+
+@pytest.fixture(scope="module", params=["dict", "list"])
+def cu_mf4(request):
+    parser = EndfParserFactory.create(
+        select="python", array_type=request.param, print_cache_info=False
+    )
+    return parse_tape_file(CU, parser=parser, include=[4])[0][4][2]
+
+
+def test_tab1_interpolator_from_record(cu):
+    xstable = cu[3][102]["xstable"]
+    xs = Tab1Interpolator.from_record(xstable)
+    assert len(xs) == len(xstable["E"])
+    points = np.geomspace(1e-5, 2e7, 10**6)
+    values = xs(points)
+    assert values.shape == points.shape
+    expected = interpolate(
+        xstable["E"], xstable["xs"], xstable["NBT"], xstable["INT"], points
+    )
+    assert np.array_equal(values, expected)
+    assert xs(xstable["E"][-1]) == xstable["xs"][-1]
+    # the columns of a record with further list fields must be named
+    record = dict(xstable, C=[1.0, 2.0])
+    with pytest.raises(ValueError):
+        Tab1Interpolator.from_record(record)
+    named = Tab1Interpolator.from_record(record, "E", "xs", outside=-1.0)
+    assert named(1e9) == -1.0
+
+
+def test_tab1_interpolator_of_distribution(cu_mf4):
+    # in array_type="dict" the tables of a loop are indexed by counters
+    angtable = cu_mf4["angtable"]
+    first = angtable[min(angtable)] if isinstance(angtable, dict) else angtable[0]
+    f = Tab1Interpolator.from_record(first)
+    assert f(first["mu"]).tolist() == pytest.approx(list(first["f"]))
+    assert f([-2.0, 2.0]).tolist() == [0.0, 0.0]
+
+
+def test_tab2_interpolator(cu_mf4):
+    angtable = cu_mf4["angtable"]
+    energies = cu_mf4["E"]
+    if isinstance(angtable, dict):
+        tables = [angtable[i] for i in sorted(angtable)]
+        z = [energies[i] for i in sorted(angtable)]
+    else:
+        tables = list(angtable)
+        z = energies[-len(tables) :]
+    tab2 = Tab2Interpolator(
+        z, cu_mf4["ang_int"]["NBT"], cu_mf4["ang_int"]["INT"], angtable
+    )
+    assert len(tab2) == len(tables)
+    mu = np.linspace(-1.0, 1.0, 11)
+    # at a tabulated z the function is the one tabulated there
+    for i in (0, 3, len(tables) - 1):
+        expected = Tab1Interpolator.from_record(tables[i])(mu)
+        assert np.allclose(tab2(z[i], mu), expected)
+    # in between, the law of the TAB2 record applies (lin-lin here)
+    assert list(cu_mf4["ang_int"]["INT"]) == [2]
+    zmid = 0.25 * z[1] + 0.75 * z[2]
+    lower = Tab1Interpolator.from_record(tables[1])(mu)
+    upper = Tab1Interpolator.from_record(tables[2])(mu)
+    assert np.allclose(tab2(zmid, mu), 0.25 * lower + 0.75 * upper)
+    # z and x are broadcast; outside of the z range the value is zero
+    grid = tab2(np.array([z[0] / 2, z[1], zmid])[:, None], mu[None, :])
+    assert grid.shape == (3, len(mu))
+    assert not grid[0].any()
+    assert np.allclose(grid[2], tab2(zmid, mu))
+
+
+def test_tab2_interpolator_evaluates_each_function_once():
+    calls = []
+
+    def linear(slope):
+        def function(x):
+            calls.append(len(x))
+            return slope * x
+
+        return function
+
+    z = np.arange(1.0, 41.0)
+    tab2 = Tab2Interpolator(z, [len(z)], [2], [linear(s) for s in z])
+    rng = np.random.default_rng(1)
+    zs = rng.uniform(0.0, 42.0, (50, 40))
+    xs = rng.uniform(-1.0, 1.0, (50, 40))
+    values = tab2(zs, xs)
+    # a function is called once, with the points of both of its intervals
+    assert len(calls) == len(z)
+    inside = (zs >= 1.0) & (zs <= 40.0)
+    assert sum(calls) == 2 * inside.sum()
+    assert np.allclose(values, np.where(inside, zs * xs, 0.0))
+
+
+def test_tab2_interpolator_laws():
+    constant = [
+        Tab1Interpolator([0.0, 1.0], [value, value], [2], [2]) for value in (1.0, 4.0)
+    ]
+    histogram = Tab2Interpolator([1.0, 3.0], [2], [1], constant)
+    assert histogram([1.0, 2.0, 3.0], 0.5).tolist() == [1.0, 1.0, 4.0]
+    loglog = Tab2Interpolator([1.0, 4.0], [2], [5], constant)
+    assert loglog(2.0, 0.5) == pytest.approx(2.0)
+    with pytest.raises(ValueError):
+        Tab2Interpolator([1.0, 3.0], [2], [2], constant[:1])
+
+
+def test_cross_section_table_reproduces_tables(cu):
+    mts, energies, table = cross_section_table(cu)
+    assert mts == sorted(cu[3])
+    assert energies.tolist() == unionized_energy_grid(cu).tolist()
+    assert table.shape == (len(mts), len(energies))
+    for row, mt in zip(table, mts):
+        xstable = cu[3][mt]["xstable"]
+        e = np.array(xstable["E"])
+        xs = np.array(xstable["xs"])
+        # the row holds the tabulated values at the grid points of the
+        # reaction, both sides of discontinuities included
+        second = np.append(False, np.diff(e) == 0)
+        on_grid = row[np.searchsorted(energies, e) + second]
+        assert np.allclose(on_grid, xs)
+        # and is zero outside of the tabulated range
+        assert not row[(energies < e[0]) | (energies > e[-1])].any()
+
+
+def test_cross_section_table_keeps_discontinuities():
+    def section(e, xs, laws):
+        return {"xstable": {"NBT": [len(e)], "INT": laws, "E": e, "xs": xs}}
+
+    material = {
+        3: {
+            1: section([1.0, 2.0, 2.0, 3.0], [1.0, 2.0, 5.0, 6.0], [2]),
+            2: section([1.0, 2.5, 3.0], [4.0, 4.0, 3.0], [1]),
+        }
+    }
+    grid = unionized_energy_grid(material)
+    assert grid.tolist() == [1.0, 2.0, 2.0, 2.5, 3.0]
+    mts, energies, table = cross_section_table(material)
+    assert energies.tolist() == grid.tolist()
+    assert table[0].tolist() == pytest.approx([1.0, 2.0, 5.0, 5.5, 6.0])
+    assert table[1].tolist() == pytest.approx([4.0, 4.0, 4.0, 4.0, 3.0])
+    # the limit from the left of a histogram step is the value before it
+    step = Tab1Interpolator([1.0, 2.0, 3.0], [1.0, 2.0, 2.0], [3], [1])
+    assert step([2.0], side="left").tolist() == [1.0]
+    assert step([2.0], side="right").tolist() == [2.0]
+
+
+def test_cross_section_table_selection_and_grid(cu):
+    grid = np.geomspace(1e-5, 2e7, 1000)
+    mts, energies, table = cross_section_table(cu, mts=[102, 1], energies=grid)
+    assert mts == [102, 1]
+    assert energies.tolist() == grid.tolist()
+    xstable = cu[3][1]["xstable"]
+    assert set(xstable["INT"]) == {2}
+    expected = np.interp(grid, xstable["E"], xstable["xs"])
+    assert np.allclose(table[1], expected)
+    with pytest.raises(KeyError):
+        cross_section_table(cu, mts=[999])
+
+
+def test_cross_section_table_of_endf_file(cu, parser):
+    with EndfFile(CU, parser=parser) as endf_file:
+        mts, energies, table = cross_section_table(endf_file[0], mts=[1, 2, 102])
+    expected = cross_section_table(cu, mts=[1, 2, 102])
+    assert mts == expected[0]
+    assert np.array_equal(energies, expected[1])
+    assert np.array_equal(table, expected[2])
@@ -1,6 +1,6 @@
 import pytest
 from endf_parserpy import EndfParser
-from endf_parserpy.utils.matching import eval_expr
+from endf_parserpy.utils.matching import eval_expr, expr_parser, referenced_sections
 
 
 RELATIONS = ("==", ">", ">=", "<", "<=", "!=")
@@ -120,3 +120,19 @@ def test_binary_logical_ops(lop):
             py_res = eval(py_expr)
             my_res = eval_expr(my_expr, {})
             assert py_res == my_res
+
+
+@pytest.mark.parametrize(
+    "expr, sections",
+    [
+        ("/3/102/xstable/xs/1 > 1e3", {(3, 102)}),
+        ("exists(/1/451) & /3/*/QI < 0", {(1, 451), (3, None)}),
+        ("/3/1(/AWR > 1 | !exists(/xstable))", {(3, 1)}),
+        ("/4(exists(/2))", {(4, None), (4, 2)}),
+        ("!exists(/6)", {(6, None)}),
+        ("/*/1/AWR > 0", None),
+        ("5 == 5", set()),
+    ],
+)
+def test_referenced_sections(expr, sections):
+    assert referenced_sections(expr_parser.parse(expr)) == sections
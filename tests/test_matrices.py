@@ -0,0 +1,189 @@
+import copy
+import pickle
+import pytest
+from pathlib import Path
+
+from endf_parserpy import (
+    EndfParserFactory,
+    EndfParserPy,
+    EndfPath,
+    compare_objects,
+)
+
+np = pytest.importorskip("numpy")
+
+from endf_parserpy.utils.matrices import EndfMatrix, pack_matrices, unpack_matrices
+from endf_parserpy.utils.covariance import (
+    covariance_matrix,
+    errorr_covariance_matrix,
+    errorr_subsection,
+    lb5_subsection,
+)
+
+
+TPID = " " * 66 + "   1 0  0    0"
+CU = Path(__file__).parent / "testdata" / "n_2925_29-Cu-63.endf"
+
+
+def _mf33_section(blocks, errorr=False):
+    section = {
+        "MAT": 2925,
+        "MF": 33,
+        "MT": 1,
+        "ZA": 29063.0,
+        "AWR": 62.4,
+        "MTL": 0,
+    }
+    if errorr:
+        section.update(NK=len(blocks), subsection=dict(enumerate(blocks, start=1)))
+        return section
+    subsection = {
+        "XMF1": 0.0,
+        "XLFS1": 0.0,
+        "MAT1": 0,
+        "MT1": 1,
+        "NC": 0,
+        "NI": len(blocks),
+        "ni_subsection": dict(enumerate(blocks, start=1)),
+    }
+    section.update(NL=1, subsection={1: subsection})
+    return section
+
+
+def test_matrix_from_dict():
+    nested = {2: {2: 1.0, 3: 2.0, 4: 3.0}, 3: {3: 4.0, 4: 5.0}, 4: {4: 6.0}}
+    matrix = EndfMatrix.from_dict(nested)
+    assert matrix.shape == (3, 3)
+    assert (matrix.row_start, matrix.col_start) == (2, 2)
+    assert matrix.array.tolist() == [[1, 2, 3], [0, 4, 5], [0, 0, 6]]
+    assert matrix.to_dict() == nested
+    assert matrix == nested
+    assert list(matrix) == [2, 3, 4]
+    assert list(matrix[3]) == [3, 4]
+    assert matrix[3][4] == matrix[3, 4] == 5.0
+    assert 2 not in matrix[3] and (3, 2) not in matrix
+    with pytest.raises(KeyError):
+        matrix[3, 2]
+    with pytest.raises(KeyError):
+        matrix[5]
+    with pytest.raises(ValueError):
+        EndfMatrix.from_dict({1: {1: 1.0, 3: 2.0}})
+    restored = pickle.loads(pickle.dumps(matrix))
+    assert restored == nested
+
+
+def test_matrix_assignment():
+    matrix = EndfMatrix.from_dict({1: {1: 1, 2: 2}, 2: {2: 3}})
+    assert matrix.array.dtype.kind == "i"
+    # a row can be extended by adjacent elements within the array
+    matrix[2][1] = 4
+    assert matrix[2] == {1: 4, 2: 3}
+    # a float turns an integer array into a float array
+    matrix[1, 2] = 2.5
+    assert matrix.array.dtype.kind == "f"
+    assert matrix.to_dict() == {1: {1: 1.0, 2: 2.5}, 2: {1: 4.0, 2: 3.0}}
+    matrix[1] = {2: 7.0}
+    assert matrix.to_dict() == {1: {2: 7.0}, 2: {1: 4.0, 2: 3.0}}
+    with pytest.raises(KeyError):
+        matrix[1, 3] = 1.0
+    with pytest.raises(TypeError):
+        del matrix[1]
+    path = EndfPath("F[2,1]")
+    assert path.get({"F": matrix}) == 4.0
+    path.set({"F": matrix}, 5.0)
+    assert matrix[2, 1] == 5.0
+
+
+def test_pack_and_unpack_matrices():
+    block = {
+        "LB": 5,
+        "E": {1: 1.0, 2: 2.0, 3: 3.0},
+        "F": {1: {1: 1.0, 2: 2.0}, 2: {2: 3.0}},
+    }
+    section = _mf33_section([block])
+    # a dict of dicts that is not a variable with two indices in the
+    # recipe is left as it is
+    section["X"] = {1: {1: 1.0}}
+    nested = copy.deepcopy(section)
+    pack_matrices(section)
+    block = section["subsection"][1]["ni_subsection"][1]
+    assert isinstance(block["F"], EndfMatrix)
+    assert isinstance(block["E"], dict) and isinstance(section["X"], dict)
+    compare_objects(nested, section)
+    unpack_matrices(section)
+    assert section == nested and isinstance(block["F"], dict)
+    # the ERRORR recipes declare COV[i,j] instead
+    errorr = {33: {1: _mf33_section([errorr_subsection(np.eye(3), 1)], True)}}
+    pack_matrices(errorr)
+    assert isinstance(errorr[33][1]["subsection"][1]["COV"], dict)
+    pack_matrices(errorr, "errorr")
+    assert isinstance(errorr[33][1]["subsection"][1]["COV"], EndfMatrix)
+
+
+def test_parser_packs_only_two_index_variables():
+    parser = EndfParserFactory.create(
+        select="python", matrix_type="ndarray", print_cache_info=False
+    )
+    parsed = parser.parsefile(CU, include=[6])
+    packed = {}
+
+    def collect(obj, name=None):
+        if isinstance(obj, EndfMatrix):
+            packed[name] = packed.get(name, 0) + 1
+        elif isinstance(obj, dict):
+            for key, value in obj.items():
+                collect(value, key if isinstance(key, str) else name)
+
+    collect(parsed)
+    # the slices b[j] of the three-index b[j,k,m] are not matrices
+    assert "b" not in packed
+    assert set(packed) <= {"A", "Ep", "mu"}
+
+
+def test_parser_roundtrip_with_matrices():
+    energies = np.linspace(1.0, 2.0, 6)
+    matrix = np.arange(25.0).reshape(5, 5)
+    section = _mf33_section(
+        [lb5_subsection(energies, matrix + matrix.T), lb5_subsection(energies, matrix)]
+    )
+    nested_parser = EndfParserPy(print_cache_info=False)
+    parser = EndfParserFactory.create(
+        select="python", matrix_type="ndarray", print_cache_info=False
+    )
+    lines = nested_parser.write({33: {1: section}})
+    parsed = parser.parse([TPID] + lines)
+    blocks = parsed[33][1]["subsection"][1]["ni_subsection"]
+    symmetric, asymmetric = blocks[1]["F"], blocks[2]["F"]
+    assert isinstance(symmetric, EndfMatrix)
+    assert np.array_equal(asymmetric.array, matrix)
+    assert np.array_equal(symmetric.array, np.triu(matrix + matrix.T))
+    assert EndfPath("subsection/1/ni_subsection/2/F[3,4]").get(parsed[33][1]) == 13.0
+    assert covariance_matrix(blocks[1])[1].tolist() == (matrix + matrix.T).tolist()
+    compare_objects(nested_parser.parse([TPID] + lines), parsed)
+    assert parser.write(parsed)[1:] == lines
+
+
+def test_errorr_roundtrip_with_matrices():
+    rng = np.random.default_rng(2)
+    matrix = np.round(rng.random((20, 20)), 3)
+    matrix[matrix < 0.6] = 0.0
+    section = _mf33_section([errorr_subsection(matrix, mt1=102)], errorr=True)
+    nested_parser = EndfParserPy(endf_format="errorr", print_cache_info=False)
+    parser = EndfParserPy(
+        endf_format="errorr", matrix_type="ndarray", print_cache_info=False
+    )
+    lines = nested_parser.write({33: {1: section}})
+    parsed = parser.parse([TPID] + lines)
+    subsection = parsed[33][1]["subsection"][1]
+    assert isinstance(subsection["COV"], EndfMatrix)
+    assert np.array_equal(errorr_covariance_matrix(subsection), matrix)
+    assert parser.write(parsed)[1:] == lines
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"matrix_type": "numpy"}, {"matrix_type": "ndarray", "array_type": "list"}],
+)
+def test_invalid_matrix_type(kwargs):
+    with pytest.raises(ValueError):
+        EndfParserPy(print_cache_info=False, **kwargs)
@@ -0,0 +1,70 @@
+import pytest
+from pathlib import Path
+
+from endf_parserpy import (
+    EndfParserCpp,
+    EndfParserPy,
+    SectionDiagnostic,
+)
+
+
+PARSER_CLASSES = [EndfParserCpp, EndfParserPy]
+
+TESTDATA = Path(__file__).parent / "testdata"
+
+
+def _make_parser(parser_class):
+    if parser_class is EndfParserPy:
+        return EndfParserPy(print_cache_info=False)
+    return parser_class()
+
+
+def _corrupt(lines, mf, mt, k):
+    # replace the first number of the k-th line of the MF/MT section
+    ctrl = f"{mf:2d}{mt:3d}"
+    idcs = [i for i, line in enumerate(lines) if line[70:75] == ctrl]
+    idx = idcs[k]
+    lines[idx] = "  abc" + lines[idx][5:]
+
+
+@pytest.fixture(scope="module")
+def lines():
+    with open(TESTDATA / "n_2925_29-Cu-63.endf") as fh:
+        return fh.read().splitlines()
+
+
+@pytest.mark.parametrize("parser_class", PARSER_CLASSES)
+def test_check_valid_data(parser_class, lines):
+    parser = _make_parser(parser_class)
+    assert parser.check(lines) == []
+    assert parser.check("\n".join(lines)) == []
+    assert parser.checkfile(TESTDATA / "n_2925_29-Cu-63.endf") == []
+
+
+@pytest.mark.parametrize("parser_class", PARSER_CLASSES)
+def test_check_reports_all_failing_sections(parser_class, lines):
+    parser = _make_parser(parser_class)
+    lines = list(lines)
+    _corrupt(lines, 3, 1, 3)
+    _corrupt(lines, 4, 2, 1)
+    diagnostics = parser.check(lines)
+    assert [(d.mat, d.mf, d.mt) for d in diagnostics] == [(2925, 3, 1), (2925, 4, 2)]
+    assert all(isinstance(d, SectionDiagnostic) for d in diagnostics)
+    # the messages are those of the exceptions raised by parse
+    for diag in diagnostics:
+        with pytest.raises(Exception) as exc_info:
+            parser.parse(lines, include=[(diag.mf, diag.mt)])
+        assert diag.message.strip() in str(exc_info.value)
+    # excluded sections are not checked
+    diagnostics = parser.check(lines, exclude=[3])
+    assert [(d.mf, d.mt) for d in diagnostics] == [(4, 2)]
+    diagnostics = parser.check(lines, include=[(3, 1)])
+    assert [(d.mf, d.mt) for d in diagnostics] == [(3, 1)]
+
+
+@pytest.mark.parametrize("parser_class", PARSER_CLASSES)
+def test_check_reports_tape_structure(parser_class, lines):
+    parser = _make_parser(parser_class)
+    diagnostics = parser.check(lines[:-1])
+    assert diagnostics[-1].mat is None and diagnostics[-1].mf is None
+    assert "TEND" in diagnostics[-1].message
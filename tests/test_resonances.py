@@ -0,0 +1,134 @@
+import pytest
+from pathlib import Path
+
+from endf_parserpy import EndfParserFactory
+
+np = pytest.importorskip("numpy")
+
+from endf_parserpy.utils.resonances import resonance_cross_sections
+
+
+TESTDATA = Path(__file__).parent / "testdata"
+
+
+def _section(lrf, l_groups, spi=0.0, ap=0.6, naps=1, el=1e-5, eh=1e4):
+    rng = {
+        "EL": el,
+        "EH": eh,
+        "LRU": 1,
+        "LRF": lrf,
+        "NRO": 0,
+        "NAPS": naps,
+        "SPI": spi,
+        "AP": ap,
+        "NLS": len(l_groups),
+        "l_group": dict(enumerate(l_groups, start=1)),
+    }
+    isotope = {"ZAI": 92235.0, "ABN": 1.0, "LFW": 0, "NER": 1, "range": {1: rng}}
+    return {"ZA": 92235.0, "AWR": 233.0, "NIS": 1, "isotope": {1: isotope}}
+
+
+def _l_group(lrf, resonances, l=0, awri=233.0):
+    # resonances are tuples (ER, AJ, GN, GG, GF)
+    group = {"AWRI": awri, "L": l, "NRS": len(resonances)}
+    columns = list(zip(*resonances)) if resonances else [()] * 5
+    er, aj, gn, gg, gf = (dict(enumerate(c, start=1)) for c in columns)
+    if lrf == 3:
+        gfa = {k: v / 2 for k, v in gf.items()}
+        gfb = {k: -v / 2 for k, v in gf.items()}
+        group.update(APL=0.0, ER=er, AJ=aj, GN=gn, GG=gg, GFA=gfa, GFB=gfb)
+    else:
+        gt = {k: gn[k] + gg[k] + gf[k] for k in er}
+        group.update(QX=0.0, LRX=0, ER=er, AJ=aj, GT=gt, GN=gn, GG=gg, GF=gf)
+    return group
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return EndfParserFactory.create(select="python", print_cache_info=False)
+
+
+def test_formalisms_agree_for_a_single_level():
+    resonance = [(6.4, 3.5, 0.002, 0.035, 0.01)]
+    energies = np.geomspace(1e-3, 1e3, 2001)
+    results = [
+        resonance_cross_sections(
+            _section(lrf, [_l_group(lrf, resonance)], spi=3.5), energies
+        )
+        for lrf in (1, 2, 3)
+    ]
+    for xs in results[1:]:
+        for mt in (1, 2, 18, 102):
+            assert np.allclose(xs[mt], results[0][mt], rtol=1e-6, atol=1e-6)
+    xs = results[0]
+    assert np.allclose(xs[1], xs[2] + xs[18] + xs[102])
+    # the capture cross section at the resonance energy
+    peak = resonance_cross_sections(
+        _section(1, [_l_group(1, resonance)], spi=3.5), [6.4]
+    )
+    k = 2.196807122623e-3 * 233.0 / 234.0 * np.sqrt(6.4)
+    gj = 8.0 / 16.0
+    expected = 4 * np.pi / k**2 * gj * 0.002 * 0.035 / 0.047**2
+    assert peak[102][0] == pytest.approx(expected)
+    assert peak[18][0] == pytest.approx(expected * 0.01 / 0.035)
+
+
+def test_potential_scattering():
+    energies = np.array([1e-3, 1.0, 1e3])
+    xs = resonance_cross_sections(_section(3, [_l_group(3, [])]), energies)
+    k = 2.196807122623e-3 * 233.0 / 234.0 * np.sqrt(energies)
+    assert np.allclose(xs[2], 4 * np.pi / k**2 * np.sin(k * 0.6) ** 2)
+    assert not xs[102].any() and not xs[18].any()
+
+
+def test_multilevel_interference():
+    # two levels interfere in MLBW and Reich-Moore, but not in SLBW
+    resonances = [(10.0, 0.5, 0.5, 0.05, 0.0), (12.0, 0.5, 0.5, 0.05, 0.0)]
+    energies = np.linspace(9.0, 13.0, 401)
+    xs = {
+        lrf: resonance_cross_sections(
+            _section(lrf, [_l_group(lrf, resonances)]), energies
+        )
+        for lrf in (1, 2, 3)
+    }
+    assert not np.allclose(xs[1][2], xs[2][2])
+    # the Reich-Moore collision matrix is unitary without capture
+    assert (xs[3][2] >= 0).all() and (xs[3][102] >= 0).all()
+
+
+@pytest.mark.parametrize(
+    "filename, capture",
+    [("n_2925_29-Cu-63.endf", 4.47), ("n_3025_30-Zn-64.endf", 0.787)],
+)
+def test_evaluations(parser, filename, capture):
+    with open(TESTDATA / filename) as fh:
+        lines = fh.read().splitlines()
+    section = parser.parse(lines, include=[(2, 151)])[2][151]
+    energies = np.geomspace(1e-5, 2e5, 20000)
+    xs = resonance_cross_sections(section, energies)
+    thermal = resonance_cross_sections(section, [0.0253])
+    assert thermal[102][0] == pytest.approx(capture, rel=1e-2)
+    assert (xs[102] >= 0).all() and np.allclose(xs[1], xs[2] + xs[18] + xs[102])
+    # nothing is added beyond the resolved range
+    ranges = section["isotope"][1]["range"].values()
+    eh = max(r["EH"] for r in ranges if r["LRU"] == 1)
+    assert not xs[1][energies > eh].any()
+    # batches of a few energy-resonance pairs give the same result
+    chunked = resonance_cross_sections(section, energies[:500], chunk_size=7)
+    for mt, values in chunked.items():
+        assert np.allclose(values, xs[mt][:500], rtol=1e-12, atol=0.0)
+    # the array type does not matter
+    list_parser = EndfParserFactory.create(
+        select="python", array_type="list", print_cache_info=False
+    )
+    listed = list_parser.parse(lines, include=[(2, 151)])[2][151]
+    assert np.array_equal(resonance_cross_sections(listed, energies)[1], xs[1])
+
+
+def test_invalid_input():
+    section = _section(1, [_l_group(1, [(1.0, 0.5, 0.1, 0.1, 0.0)])])
+    with pytest.raises(ValueError):
+        resonance_cross_sections(section, [0.0, 1.0])
+    section["isotope"][1]["range"][1]["LRF"] = 7
+    with pytest.raises(NotImplementedError):
+        resonance_cross_sections(section, [1.0])
@@ -0,0 +1,151 @@
+import asyncio
+import pytest
+import threading
+from pathlib import Path
+
+from endf_parserpy import EndfParserFactory, EndfFile, iter_parse_tape_file
+from endf_parserpy.tape import AsyncEndfFile, aiter_parse_tape_file
+from endf_parserpy.tape import aio
+
+
+TESTDATA = Path(__file__).parent / "testdata"
+CU = TESTDATA / "n_2925_29-Cu-63.endf"  # MAT 2925
+ZN = TESTDATA / "n_3025_30-Zn-64.endf"  # MAT 3025
+RAW_EXCLUDE = tuple(range(1, 100))
+
+
+@pytest.fixture(params=["python", "cpp"])
+def parser(request):
+    try:
+        return EndfParserFactory.create(select=request.param)
+    except Exception:
+        pytest.skip(f"{request.param} backend unavailable")
+
+
+def _write_tape(tmp_path, paths):
+    base = EndfParserFactory.create(select="python")
+    tpid = tend = None
+    lines = []
+    for path in paths:
+        with open(path) as fh:
+            raw = [line.rstrip("\n") for line in fh]
+        single = base.write(base.parse(raw, exclude=RAW_EXCLUDE))
+        tpid, tend = single[0], single[-1]
+        lines.extend(single[1:-1])
+    out = tmp_path / "tape.endf"
+    out.write_bytes(("\n".join([tpid] + lines + [tend]) + "\n").encode("latin-1"))
+    return out
+
+
+def test_async_reads_match_sync(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    reference = EndfFile(tape, parser=parser)
+
+    async def main():
+        async with await AsyncEndfFile.open(
+            tape, parser=parser, max_concurrency=2
+        ) as endf_file:
+            assert endf_file.endf_file.thread_safe
+            assert len(endf_file) == 2
+            paths = ["#0/1/451/AWR", "#1/1/451/AWR", "#0/3/1", "#1/3/1"]
+            values = await asyncio.gather(*(endf_file.get(p) for p in paths))
+            many = await endf_file.get_many(paths)
+            mf3 = await endf_file.sections("3/1")
+            matches = await endf_file.query("1/451/AWR", many[1])
+            index = await endf_file.build_index("1/451/ZA", name="za")
+            temp = await endf_file.peek("#1/1/451/TEMP")
+            return values, many, mf3, matches, index, temp
+
+    values, many, mf3, matches, index, temp = asyncio.run(main())
+    assert values[0] == reference.get("#0/1/451/AWR")
+    assert dict(values[3]) == dict(reference.get("#1/3/1"))
+    assert dict(many[2]) == dict(values[2])
+    assert list(mf3) == [(0, 3, 1), (1, 3, 1)]
+    assert [m.position for m in matches] == [1]
+    assert index == reference.build_index("1/451/ZA")
+    assert temp == reference.get("#1/1/451/TEMP")
+
+
+def test_async_export(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU])
+    out = tmp_path / "out.endf"
+
+    async def main():
+        async with await AsyncEndfFile.open(tape, parser=parser) as endf_file:
+            await asyncio.gather(
+                endf_file.get("#0/1/451"),
+                endf_file.export(out),
+                endf_file.get("#0/3/1"),
+            )
+
+    asyncio.run(main())
+    assert len(EndfFile(out, parser=parser)) == 1
+
+
+def test_async_requires_thread_safe(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU])
+    with pytest.raises(ValueError, match="thread_safe"):
+        AsyncEndfFile(EndfFile(tape, parser=parser))
+    with pytest.raises(TypeError):
+        AsyncEndfFile(str(tape))
+
+
+def test_aiter_parse_tape_file(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+
+    async def main():
+        return [
+            m async for m in aiter_parse_tape_file(tape, parser=parser, include=[1])
+        ]
+
+    materials = asyncio.run(main())
+    expected = list(iter_parse_tape_file(tape, parser=parser, include=[1]))
+    assert [m[1][451]["ZA"] for m in materials] == [m[1][451]["ZA"] for m in expected]
+
+
+def test_cancelled_exclusive_operation_releases_slots(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU])
+    release = threading.Event()
+
+    def slow_get(path):
+        release.wait()
+        return path
+
+    async def main():
+        endf_file = await AsyncEndfFile.open(tape, parser=parser, max_concurrency=2)
+        endf_file.endf_file.get = slow_get
+        read = asyncio.ensure_future(endf_file.get("#0/1/451"))
+        await asyncio.sleep(0.05)
+        # close takes the free slot and waits for the one of the read
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(endf_file.close(), 0.05)
+        release.set()
+        await read
+        semaphore, _ = endf_file._primitives()
+        assert semaphore._value == 2
+        await asyncio.wait_for(endf_file.close(), 5)
+
+    asyncio.run(main())
+
+
+def test_aiter_closes_iterator_after_cancelled_next(monkeypatch):
+    release = threading.Event()
+    closed = []
+
+    def blocking_iterator(path, **kwargs):
+        try:
+            release.wait()
+            yield 1
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(aio, "iter_parse_tape_file", blocking_iterator)
+
+    async def main():
+        materials = aiter_parse_tape_file("tape.endf")
+        threading.Timer(0.2, release.set).start()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(materials.__anext__(), 0.05)
+
+    asyncio.run(main())
+    assert closed == [True]
@@ -0,0 +1,102 @@
+import pytest
+from pathlib import Path
+
+from endf_parserpy import EndfParserFactory, parse_tape_file, write_tape
+from endf_parserpy.tape import (
+    iter_npz_tape_file,
+    iter_parse_tape_file,
+    write_npz_tape_file,
+)
+from endf_parserpy.tape.columnar import is_npz_tape_file
+from endf_parserpy.utils.matrices import EndfMatrix, EndfVector
+
+np = pytest.importorskip("numpy")
+
+
+TESTDATA = Path(__file__).parent / "testdata"
+CU = TESTDATA / "n_2925_29-Cu-63.endf"  # MAT 2925
+ZN = TESTDATA / "n_3025_30-Zn-64.endf"  # MAT 3025
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return EndfParserFactory.create(select="python")
+
+
+@pytest.fixture(scope="module")
+def materials(parser):
+    include = [1, 3, 4]
+    return parse_tape_file(CU, parser=parser, include=include) + parse_tape_file(
+        ZN, parser=parser, include=include
+    )
+
+
+@pytest.fixture(scope="module")
+def npz_file(tmp_path_factory, materials):
+    path = tmp_path_factory.mktemp("npz") / "tape.npz"
+    write_npz_tape_file(iter(materials), path)
+    return path
+
+
+def test_npz_roundtrip_is_exact(npz_file, parser, materials):
+    assert is_npz_tape_file(npz_file)
+    restored = list(iter_npz_tape_file(npz_file, tolist=True))
+    assert restored == materials
+    # the arrays as loaded are accepted by the writer as they are
+    for mmap in (True, False):
+        loaded = list(iter_npz_tape_file(npz_file, mmap=mmap))
+        assert write_tape(loaded, parser=parser) == write_tape(materials, parser=parser)
+
+
+def test_npz_arrays_are_memory_mapped(npz_file, materials):
+    cu = next(iter_npz_tape_file(npz_file))
+    energies = cu[3][2]["xstable"]["E"]
+    assert isinstance(energies, np.memmap)
+    assert energies.dtype == np.float64 and not energies.flags.writeable
+    assert energies.tolist() == materials[0][3][2]["xstable"]["E"]
+    # short lists stay in the metadata
+    assert isinstance(cu[3][2]["xstable"]["NBT"], list)
+    # dicts indexed by consecutive integers keep their memory-mapped array
+    vector = cu[4][2]["E"]
+    assert isinstance(vector, EndfVector) and isinstance(vector.array, np.memmap)
+    assert dict(vector) == materials[0][4][2]["E"]
+    matrix = cu[4][2]["al"]
+    assert isinstance(matrix, EndfMatrix) and isinstance(matrix.array, np.memmap)
+    assert matrix.to_dict() == materials[0][4][2]["al"]
+
+
+def test_npz_stores_two_index_arrays_as_one_array(tmp_path):
+    n = 12
+    # an upper triangle, like an MF33 LB=5 block with LS=1
+    triangle = {
+        k: {kp: float(k * kp) for kp in range(k, n + 1)} for k in range(1, n + 1)
+    }
+    # rows of very different length, whose padding would be too large
+    ragged = {1: {kp: float(kp) for kp in range(1, 41)}}
+    ragged.update({k: {1: 1.0, 2: 2.0} for k in range(2, 21)})
+    material = {33: {1: {"F": triangle, "G": ragged}}}
+    path = tmp_path / "cov.npz"
+    write_npz_tape_file([material], path)
+    with np.load(path) as archive:
+        shapes = [archive[name].shape for name in archive.files if "/" in name]
+    assert shapes == [(n, n), (40,)]
+    (restored,) = iter_npz_tape_file(path)
+    F = restored[33][1]["F"]
+    assert isinstance(F, EndfMatrix) and F.array.shape == (n, n)
+    assert F.to_dict() == triangle and F[3, 5] == 15.0 and (5, 3) not in F
+    assert list(iter_npz_tape_file(path, tolist=True)) == [material]
+
+
+def test_npz_is_a_numpy_archive(npz_file):
+    with np.load(npz_file) as archive:
+        assert "material0/array0" in archive.files
+
+
+def test_npz_streams_from_parsed_tape(tmp_path, parser):
+    path = tmp_path / "cu.npz"
+    write_npz_tape_file(iter_parse_tape_file(CU, parser=parser, include=[3]), path)
+    (material,) = iter_npz_tape_file(path, mmap=False)
+    assert material[3][1]["MAT"] == 2925
+    with pytest.raises(FileExistsError):
+        write_npz_tape_file([material], path)
+    assert not is_npz_tape_file(CU)
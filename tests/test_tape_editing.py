@@ -135,6 +135,76 @@ def test_export_peak_memory_is_bounded(tmp_path, parser):
     assert large < small * 2
 
 
+def _raw_tape(tmp_path, paths, newline="\n"):
+    # the materials as they are on disk, sequence numbers included
+    lines = []
+    for path in paths:
+        material = _read_lines(path)
+        lines.extend(material[1:-1] if lines else material[:-1])
+    lines.append(TEND_LINE)
+    path = tmp_path / "raw.endf"
+    path.write_bytes((newline.join(lines) + newline).encode("latin-1"))
+    return path
+
+
+def _material_bytes(path, entry):
+    with open(path, "rb") as fh:
+        fh.seek(entry.byte_offset)
+        return fh.read(entry.byte_length)
+
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_export_copies_unedited_materials_verbatim(
+    tmp_path, parser, monkeypatch, kernel_copy
+):
+    if not kernel_copy:
+        # force the buffered fallback of the byte-range copy
+        import os
+
+        def unsupported(*args):
+            raise OSError("not supported")
+
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+    path = _raw_tape(tmp_path, [CU, ZN, CU])
+    endf_file = EndfFile(path, parser=parser)
+    section = dict(endf_file[1][1, 451])
+    section["AWR"] = 60.5
+    endf_file[1][1, 451] = section
+    out = tmp_path / "out.endf"
+    endf_file.export(out)
+    exported = EndfFile(out, parser=parser)
+    # the unedited materials are the source bytes, the edited one is
+    # re-rendered
+    for position in (0, 2):
+        assert _material_bytes(out, exported.index[position]) == _material_bytes(
+            path, endf_file.index[position]
+        )
+    assert exported[1][1, 451]["AWR"] == 60.5
+    assert exported[2][1, 451]["AWR"] == endf_file[2][1, 451]["AWR"]
+    # with no edits at all the whole tape is reproduced exactly
+    del endf_file[1]
+    endf_file.export(out, overwrite=True)
+    expected = _material_bytes(path, endf_file.index[0]) + _material_bytes(
+        path, endf_file.index[2]
+    )
+    tpid = (endf_file.index.tpid_line + "\n").encode("latin-1")
+    assert out.read_bytes() == tpid + expected + (TEND_LINE + "\n").encode()
+
+
+def test_export_rerenders_crlf_materials(tmp_path, parser):
+    # a material with CRLF terminators is not copied verbatim, so the
+    # exported tape has uniform LF terminators
+    path = _raw_tape(tmp_path, [CU], newline="\r\n")
+    endf_file = EndfFile(path, parser=parser)
+    out = tmp_path / "out.endf"
+    endf_file.export(out)
+    assert b"\r" not in out.read_bytes()
+    assert EndfFile(out, parser=parser)[0][1, 451]["AWR"] == (
+        endf_file[0][1, 451]["AWR"]
+    )
+
+
 # --------------------------------------------------------------------------
 # section editing
 # --------------------------------------------------------------------------
@@ -418,14 +488,189 @@ def test_export_onto_source_invalidates(tmp_path, parser):
     assert "invalidated" in repr(endf_file)
 
 
-def test_secondary_index_dropped_on_structural_edit(tmp_path, parser):
-    endf_file, _ = _open(tmp_path, parser, [CU, ZN])
-    endf_file.build_index("1/451/AWR", name="by_awr")
-    assert "by_awr" in endf_file.secondary_indexes
+def _edit_awr(endf_file, position, mf, mt, awr):
+    section = endf_file[position][mf, mt].detach()
+    section["AWR"] = awr
+    endf_file[position][mf, mt] = section
+
+
+def test_export_renders_each_edit_once(tmp_path, parser, monkeypatch):
+    from collections.abc import Mapping
+
+    _, path = _open(tmp_path, parser, [CU, ZN])
+    endf_file = EndfFile(path, parser=parser, check_edits="deferred")
+    _edit_awr(endf_file, 0, 3, 1, 62.5)
+    _edit_awr(endf_file, 1, 3, 2, 63.5)
+    rendered = []
+    write = parser.write
+
+    def counting_write(material, *args, **kwargs):
+        rendered.extend(
+            (mf, mt)
+            for mf, sections in material.items()
+            for mt, section in sections.items()
+            if isinstance(section, Mapping)
+        )
+        return write(material, *args, **kwargs)
+
+    monkeypatch.setattr(parser, "write", counting_write)
+    endf_file.export(tmp_path / "out.endf")
+    # the conformity check of the deferred edits is the output render
+    assert sorted(rendered) == [(3, 1), (3, 2)]
+
+
+def test_export_renders_in_parallel(tmp_path, parser):
+    endf_file, _ = _open(tmp_path, parser, [CU, ZN, CU])
+    for position in range(3):
+        _edit_awr(endf_file, position, 3, 1, 60.5 + position)
+        _edit_awr(endf_file, position, 3, 2, 60.5 + position)
+    serial, parallel = tmp_path / "serial.endf", tmp_path / "parallel.endf"
+    endf_file.export(serial)
+    endf_file.export(parallel, workers=2)
+    assert parallel.read_bytes() == serial.read_bytes()
+    with pytest.raises(ValueError):
+        endf_file.export(tmp_path / "bad.endf", workers=0)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_export_rejects_invalid_deferred_edit(tmp_path, parser, workers):
+    _, path = _open(tmp_path, parser, [CU, ZN])
+    endf_file = EndfFile(path, parser=parser, check_edits="deferred")
+    del endf_file["#1/3/2/AWR"]
+    out = tmp_path / "out.endf"
+    with pytest.raises(SectionRenderError, match="position 1"):
+        endf_file.export(out, workers=workers)
+    assert not out.exists()
+    assert not (tmp_path / "out.endf.endfparserpy-tmp").exists()
+
+
+def test_inplace_export_patches_same_size_edits(tmp_path, parser):
+    from endf_parserpy.tape.journal import journal_path
+
+    endf_file, path = _open(tmp_path, parser, [CU, ZN])
+    before = path.read_bytes()
+    sec_entry = endf_file.index[1].sections[(1, 451)]
+    section = dict(endf_file[1][1, 451])
+    section["AWR"] = 63.5
+    endf_file[1][1, 451] = section
+    endf_file.export(path, inplace=True)
+    after = path.read_bytes()
+    # only the bytes of the edited section were rewritten
+    start, end = sec_entry.offset, sec_entry.offset + sec_entry.length
+    assert len(after) == len(before)
+    assert after[:start] == before[:start] and after[end:] == before[end:]
+    assert after != before
+    assert not (tmp_path / Path(journal_path(path)).name).exists()
+    # the object stays valid and now reads the edit from disk
+    assert not endf_file[1].is_modified
+    assert endf_file[1][1, 451]["AWR"] == 63.5
+    assert endf_file.index[1].awr == 63.5
+    assert endf_file.by_za(30064)[0][3, 1] == EndfFile(path, parser=parser)[1][3, 1]
+    assert EndfFile(path, parser=parser)[1][1, 451]["AWR"] == 63.5
+    with pytest.raises(ValueError):
+        endf_file.export(tmp_path / "elsewhere.endf", inplace=True)
+
+
+def test_inplace_export_rewrites_structural_edits(tmp_path, parser):
+    endf_file, path = _open(tmp_path, parser, [CU, ZN])
+    zn = endf_file[1]
+    del endf_file[0]
+    del zn[3, 2]
+    endf_file.export(path, inplace=True)
+    # the tape was rewritten and re-indexed; the object stays valid
+    assert len(endf_file) == 1
+    assert zn.mat == 3025 and not zn.is_modified
+    assert (3, 2) not in zn
+    assert endf_file.index.materials[0].mat == 3025
+    reopened = EndfFile(path, parser=parser)
+    assert endf_file[0][3, 1] == reopened[0][3, 1]
+    assert not reopened.index[0].sections.get((3, 2))
+
+
+def test_interrupted_inplace_patch_is_recovered(tmp_path, parser):
+    from endf_parserpy.tape.journal import _write_journal, journal_path
+
+    endf_file, path = _open(tmp_path, parser, [CU])
+    original_awr = endf_file[0][1, 451]["AWR"]
+    section = dict(endf_file[0][1, 451])
+    section["AWR"] = 61.5
+    endf_file[0][1, 451] = section
+    patches = endf_file._inplace_patches()
+    size = path.stat().st_size
+    # a crash after the journal was written: the next open completes it
+    _write_journal(str(path), size, patches)
+    assert EndfFile(path, parser=parser)[0][1, 451]["AWR"] == 61.5
+    assert not Path(journal_path(path)).exists()
+    # a crash while writing the journal: the journal is discarded
+    endf_file = EndfFile(path, parser=parser)
+    section = dict(endf_file[0][1, 451])
+    section["AWR"] = original_awr
+    endf_file[0][1, 451] = section
+    _write_journal(str(path), size, endf_file._inplace_patches())
+    journal = Path(journal_path(path))
+    journal.write_bytes(journal.read_bytes()[:-5])
+    assert EndfFile(path, parser=parser)[0][1, 451]["AWR"] == 61.5
+    assert not journal.exists()
+
+
+def test_secondary_index_remapped_on_structural_edit(tmp_path, parser):
+    endf_file, _ = _open(tmp_path, parser, [CU, ZN, CU])
+    by_za = endf_file.build_index("1/451/ZA", name="by_za")
+    za_cu, za_zn = endf_file[0].za, endf_file[1].za
+    assert by_za == {za_cu: [0, 2], za_zn: [1]}
+    # no section is parsed again while the index is remapped
+    endf_file.unload()
+    endf_file._section_cache.put = None
+    endf_file.reorder([1, 2, 0])
+    assert endf_file.secondary_indexes["by_za"] == {za_zn: [0], za_cu: [1, 2]}
+    del endf_file[0]
+    assert endf_file.secondary_indexes["by_za"] == {za_cu: [0, 1]}
+    del endf_file._section_cache.put
+    zn = EndfFile(tmp_path / "tape.endf", parser=parser)[1]
+    endf_file.append_material({1: {451: zn[1, 451].detach()}}, mat=3025)
+    assert endf_file.secondary_indexes["by_za"] == {za_cu: [0, 1], za_zn: [2]}
+
+
+def test_secondary_index_remapped_on_removal_of_unindexed_material(tmp_path, parser):
+    endf_file, _ = _open(tmp_path, parser, [CU, ZN, CU])
+    # only the Zn-64 material has an MF3/MT24 section
+    zn24 = endf_file.build_index("3/24/AWR", name="zn24")
+    assert list(zn24.values()) == [[1]]
     del endf_file[0]
-    # a position-keyed index would be wrong after a structural edit, so
-    # it is dropped rather than left stale
-    assert endf_file.secondary_indexes == {}
+    assert endf_file.secondary_indexes["zn24"] == endf_file.build_index("3/24/AWR")
+    assert list(endf_file.secondary_indexes["zn24"].values()) == [[0]]
+
+
+@pytest.mark.parametrize("check_edits", ["eager", "deferred"])
+def test_secondary_index_follows_section_edits(tmp_path, parser, check_edits):
+    path = tmp_path / "tape.endf"
+    path.write_bytes(
+        ("\n".join(_canonical_tape(parser, [CU, ZN])) + "\n").encode("latin-1")
+    )
+    endf_file = EndfFile(path, parser=parser, check_edits=check_edits)
+    endf_file.build_index("1/451/AWR", name="by_awr")
+    endf_file.build_index(["1/451/ZA", "1/451/AWR"], name="composite")
+    za = endf_file[0].za
+    # a field edit through a path
+    endf_file["#0/1/451/AWR"] = 99.5
+    assert endf_file.secondary_indexes["by_awr"][99.5] == [0]
+    assert endf_file.secondary_indexes["composite"][(za, 99.5)] == [0]
+    # a whole-section replacement
+    section = endf_file[1][1, 451].detach()
+    section["AWR"] = 12.5
+    endf_file[1][1, 451] = section
+    assert endf_file.secondary_indexes["by_awr"] == {99.5: [0], 12.5: [1]}
+    if check_edits == "deferred":
+        # a write through a live view
+        endf_file[0][1, 451]["AWR"] = 7.25
+        assert endf_file.secondary_indexes["by_awr"] == {7.25: [0], 12.5: [1]}
+        # a deleted field drops the material from the index
+        del endf_file["#0/1/451/AWR"]
+        assert endf_file.secondary_indexes["by_awr"] == {12.5: [1]}
+    # an index over other sections is not touched by the edits
+    assert endf_file.build_index("1/451/AWR") == endf_file.secondary_indexes["by_awr"]
+    del endf_file[1][1, 451]
+    assert 12.5 not in endf_file.secondary_indexes["by_awr"]
 
 
 def test_save_to_other_path_keeps_object_valid(tmp_path, parser):
@@ -0,0 +1,93 @@
+import json
+import pytest
+from pathlib import Path
+
+from endf_parserpy import EndfParserFactory, parse_tape_file, write_tape
+from endf_parserpy.tape import (
+    iter_json_tape_file,
+    iter_parse_tape_file,
+    write_json_tape_file,
+)
+import endf_parserpy.tape.jsonio as jsonio
+
+
+TESTDATA = Path(__file__).parent / "testdata"
+CU = TESTDATA / "n_2925_29-Cu-63.endf"  # MAT 2925
+ZN = TESTDATA / "n_3025_30-Zn-64.endf"  # MAT 3025
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return EndfParserFactory.create(select="python")
+
+
+@pytest.fixture(scope="module")
+def materials(parser):
+    cu = parse_tape_file(CU, parser=parser, include=[1, 3])
+    zn = parse_tape_file(ZN, parser=parser, include=[1, 3])
+    return cu + zn
+
+
+@pytest.fixture
+def small_reads(monkeypatch):
+    # force the reader to work across many buffer refills
+    monkeypatch.setattr(jsonio, "_READ_CHUNK_SIZE", 7)
+
+
+@pytest.mark.parametrize("indent", [None, 0, 2])
+def test_json_text_matches_json_dump(tmp_path, materials, indent):
+    out = tmp_path / "tape.json"
+    write_json_tape_file(iter(materials), out, indent=indent)
+    assert out.read_text() == json.dumps(materials, indent=indent)
+    # a single material is written as a JSON object
+    write_json_tape_file(materials[:1], out, indent=indent, overwrite=True)
+    assert out.read_text() == json.dumps(materials[0], indent=indent)
+    write_json_tape_file([], out, overwrite=True)
+    assert out.read_text() == "[]"
+    with pytest.raises(FileExistsError):
+        write_json_tape_file(materials, out)
+
+
+@pytest.mark.parametrize("lines", [False, True])
+def test_json_roundtrip(tmp_path, parser, materials, small_reads, lines):
+    out = tmp_path / "tape.json"
+    write_json_tape_file(materials, out, lines=lines)
+    if lines:
+        assert len(out.read_text().splitlines()) == len(materials)
+    restored = list(iter_json_tape_file(out))
+    assert write_tape(restored, parser=parser) == write_tape(materials, parser=parser)
+
+
+def test_json_streams_from_parsed_tape(tmp_path, parser):
+    out = tmp_path / "cu.jsonl"
+    write_json_tape_file(
+        iter_parse_tape_file(CU, parser=parser, include=[1]), out, lines=True
+    )
+    (material,) = iter_json_tape_file(out)
+    assert material[1][451]["MAT"] == 2925
+
+
+def test_json_reader_is_incremental(tmp_path, materials, small_reads):
+    out = tmp_path / "tape.json"
+    write_json_tape_file(materials, out, indent=1)
+    # corrupt the end of the file: the materials before the damage are
+    # still produced before the error is detected
+    text = out.read_text()
+    out.write_text(text[:-2] + "!]")
+    reader = iter_json_tape_file(out)
+    assert next(reader)[1][451]["MAT"] == 2925
+    with pytest.raises(json.JSONDecodeError):
+        list(reader)
+
+
+@pytest.mark.parametrize("text", ["[{}, ", "[{} {}]", "[{}] {}", "{} ]"])
+def test_json_reader_rejects_malformed_input(tmp_path, text):
+    path = tmp_path / "bad.json"
+    path.write_text(text)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_tape_file(path))
+
+
+def test_json_lines_rejects_indent(tmp_path, materials):
+    with pytest.raises(ValueError):
+        write_json_tape_file(materials, tmp_path / "tape.jsonl", lines=True, indent=2)
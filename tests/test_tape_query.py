@@ -1,8 +1,14 @@
+import os
+import pickle
 import pytest
 from pathlib import Path
 
 from endf_parserpy import EndfParserFactory, EndfFile, EndfMaterialPath, TapeIndex
-from endf_parserpy.tape import AmbiguousMaterialError, SectionParseError
+from endf_parserpy.tape import (
+    AmbiguousMaterialError,
+    SectionParseError,
+    StaleSourceError,
+)
 from endf_parserpy.tape.records import _control_numbers
 
 
@@ -136,6 +142,100 @@ def test_get_failed_section_raises(tmp_path, parser):
         endf_file.get("#0/1/451/AWR")
 
 
+# --------------------------------------------------------------------------
+# batch retrieval: get_many and sections
+# --------------------------------------------------------------------------
+
+
+def test_get_many_matches_get(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    endf_file = EndfFile(tape, parser=parser)
+    paths = ["#1/3/2", "#0/1/451/AWR", "#0/3/1", 1, "#1/3/2", "#0"]
+    results = endf_file.get_many(paths)
+    reference = EndfFile(tape, parser=parser)
+    assert dict(results[0]) == dict(reference.get("#1/3/2"))
+    assert results[1] == reference.get("#0/1/451/AWR")
+    assert dict(results[2]) == dict(reference.get("#0/3/1"))
+    assert results[3] is endf_file[1]
+    assert results[4]._target is results[0]._target  # parsed once
+    assert results[5] is endf_file[0]
+
+
+def test_get_many_coalesces_adjacent_reads(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU])
+    endf_file = EndfFile(tape, parser=parser)
+    mf3 = [f"#0/3/{mt}" for mf, mt in endf_file[0].sections() if mf == 3]
+    reads = []
+    read_bytes = endf_file._read_bytes
+
+    def counting_read(offset, length):
+        reads.append((offset, length))
+        return read_bytes(offset, length)
+
+    endf_file._read_bytes = counting_read
+    # requested out of order, the MF=3 sections are still adjacent on disk
+    results = endf_file.get_many(mf3[::-1])
+    assert len(reads) == 1
+    assert [r["MT"] for r in results] == [int(p.split("/")[-1]) for p in mf3[::-1]]
+
+
+def test_get_many_parallel(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    endf_file = EndfFile(tape, parser=parser)
+    paths = ["#0/3/1", "#1/3/1", "#0/1/451", "#1/3/2"]
+    serial = [dict(s) for s in EndfFile(tape, parser=parser).get_many(paths)]
+    assert [dict(s) for s in endf_file.get_many(paths, workers=2)] == serial
+
+
+def test_get_many_errors(tmp_path, parser):
+    tpid, body, tend = _body(CU)
+    lines = _corrupt_first_record([tpid] + body + [tend])
+    tape = tmp_path / "corrupt.endf"
+    tape.write_bytes(("\n".join(lines) + "\n").encode("latin-1"))
+    endf_file = EndfFile(tape, parser=parser, on_error="mark")
+    with pytest.raises(KeyError, match="MF=99/MT=99"):
+        endf_file.get_many(["#0/3/1", "#0/99/99"])
+    with pytest.raises(SectionParseError):
+        endf_file.get_many(["#0/3/1", "#0/1/451"])
+    with pytest.raises(TypeError):
+        endf_file.get_many([(0, 3, 1)])
+
+
+def test_sections_selector(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    endf_file = EndfFile(tape, parser=parser)
+    mf3 = endf_file.sections("3")
+    expected = [
+        (position, mf, mt)
+        for position in range(2)
+        for mf, mt in endf_file[position].sections()
+        if mf == 3
+    ]
+    assert list(mf3) == expected
+    key = expected[-1]
+    assert dict(mf3[key]) == dict(endf_file[key[0]][key[1:]])
+    assert list(endf_file.sections("*/451")) == [(0, 1, 451), (1, 1, 451)]
+    assert list(endf_file.sections("3/2")) == [(0, 3, 2), (1, 3, 2)]
+    assert endf_file.sections("3/*").keys() == mf3.keys()
+    with pytest.raises(ValueError, match="selector"):
+        endf_file.sections("3/2/1")
+    with pytest.raises(ValueError, match="selector"):
+        endf_file.sections("a")
+
+
+def test_sections_sees_edits_and_skips_failed(tmp_path, parser):
+    tpid, body, tend = _body(CU)
+    lines = _corrupt_first_record([tpid] + body + [tend])
+    tape = tmp_path / "corrupt.endf"
+    tape.write_bytes(("\n".join(lines) + "\n").encode("latin-1"))
+    endf_file = EndfFile(tape, parser=parser, on_error="mark")
+    assert endf_file.sections("1/451") == {}
+    section = endf_file[0][3, 2].detach()
+    section["AWR"] = 63.5
+    endf_file[0][3, 2] = section
+    assert endf_file.sections("3/2")[0, 3, 2]["AWR"] == 63.5
+
+
 # --------------------------------------------------------------------------
 # build_index
 # --------------------------------------------------------------------------
@@ -264,3 +364,207 @@ def test_query_invalid_arguments(tmp_path, parser):
         endf_file.query("1/451/AWR", 1.0, predicate=lambda v: True)
     with pytest.raises(ValueError, match="MF/MT"):
         endf_file.query("1", 1.0)
+
+
+def test_explain_query_plans(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    endf_file = EndfFile(tape, parser=parser)
+    plan = endf_file.explain("1/451/TEMP")
+    assert (plan.strategy, plan.records) == ("header", 4)
+    assert "first 4 record(s)" in str(plan)
+    assert endf_file.explain("3/102/QI").records == 2
+    assert endf_file.explain("1/451/DESCRIPTION").strategy == "parse"
+    assert endf_file.explain("4/2/LTT").strategy == "parse"
+    endf_file.build_index("1/451/TEMP", name="temp")
+    plan = endf_file.explain("1/451/TEMP")
+    assert (plan.strategy, plan.index_name) == ("index", "temp")
+    assert "'temp'" in str(plan)
+    # a composite index does not answer a single-field query
+    endf_file.build_index(["3/102/QI", "1/451/ZA"], name="qi_za")
+    assert endf_file.explain("3/102/QI").strategy == "header"
+
+
+@pytest.mark.parametrize(
+    "section_path", ["1/451/TEMP", "1/451/AWR", "1/451/LRP", "3/102/QI", "3/1/QM"]
+)
+def test_header_query_reads_without_parsing(tmp_path, parser, section_path):
+    tape = _write_tape(tmp_path, [CU, ZN, CU])
+    full = EndfFile(tape, parser=parser)
+    expected = [full.get(f"#{i}/{section_path}") for i in range(len(full))]
+    endf_file = EndfFile(tape, parser=parser)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("a header query must not parse")
+
+    endf_file.parser.parse = fail
+    seen = []
+    endf_file.query(section_path, predicate=seen.append)
+    assert seen == expected
+    assert [type(v) for v in seen] == [type(v) for v in expected]
+    result = endf_file.query(section_path, expected[1])
+    assert 1 in [m.position for m in result]
+
+
+def test_header_query_sees_edits(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    endf_file = EndfFile(tape, parser=parser)
+    endf_file["#1/1/451/TEMP"] = 300.0
+    result = endf_file.query("1/451/TEMP", 300.0)
+    assert [m.position for m in result] == [1]
+
+
+def test_index_query_does_not_read_sections(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN, CU])
+    endf_file = EndfFile(tape, parser=parser)
+    index = endf_file.build_index("1/451/NXC", name="nxc")
+    endf_file._read_span = endf_file.parser.parse = None
+    calls = []
+
+    def predicate(value):
+        calls.append(value)
+        return value == min(index)
+
+    result = endf_file.query("1/451/NXC", predicate=predicate)
+    assert [m.position for m in result] == sorted(index[min(index)])
+    assert sorted(calls) == sorted(index)
+
+
+def test_peek_header_fields(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    full = EndfFile(tape, parser=parser)
+    endf_file = EndfFile(tape, parser=parser)
+    for path in ("#1/1/451/TEMP", "#1/4/2/LTT", "#0/3/102/QI", "#0/2/151/NIS"):
+        assert endf_file.peek(path) == full.get(path)
+    # the peeked sections are not cached
+    assert len(endf_file._section_cache) == 0
+    head = endf_file.peek("#0/1/451", max_records=1)
+    assert "AWR" in head and "TEMP" not in head
+    with pytest.raises(KeyError):
+        endf_file.peek("#0/1/451/DESCRIPTION")
+    with pytest.raises(TypeError):
+        head["AWR"] = 1.0
+    # records spanning more lines than read at first are still complete
+    assert endf_file.peek("#0/3/1", max_records=2) == full.get("#0/3/1")
+    assert endf_file.peek("#0/4/2", max_records=10**6) == full.get("#0/4/2")
+
+
+def test_peek_edited_and_failed_sections(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU])
+    endf_file = EndfFile(tape, parser=parser)
+    endf_file["#0/1/451/TEMP"] = 600.0
+    assert endf_file.peek("#0/1/451/TEMP") == 600.0
+    with pytest.raises(ValueError, match="section or field"):
+        endf_file.peek("#0")
+    bad = tmp_path / "bad.endf"
+    bad.write_text("\n".join(_corrupt_first_record(tape.read_text().splitlines())))
+    with pytest.raises(SectionParseError):
+        EndfFile(bad, parser=parser).peek("#0/1/451/AWR")
+
+
+# --------------------------------------------------------------------------
+# persisted indexes
+# --------------------------------------------------------------------------
+
+
+def test_tape_index_save_and_load(tmp_path):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    index = TapeIndex.from_file(tape)
+    index.save(tmp_path / "tape.idx")
+    loaded = TapeIndex.load(tmp_path / "tape.idx")
+    assert loaded.materials == index.materials
+    assert loaded.tpid_line == index.tpid_line
+    assert loaded.matches_file(tape)
+    tape.write_bytes(tape.read_bytes() + b"\n")
+    with pytest.raises(StaleSourceError):
+        TapeIndex.load(tmp_path / "tape.idx")
+    assert TapeIndex.load(tmp_path / "tape.idx", verify=False).materials
+    (tmp_path / "bogus.idx").write_bytes(pickle.dumps({"not": "an index"}))
+    with pytest.raises(ValueError, match="not an endf-parserpy tape index"):
+        TapeIndex.load(tmp_path / "bogus.idx")
+
+
+def test_secondary_indexes_reloaded_without_parsing(tmp_path, parser, monkeypatch):
+    tape = _write_tape(tmp_path, [CU, ZN, CU])
+    index_file = tmp_path / "tape.idx"
+    endf_file = EndfFile(tape, parser=parser, index_file=index_file)
+    expected = {
+        "awr": endf_file.build_index("1/451/AWR", name="awr"),
+        "za_awr": endf_file.build_index(["1/451/ZA", "1/451/AWR"], name="za_awr"),
+    }
+    endf_file.save_index()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the tape must not be scanned or parsed")
+
+    monkeypatch.setattr(TapeIndex, "from_file", fail)
+    reopened = EndfFile(tape, parser=parser, index_file=index_file)
+    reopened.parser.parse = fail
+    assert reopened.secondary_indexes == expected
+    assert len(reopened) == 3
+
+
+def test_stale_index_file_is_ignored(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    index_file = tmp_path / "tape.idx"
+    endf_file = EndfFile(tape, parser=parser, index_file=index_file)
+    endf_file.build_index("1/451/AWR", name="awr")
+    endf_file.save_index()
+    os.utime(tape, ns=(0, 0))  # same content, different mtime
+    reopened = EndfFile(tape, parser=parser, index_file=index_file)
+    assert reopened.secondary_indexes == {}
+    assert len(reopened) == 2
+
+
+class _RunsCode:
+    def __reduce__(self):
+        return (exec, ("raise RuntimeError('index file code was run')",))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pickle.dumps(_RunsCode()),
+        b'{"format": "endf-parserpy tape index", "version": 1}',
+        b'{"format": "endf-parserpy tape index", "version": 2, "index": {}}',
+        b"\xff\xfe not an index",
+    ],
+)
+def test_unreadable_index_file_is_ignored(tmp_path, parser, content):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    index_file = tmp_path / "tape.idx"
+    index_file.write_bytes(content)
+    with pytest.raises(ValueError):
+        TapeIndex.load(index_file)
+    endf_file = EndfFile(tape, parser=parser, index_file=index_file)
+    assert endf_file.index.materials == TapeIndex.from_file(tape).materials
+    assert endf_file.secondary_indexes == {}
+    # saving replaces the unreadable file
+    endf_file.save_index()
+    assert TapeIndex.load(index_file).materials == endf_file.index.materials
+
+
+def test_saved_index_describes_tape_on_disk(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    endf_file = EndfFile(tape, parser=parser)
+    on_disk = endf_file.build_index("1/451/AWR", name="awr")
+    endf_file["#0/1/451/AWR"] = 99.5
+    del endf_file[1]
+    assert endf_file.secondary_indexes["awr"] == {99.5: [0]}
+    with pytest.raises(ValueError, match="no index file"):
+        endf_file.save_index()
+    endf_file.save_index(tmp_path / "tape.idx")
+    reopened = EndfFile(tape, parser=parser, index_file=tmp_path / "tape.idx")
+    assert reopened.secondary_indexes["awr"] == on_disk
+
+
+def test_pickle_keeps_secondary_indexes(tmp_path, parser):
+    tape = _write_tape(tmp_path, [CU, ZN])
+    endf_file = EndfFile(tape, parser=parser)
+    endf_file.build_index("1/451/ZA", name="za")
+    restored = pickle.loads(pickle.dumps(endf_file))
+    assert restored.secondary_indexes == endf_file.secondary_indexes
+    restored.reorder([1, 0])
+    assert restored.secondary_indexes["za"] == {
+        endf_file[1].za: [0],
+        endf_file[0].za: [1],
+    }